@@ -0,0 +1,113 @@
+"""
+Times the transform stage of the recipes in ./scripts.
+
+Unlike profiler.py the recipes are run against the fixtures in
+this repository rather than over http, and each is run several
+times with the best time kept, so the transform times of two
+commits can be compared directly.
+
+python performance/benchmark.py [repeats] [results csv]
+
+The results are appended to the given csv, by default
+tidychef_benchmark.csv in the system temporary directory.
+"""
+
+import csv
+import functools
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from profiler import SCRIPTS_DIR, get_git_commit, run_recipe_module
+
+REPO_ROOT = Path(__file__).parent.parent
+CSV_PATH = Path(tempfile.gettempdir()) / "tidychef_benchmark.csv"
+FIXTURES_URL = "https://raw.githubusercontent.com/mikeAdamss/tidychef/main/"
+
+
+def use_local_fixtures():
+    """
+    Point the http acquisition the recipes use at the same
+    files in this repository.
+    """
+    from tidychef import acquire
+
+    for reader in [acquire.csv, acquire.xls, acquire.xlsx]:
+
+        @functools.wraps(reader.local)
+        def local(source, *args, _local=reader.local, **kwargs):
+            return _local(REPO_ROOT / source.replace(FIXTURES_URL, ""), *args, **kwargs)
+
+        reader.http = local
+
+
+def benchmark_recipe(recipe_path: Path, repeats: int):
+    transform_times = []
+    for _ in range(repeats):
+        _, _, transform, observations = run_recipe_module(recipe_path)
+        transform_times.append(transform.total_seconds())
+
+    return {
+        "name": recipe_path.name,
+        "best": min(transform_times),
+        "mean": sum(transform_times) / len(transform_times),
+        "observations": observations - 1,  # Subtract 1 for the header row
+    }
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    csv_path = Path(sys.argv[2]).absolute() if len(sys.argv) > 2 else CSV_PATH
+    recipe_files = [x.absolute() for x in sorted(SCRIPTS_DIR.glob("*.py"))]
+    commit_hash = get_git_commit()
+    use_local_fixtures()
+
+    is_new = not csv_path.exists()
+    with csv_path.open("a", newline="") as f:
+        writer = csv.writer(f)
+        if is_new:
+            writer.writerow(
+                [
+                    "Date",
+                    "Commit",
+                    "Script",
+                    "Repeats",
+                    "Best Transform Time (s)",
+                    "Mean Transform Time (s)",
+                    "Observations Extracted",
+                ]
+            )
+
+        print(f"\nBenchmarking transforms, best of {repeats}...\n")
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            # The recipes write their output to the working directory.
+            os.chdir(tmp)
+            try:
+                for recipe_path in recipe_files:
+                    result = benchmark_recipe(recipe_path, repeats)
+                    print(
+                        f"{result['name']:<28}{result['best']:>10.4f}s"
+                        f"{result['observations']:>10} observations"
+                    )
+                    writer.writerow(
+                        [
+                            datetime.utcnow().isoformat(),
+                            commit_hash,
+                            result["name"],
+                            repeats,
+                            f"{result['best']:.4f}",
+                            f"{result['mean']:.4f}",
+                            result["observations"],
+                        ]
+                    )
+            finally:
+                os.chdir(cwd)
+
+    print("\nResults appended to", csv_path)
+
+
+if __name__ == "__main__":
+    main()
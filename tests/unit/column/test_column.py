@@ -86,3 +86,27 @@ def test_column_validation():
     col = Column(Constant("This", "foo"), validate=against.is_numeric)
     with pytest.raises(CellValidationError):
         col.resolve_column_cell_from_obs_cell(ob_cell)
+
+
+def test_resolving_column_values_from_many_observations():
+    """
+    Test that many observations can be resolved at once, with
+    _post_lookup() applied once per distinct column cell found.
+    """
+
+    data: Selectable = acquire.python.list_of_lists(
+        [["Male", "Male", "Female"], ["1", "2", "3"], ["4", "5", "6"]]
+    ).label_as("unused but required")
+
+    calls = []
+
+    def apply(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    column = Column(data.excel_ref("1").attach_directly(down), apply=apply)
+    ob_cells = (data - data.excel_ref("1")).cells
+    resolved = column.resolve_column_cells_from_obs_cells(ob_cells)
+
+    assert [x.value for x in resolved] == ["MALE", "MALE", "FEMALE"] * 2
+    assert calls == ["Male", "Female"]
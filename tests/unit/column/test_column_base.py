@@ -2,6 +2,7 @@ import pytest
 
 from tests.fixtures import fixture_simple_one_tab
 from tidychef.column.base import BaseColumn
+from tidychef.direction.directions import up
 from tidychef.lookup.engines.constant import Constant
 from tidychef.models.source.cell import VirtualCell
 from tidychef.selection.selectable import Selectable
@@ -39,3 +40,26 @@ def test_base_column_assertions():
 
     # Does not raise for incorrect arguments
     BaseColumn(Constant("I r a label", "foo"))
+
+
+def test_base_column_caches_lookups_by_engine_key(all_cells_from_a_tab: Selectable):
+    """
+    Test that lookups are cached against the key the engine provides,
+    counting the hits and misses.
+    """
+
+    headers = all_cells_from_a_tab.excel_ref("A1:A3").label_as("headers")
+    obs = all_cells_from_a_tab.excel_ref("B1:D3")
+
+    col = BaseColumn(headers.attach_closest(up))
+    resolved = col.resolve_column_cells_from_obs_cells(obs.cells)
+    assert [x._excel_ref() for x in resolved] == ["A1"] * 3 + ["A2"] * 3 + ["A3"] * 3
+    assert (col.cache_misses, col.cache_hits) == (3, 6)
+
+    assert col.resolve_column_cell_from_obs_cell(obs.cells[0])._excel_ref() == "A1"
+    assert (col.cache_misses, col.cache_hits) == (3, 7)
+
+    col = BaseColumn(Constant("This", "foo"))
+    for ob_cell in obs:
+        assert col.resolve_column_cell_from_obs_cell(ob_cell).value == "foo"
+    assert (col.cache_misses, col.cache_hits) == (1, 8)
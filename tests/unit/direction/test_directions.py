@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from tidychef.direction.directions import above, below, down, left, right, up
@@ -76,3 +78,15 @@ def test_offset_as_str():
     assert left(18).offset_as_str == "left(18)"
     assert down.offset_as_str == "down(1)"
     assert right(4).offset_as_str == "right(4)"
+
+
+def test_directions_can_be_pickled():
+    """
+    Test that directions, with and without an overwritten offset,
+    survive being pickled, as they must be to send lookup engines
+    to other processes.
+    """
+    for direction in [up, down, left, right, above, below, left(3), below(8)]:
+        unpickled = pickle.loads(pickle.dumps(direction))
+        assert unpickled == direction
+        assert unpickled._locked == direction._locked
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
@@ -6,6 +7,7 @@ import pytest
 
 from tests.fixtures import fixture_simple_one_tab
 from tests.unit.helpers import qcel
+from tidychef import acquire
 from tidychef.direction.directions import Direction, above, below, down, left, right, up
 from tidychef.exceptions import MissingLabelError
 from tidychef.lookup.engines.closest import Closest
@@ -173,3 +175,97 @@ def test_selectable_closest_wrapper_works(selectable_simple_table: Selectable):
     # Constructor should raise if called on an unlabelled selection
     with pytest.raises(MissingLabelError):
         selectable_simple_table.excel_ref("A1").attach_closest(down)
+
+
+@pytest.mark.parametrize("direction", [up, down, left, right])
+def test_closest_resolve_many_matches_resolve(
+    selectable_simple_table: Selectable, direction: Direction
+):
+    """
+    Test that resolving many observations at once resolves each
+    to the same cell as resolving them one at a time.
+    """
+    column_cells = ["B5", "G7", "L8", "J5", "H1", "R6", "Q2", "Z12"]
+    if direction.is_vertical:
+        column_cells = ["E2", "G7", "A8", "B12", "C16"]
+    selection = selectable_simple_table.excel_ref(column_cells[0])
+    for ref in column_cells[1:]:
+        selection = selection | selectable_simple_table.excel_ref(ref)
+
+    engine = Closest("", selection, direction)
+    if direction.is_upwards:
+        obs = selectable_simple_table.excel_ref("A2:Z40")
+    elif direction.is_downwards:
+        obs = selectable_simple_table.excel_ref("A1:Z16")
+    elif direction.is_left:
+        obs = selectable_simple_table.excel_ref("B1:Z40")
+    else:
+        obs = selectable_simple_table.excel_ref("A1:Z40")
+    obs_cells = list(reversed(obs.cells))
+
+    assert engine.resolve_many(obs_cells) == [engine.resolve(c) for c in obs_cells]
+
+
+def test_closest_many_breakpoints():
+    """
+    Test the closest engine resolves against thousands of header
+    breakpoints, both in reading order and out of it.
+    """
+    data = acquire.python.list_of_lists(
+        [[str(i), str(i)] for i in range(5000)]
+    ).label_as("many breakpoints")
+    headers = data.excel_ref("A1:A5000").filter(lambda c: c.y % 2 == 0)
+    obs = data.excel_ref("B1:B5000")
+
+    engine = Closest("", headers, up)
+    for cell in obs.cells:
+        assert engine.resolve(cell).y == cell.y - (cell.y % 2)
+    assert engine.cursor == len(headers) - 1
+
+    for cell in reversed(obs.cells):
+        assert engine.resolve(cell).y == cell.y - (cell.y % 2)
+    assert engine.cursor == 0
+
+
+def test_closest_resolves_from_many_threads():
+    """
+    Test the closest engine can resolve from many threads at once,
+    each with its own cursor.
+    """
+    data = acquire.python.list_of_lists(
+        [[str(i), str(i)] for i in range(2000)]
+    ).label_as("many breakpoints")
+    headers = data.excel_ref("A1:A2000").filter(lambda c: c.y % 3 == 0)
+    obs = data.excel_ref("B1:B2000").cells
+
+    engine = Closest("", headers, up)
+    streams = [obs, list(reversed(obs)), obs[::7], obs[1000:] + obs[:1000]]
+    with ThreadPoolExecutor(max_workers=len(streams)) as executor:
+        results = list(
+            executor.map(lambda cells: [engine.resolve(c) for c in cells], streams)
+        )
+
+    for cells, resolved in zip(streams, results):
+        assert [c.y for c in resolved] == [c.y - (c.y % 3) for c in cells]
+
+
+def test_closest_unresolvable(selectable_simple_table: Selectable):
+    """
+    Test that observations beyond the boundary of a closest lookup
+    are reported without raising.
+    """
+    headers = selectable_simple_table.excel_ref(
+        "A5"
+    ) | selectable_simple_table.excel_ref("A9")
+    obs = selectable_simple_table.excel_ref("B1:B12").cells
+
+    engine = Closest("", headers, up)
+    assert [x._excel_ref() for x in engine.unresolvable(obs)] == [
+        "B1",
+        "B2",
+        "B3",
+        "B4",
+    ]
+
+    engine = Closest("", headers, down)
+    assert [x._excel_ref() for x in engine.unresolvable(obs)] == ["B10", "B11", "B12"]
@@ -17,3 +17,16 @@ def test_constant_lookup_engine():
         assert constant_engine.resolve(case).value == "Some constant"
         assert constant_engine.resolve(case).value == "Some constant"
         assert constant_engine.resolve(case).value == "Some constant"
+
+
+def test_constant_lookup_engine_resolve_many():
+    """
+    Test that the constant lookup resolves many observations at once
+    """
+
+    constant_engine = Constant("", "Some constant")
+    cells = [Cell(x=1, y=3, value="foo"), Cell(x=2, y=2, value="bar")]
+    assert [x.value for x in constant_engine.resolve_many(cells)] == [
+        "Some constant",
+        "Some constant",
+    ]
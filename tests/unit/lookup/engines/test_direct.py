@@ -276,3 +276,111 @@ def test_directly_raises(selectable_vertical_dimensions: Selectable):
 
     with pytest.raises(MissingLabelError):
         Column(column_selection.attach_directly(up))
+
+
+@pytest.mark.parametrize("direction", [left, right])
+def test_direct_resolve_many_matches_resolve(
+    selectable_wide_band_tab: Selectable, direction
+):
+    """
+    Test that resolving many observations at once resolves each
+    to the same cell as resolving them one at a time.
+    """
+
+    dim = (
+        selectable_wide_band_tab.excel_ref("B4").expand(down).is_not_blank()
+        | selectable_wide_band_tab.excel_ref("H4").expand(down).is_not_blank()
+    )
+    engine = Directly("", dim, direction)
+
+    other_obs = "I4:K8" if direction is left else "A4:A8"
+    obs = selectable_wide_band_tab.excel_ref(
+        "C4:G8"
+    ) | selectable_wide_band_tab.excel_ref(other_obs)
+    obs_cells = [c for c in reversed(obs.cells) if engine._lookups.get(c.y)]
+    assert len(obs_cells) > 0
+
+    assert engine.resolve_many(obs_cells) == [engine.resolve(c) for c in obs_cells]
+
+
+def test_direct_resolve_many_raises_as_resolve(selectable_wide_band_tab: Selectable):
+    """
+    Test that resolving many observations at once raises where any
+    one of them cannot be resolved.
+    """
+
+    dim = selectable_wide_band_tab.excel_ref("H4").expand(down).is_not_blank()
+    engine = Directly("", dim, left)
+
+    with pytest.raises(FailedLookupError):
+        engine.resolve_many(
+            selectable_wide_band_tab.excel_ref("I4").cells
+            + selectable_wide_band_tab.excel_ref("C4").cells
+        )
+
+
+@pytest.mark.parametrize("direction", [left, right])
+def test_direct_precomputed_matches_walk(
+    selectable_wide_band_tab: Selectable, direction
+):
+    """
+    Test that resolving against precomputed answers gives the same
+    cells as walking the column cells.
+    """
+
+    dim = (
+        selectable_wide_band_tab.excel_ref("B4").expand(down).is_not_blank()
+        | selectable_wide_band_tab.excel_ref("H4").expand(down).is_not_blank()
+    )
+    precomputed = Directly("", dim, direction, precompute=True)
+    walked = Directly("", dim, direction)
+    assert walked._answers is None
+
+    for cell in selectable_wide_band_tab.excel_ref("A4:K7"):
+        try:
+            expected = walked.resolve(cell)
+        except FailedLookupError:
+            with pytest.raises(FailedLookupError):
+                precomputed.resolve(cell)
+            continue
+        assert precomputed.resolve(cell) is expected
+
+    observations = selectable_wide_band_tab.excel_ref("C4:F7").cells
+    assert precomputed.resolve_many(observations) == walked.resolve_many(observations)
+
+
+def test_direct_resolve_many_reports_every_failure(
+    selectable_wide_band_tab: Selectable,
+):
+    """
+    Test that resolving many observations at once reports every
+    observation that cannot be resolved in a single exception.
+    """
+
+    dim = selectable_wide_band_tab.excel_ref("H4").expand(down).is_not_blank()
+    engine = Directly("", dim, left)
+
+    with pytest.raises(FailedLookupError) as err:
+        engine.resolve_many(selectable_wide_band_tab.excel_ref("C4:D5").cells)
+    assert "The 4 observation cells in question are:" in str(err.value)
+    for ref in ["C4", "D4", "C5", "D5"]:
+        assert f"{ref}, x position" in str(err.value)
+
+
+def test_direct_broadcast_axis(selectable_wide_band_tab: Selectable):
+    """
+    Test that a direct lookup can be broadcast per column (vertical
+    lookups) or row (horizontal lookups) of a block only where none of
+    its column cells lie within that block.
+    """
+
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank()
+    assert Directly("", assets, up).broadcast_axis(2, 3, 6, 7) == "x"
+    assert Directly("", assets, up).broadcast_axis(2, 0, 6, 7) is None
+
+    dim = (
+        selectable_wide_band_tab.excel_ref("B4").expand(down).is_not_blank()
+        | selectable_wide_band_tab.excel_ref("H4").expand(down).is_not_blank()
+    )
+    assert Directly("", dim, left).broadcast_axis(2, 3, 6, 7) == "y"
+    assert Directly("", dim, left).broadcast_axis(2, 3, 10, 7) is None
@@ -59,3 +59,54 @@ def test_horizontal_conditional_header_error_raises():
     # But provide no columns at all.
     with pytest.raises(HorizontalConditionalHeaderError):
         column.resolve_column_cell_from_obs_cell("", {})
+
+
+def test_horizontal_conditional_depends_on():
+    """
+    Test that a horizontal conditional declaring the columns it
+    depends on is resolved once per distinct combination of their
+    values, reusing the same cell for each.
+    """
+
+    calls = []
+
+    def resolver(row):
+        calls.append(row)
+        return "both" if row["foo"] == row["bar"] else "different"
+
+    engine = HorizontalCondition("baz", resolver, depends_on=["foo", "bar"])
+
+    rows = [
+        {"foo": "1", "bar": "1", "other": "a"},
+        {"foo": "1", "bar": "2", "other": "b"},
+        {"foo": "1", "bar": "1", "other": "c"},
+        {"foo": "2", "bar": "2", "other": "d"},
+    ]
+    resolved = engine.resolve_many([None] * len(rows), rows)
+
+    assert [x.value for x in resolved] == ["both", "different", "both", "both"]
+    assert calls == [
+        {"foo": "1", "bar": "1"},
+        {"foo": "1", "bar": "2"},
+        {"foo": "2", "bar": "2"},
+    ]
+    assert resolved[0] is resolved[2] is resolved[3]
+
+
+def test_horizontal_conditional_depends_on_exceptions():
+    """
+    Test that a horizontal conditional raises where it reads a column
+    it does not depend on, or depends on a column not present.
+    """
+
+    with pytest.raises(HorizontalConditionalHeaderError):
+        engine = HorizontalCondition(
+            "", resolver=lambda x: x["foo"] + x["bar"], depends_on=["foo"]
+        )
+        engine.resolve("", {"foo": "fooval", "bar": "barval"})
+
+    with pytest.raises(HorizontalConditionalHeaderError):
+        engine = HorizontalCondition(
+            "", resolver=lambda x: x["foo"], depends_on=["baz"]
+        )
+        engine.resolve("", {"foo": "fooval"})
@@ -0,0 +1,134 @@
+import gc
+import os
+
+import pytest
+
+from tests.fixtures import fixture_wide_band_tab
+from tidychef.column.column import Column
+from tidychef.direction.directions import left
+from tidychef.exceptions import FailedLookupError, HorizontalConditionalHeaderError
+from tidychef.lookup.engines.direct import Directly
+from tidychef.lookup.engines.join import CodeList, Join
+from tidychef.output.tidydata import TidyData
+from tidychef.selection import filters
+from tidychef.selection.selectable import Selectable
+
+
+@pytest.fixture
+def code_list_csv(tmp_path):
+    path = tmp_path / "members.csv"
+    path.write_text(
+        "name,instrument\n"
+        "John,guitar\n"
+        "Paul,bass\n"
+        "George,guitar\n"
+        "Ringo,drums\n"
+        "Keith,guitar\n"
+        "Mick,vocals\n"
+        "Charlie,drums\n"
+        "Ronnie,guitar\n"
+    )
+    return path
+
+
+def test_code_list_from_csv_is_loaded_once(code_list_csv):
+    """
+    Test that a code list is loaded once and shared, with each
+    distinct value held as a single cell.
+    """
+
+    code_list = CodeList.from_csv(code_list_csv, "name", "instrument")
+    assert len(code_list) == 8
+    assert code_list.cells["John"] is code_list.cells["George"]
+
+    assert CodeList.from_csv(str(code_list_csv), "name", "instrument") is code_list
+    assert (
+        CodeList.from_csv(code_list_csv, "name", "instrument", reload=True)
+        is not code_list
+    )
+
+
+def test_code_list_from_csv_notices_changes_and_frees(code_list_csv):
+    """
+    Test that a shared code list is loaded again where its file
+    changes, and is not held once nothing is using it.
+    """
+    from tidychef.lookup.engines.join import _REGISTRY
+
+    code_list = CodeList.from_csv(code_list_csv, "name", "instrument")
+
+    with open(code_list_csv, "a") as f:
+        f.write("Bill,bass\n")
+    changed = CodeList.from_csv(code_list_csv, "name", "instrument")
+    assert changed is not code_list
+    assert changed.cells["Bill"].value == "bass"
+
+    # Same size, different modification time
+    stat = os.stat(code_list_csv)
+    os.utime(code_list_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    touched = CodeList.from_csv(code_list_csv, "name", "instrument")
+    assert touched is not changed
+
+    key = (str(code_list_csv.absolute()), "name", "instrument")
+    assert key in _REGISTRY
+    del code_list, changed, touched
+    gc.collect()
+    assert key not in _REGISTRY
+
+
+def test_join_resolves_shared_cells():
+    """
+    Test that a join resolves each row to the shared cell of the
+    code list, raising for missing keys unless given a default.
+    """
+
+    code_list = CodeList({"a": "apple", "b": "banana"})
+    engine = Join("fruit", code_list, on="letter")
+
+    resolved = engine.resolve_many(
+        [None] * 3, [{"letter": "a"}, {"letter": "b"}, {"letter": "a"}]
+    )
+    assert [x.value for x in resolved] == ["apple", "banana", "apple"]
+    assert resolved[0] is code_list.cells["a"]
+    assert engine.resolve(None, {"letter": "b"}) is code_list.cells["b"]
+
+    with pytest.raises(FailedLookupError):
+        engine.resolve_many([None], [{"letter": "c"}])
+
+    with pytest.raises(HorizontalConditionalHeaderError):
+        engine.resolve(None, {"not_letter": "a"})
+
+    engine = Join("fruit", code_list, on="letter", default="unknown")
+    assert engine.resolve(None, {"letter": "c"}).value == "unknown"
+
+
+def test_join_column_in_tidydata(code_list_csv):
+    """
+    Test that a join column populates tidy data from the values
+    resolved for another column.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = (
+        selectable_wide_band_tab.excel_ref("C4:F7")
+        .filter(filters.is_numeric)
+        .label_as("Value")
+    )
+    members = selectable_wide_band_tab.excel_ref("B4:B7")
+
+    tidy_data = TidyData(
+        observations,
+        Column(Directly("Member", members, left)),
+        Column.join(
+            "Instrument",
+            CodeList.from_csv(code_list_csv, "name", "instrument"),
+            on="Member",
+        ),
+    )
+
+    rows = tidy_data._data_as_table_of_strings()
+    assert rows[0] == ["Value", "Member", "Instrument"]
+    expected = {"John": "guitar", "Paul": "bass", "George": "guitar", "Ringo": "drums"}
+    assert len(rows) > 1
+    for _, member, instrument in rows[1:]:
+        assert expected[member] == instrument
@@ -5,6 +5,7 @@ from typing import Dict, List
 import pytest
 
 from tests.fixtures import fixture_simple_one_tab
+from tidychef import acquire
 from tidychef.direction.directions import above, below, down, left, right, up
 from tidychef.exceptions import (
     ImpossibleLookupError,
@@ -397,3 +398,90 @@ def test_selectable_within_wrapper_works(selectable_simple_table: Selectable):
         selectable_simple_table.excel_ref("A1").attach_within(
             up, left(1), right(1)
         )
+
+
+def test_within_resolve_many_matches_resolve(selectable_simple_table: Selectable):
+    """
+    Test that resolving many observations at once resolves each
+    to the same cell as resolving them one at a time.
+    """
+
+    ages = (
+        selectable_simple_table.excel_ref("B2")
+        | selectable_simple_table.excel_ref("F2")
+        | selectable_simple_table.excel_ref("D1")
+    )
+    engine = Within("", ages, above, start=left(1), end=right(1))
+
+    obs_cells = list(reversed(selectable_simple_table.excel_ref("A3:G10").cells))
+    assert engine.resolve_many(obs_cells) == [engine.resolve(c) for c in obs_cells]
+
+    with pytest.raises(ImpossibleLookupError):
+        engine.resolve_many(selectable_simple_table.excel_ref("A3:Z3").cells)
+
+
+def test_within_resolves_closest_of_many_header_rows():
+    """
+    Test that where header cells exist on many rows, a within lookup
+    resolves to the closest one in the direction of the lookup, with
+    ties going to the first in the direction of travel.
+
+       |  A   |  B   |  C   |  D   |
+    1  |  h   |  h   |  h   |  h   |
+    2  |      |  h   |  h   |      |
+    3  |      |      |      |  h   |
+    4  | ob   | ob   | ob   | ob   |
+    """
+
+    data = acquire.python.list_of_lists(
+        [
+            ["h", "h", "h", "h"],
+            ["", "h", "h", ""],
+            ["", "", "", "h"],
+            ["ob", "ob", "ob", "ob"],
+        ]
+    ).label_as("many header rows")
+    headers = data.excel_ref("A1:D3").is_not_blank()
+
+    engine = Within("", headers, above, start=left(1), end=right(1))
+    resolved = [engine.resolve(x)._excel_ref() for x in data.excel_ref("A4:D4")]
+    assert resolved == ["B2", "B2", "D3", "D3"]
+
+    engine = Within("", headers, above, start=right(1), end=left(1))
+    resolved = [engine.resolve(x)._excel_ref() for x in data.excel_ref("A4:D4")]
+    assert resolved == ["B2", "C2", "D3", "D3"]
+
+
+def test_within_unresolvable(selectable_simple_table: Selectable):
+    """
+    Test that observations a within lookup cannot be resolved
+    for are reported without raising.
+    """
+
+    ages = selectable_simple_table.excel_ref("B2") | selectable_simple_table.excel_ref(
+        "F2"
+    )
+    engine = Within("", ages, above, start=left(1), end=right(1))
+
+    obs = selectable_simple_table.excel_ref("A3:H3")
+    assert [x._excel_ref() for x in engine.unresolvable(obs.cells)] == ["D3", "H3"]
+
+
+def test_within_broadcast_axis(selectable_simple_table: Selectable):
+    """
+    Test that a within lookup can be broadcast per column of a block
+    only where none of its column cells lie within the block along the
+    direction of the lookup.
+    """
+
+    ages = selectable_simple_table.excel_ref("B2") | selectable_simple_table.excel_ref(
+        "F2"
+    )
+    engine = Within("", ages, above, start=left(1), end=right(1))
+
+    assert engine.broadcast_axis(0, 2, 6, 4) == "x"
+    assert engine.broadcast_axis(0, 0, 6, 4) is None
+
+    engine = Within("", ages, left, start=above(1), end=below(1))
+    assert engine.broadcast_axis(6, 0, 8, 4) == "y"
+    assert engine.broadcast_axis(0, 0, 8, 4) is None
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from tests.fixtures import fixture_with_blanks
@@ -146,3 +148,29 @@ def test_virt_cell_repr():
     """
     vcell = VirtualCell(value="foo")
     assert str(vcell) == '(VIRTUAL CELL, value:"foo")'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires slotted dataclasses")
+def test_cells_are_slotted():
+    """
+    Confirm that cells do not carry a per instance __dict__.
+    """
+
+    cell = Cell(x=0, y=0, value="foo")
+    assert not hasattr(cell, "__dict__")
+    assert not hasattr(VirtualCell(value="foo"), "__dict__")
+
+
+def test_cell_values_are_interned():
+    """
+    Confirm that cells holding equal string values share one string.
+    """
+
+    value1 = "".join(["some ", "repeated ", "label"])
+    value2 = "".join(["some ", "repeated ", "label"])
+    assert value1 is not value2
+
+    cell1 = Cell(x=0, y=0, value=value1)
+    cell2 = Cell(x=1, y=0, value=value2)
+    assert cell1.value is cell2.value
+    assert cell1._original_value == "some repeated label"
@@ -284,3 +284,13 @@ class TestCellFormattingErrorHandling:
         for i, cell_format in enumerate(instances):
             with pytest.raises(CellFormattingError):
                 cell_format.is_bold()
+
+    def test_interned_cellformatting_is_shared(self):
+        """Test that equal interned formatting returns the one shared instance."""
+        format1 = CellFormatting.interned(bold=True, indent_level=2)
+        format2 = CellFormatting.interned(bold=True, indent_level=2)
+        format3 = CellFormatting.interned(bold=False, indent_level=2)
+
+        assert format1 is format2
+        assert format1 is not format3
+        assert format1 == CellFormatting(bold=True, indent_level=2)
@@ -0,0 +1,136 @@
+import pytest
+
+from tidychef.models.source.cell import Cell
+from tidychef.models.source.table import Table
+
+
+def build_table(coordinates) -> Table:
+    """
+    Build and index a table with a cell at each of the coordinates
+    provided, with values of the form "x-y".
+    """
+    table = Table()
+    for x, y in coordinates:
+        table.add_cell(Cell(x=x, y=y, value=f"{x}-{y}"))
+    table.build_index()
+    return table
+
+
+@pytest.fixture
+def dense_table():
+    return build_table([(x, y) for y in range(4) for x in range(5)])
+
+
+@pytest.fixture
+def sparse_table():
+    return build_table([(0, 0), (9, 0), (3, 5), (0, 9), (9, 9)])
+
+
+def values(cells):
+    return [c.value for c in cells]
+
+
+def test_grid_density(dense_table: Table, sparse_table: Table):
+    """
+    Test that a fully populated table gets a dense grid and a
+    sparsely populated one does not.
+    """
+    assert dense_table.grid.is_dense
+    assert not sparse_table.grid.is_dense
+
+
+def test_cell_at(dense_table: Table, sparse_table: Table):
+    """
+    Test we can get a cell from its coordinates and get None
+    for coordinates with no cell.
+    """
+    assert dense_table.cell_at(3, 2).value == "3-2"
+    assert dense_table.cell_at(5, 2) is None
+    assert dense_table.cell_at(-1, 0) is None
+
+    assert sparse_table.cell_at(3, 5).value == "3-5"
+    assert sparse_table.cell_at(3, 4) is None
+    assert sparse_table.cell_at(30, 40) is None
+
+
+def test_rows_and_columns(dense_table: Table, sparse_table: Table):
+    """
+    Test we can get whole rows and columns of cells in order.
+    """
+    assert values(dense_table.cells_on_row(1)) == ["0-1", "1-1", "2-1", "3-1", "4-1"]
+    assert values(dense_table.cells_on_column(2)) == ["2-0", "2-1", "2-2", "2-3"]
+    assert dense_table.cells_on_row(10) == []
+    assert dense_table.cells_on_column(10) == []
+
+    assert values(sparse_table.cells_on_row(9)) == ["0-9", "9-9"]
+    assert values(sparse_table.cells_on_column(9)) == ["9-0", "9-9"]
+    assert sparse_table.cells_on_row(4) == []
+
+
+def test_rectangles(dense_table: Table, sparse_table: Table):
+    """
+    Test we can get a rectangle of cells in row major order, with
+    rectangles extending beyond the table being clipped to it.
+    """
+    assert values(dense_table.cells_in_rectangle(1, 1, 2, 2)) == [
+        "1-1",
+        "2-1",
+        "1-2",
+        "2-2",
+    ]
+    assert values(dense_table.cells_in_rectangle(3, 2, 99, 99)) == [
+        "3-2",
+        "4-2",
+        "3-3",
+        "4-3",
+    ]
+    assert dense_table.cells_in_rectangle(10, 10, 20, 20) == []
+
+    assert values(sparse_table.cells_in_rectangle(0, 0, 5, 9)) == ["0-0", "3-5", "0-9"]
+
+
+def test_neighbours_are_derived_from_the_grid(dense_table: Table):
+    """
+    Test that the neighbours of a cell come from the grid of the
+    table it belongs to.
+    """
+    cell = dense_table.cell_at(0, 0)
+    assert cell._table is dense_table
+    assert cell._neighbour_right.value == "1-0"
+    assert cell._neighbour_down.value == "0-1"
+    assert cell._neighbour_up is None
+    assert cell._neighbour_left is None
+
+    # A cell that belongs to no table has no neighbours
+    assert Cell(x=1, y=1, value="foo")._neighbour_up is None
+
+
+def test_index_is_built_once(dense_table: Table):
+    """
+    Test that indexing an already indexed table is a no-op.
+    """
+    grid = dense_table.grid
+    dense_table.build_index()
+    assert dense_table.grid is grid
+
+
+def test_build_neighbor_graph_still_indexes_table():
+    """
+    Test that build_neighbor_graph, kept as an alias of build_index,
+    still gives every cell its neighbours.
+    """
+    table = Table()
+    for y in range(3):
+        for x in range(3):
+            table.add_cell(Cell(x=x, y=y, value=f"{x}-{y}"))
+    assert not table.has_neighbours
+
+    table.build_neighbor_graph()
+    assert table.has_neighbours
+    assert table.indexed
+
+    middle = table.cells[4]
+    assert middle._neighbour_up.value == "1-0"
+    assert middle._neighbour_down.value == "1-2"
+    assert middle._neighbour_left.value == "0-1"
+    assert middle._neighbour_right.value == "2-1"
@@ -91,3 +91,90 @@ def test_union_operator_raises_for_unaligned_tables(
 
     with pytest.raises(UnalignedTableOperation):
         selectable_simple1 | selectable_simple2
+
+
+def test_intersection_operator(selectable_simple1: Selectable):
+    """
+    Test we can create an intersection of cells from a table selection
+    with another selection taken from the same table.
+    """
+
+    two_rows = selectable_simple1.excel_ref("A1:Z2")
+    columns = selectable_simple1.excel_ref("C1:D4")
+
+    intersection = two_rows & columns
+    assert len(intersection.cells) == 4
+    assert dfc.basecells_to_excel_ref(intersection.cells) == "C1:D2"
+
+    # Neither original selection is changed
+    assert len(two_rows.cells) == 52
+    assert len(columns.cells) == 8
+
+
+def test_symmetric_difference_operator(selectable_simple1: Selectable):
+    """
+    Test we can create a symmetric difference of cells from a table
+    selection with another selection taken from the same table.
+    """
+
+    top = selectable_simple1.excel_ref("A1:B2")
+    bottom = selectable_simple1.excel_ref("A2:B3")
+
+    difference = top ^ bottom
+    assert len(difference) == 4
+    assert dfc.basecells_to_excel_ref(difference.excel_ref("A1:B1").cells) == "A1:B1"
+    assert dfc.basecells_to_excel_ref(difference.excel_ref("A3:B3").cells) == "A3:B3"
+
+
+def test_operators_can_be_chained(selectable_simple1: Selectable):
+    """
+    Test that the results of bitset operations can be used in
+    further selection operations.
+    """
+
+    block = selectable_simple1.excel_ref("A1:C3")
+    centre = selectable_simple1.excel_ref("B2")
+
+    ring = block - centre
+    assert len(ring) == 8
+    assert len((ring | centre).cells) == 9
+    assert len((ring & centre).cells) == 0
+    assert len((ring ^ block).cells) == 1
+    assert (ring ^ block).lone_value() == centre.lone_value()
+
+
+@pytest.mark.parametrize("operator", ["__and__", "__xor__"])
+def test_new_operators_raise_for_unaligned_tables(
+    selectable_simple1: Selectable, selectable_simple2: Selectable, operator: str
+):
+    """
+    Test that a a suitable error is raised if we try and intersect or
+    symmetrically difference selections taken from different tables.
+    """
+
+    with pytest.raises(UnalignedTableOperation):
+        getattr(selectable_simple1, operator)(selectable_simple2)
+
+
+def test_operators_keep_the_order_of_the_cells(selectable_simple1: Selectable):
+    """
+    Test that the operators keep the order of the cells of the
+    left hand selection, followed by any cells only in the right
+    hand selection in their order, rather than cell id order.
+    """
+
+    def refs(selection: Selectable):
+        return [x._excel_ref() for x in selection.cells]
+
+    top_row = selectable_simple1.excel_ref("A1:C1")
+    bottom_row = selectable_simple1.excel_ref("A2:C2")
+
+    recombined = bottom_row | top_row
+    assert refs(recombined) == ["A2", "B2", "C2", "A1", "B1", "C1"]
+
+    column_b = selectable_simple1.excel_ref("B1:B2")
+    column_c = selectable_simple1.excel_ref("C1:C3")
+    assert refs(recombined - column_b) == ["A2", "C2", "A1", "C1"]
+    assert refs(recombined & column_c) == ["C2", "C1"]
+    assert refs(recombined ^ column_c) == ["A2", "B2", "A1", "B1", "C3"]
+    assert refs(recombined ^ bottom_row) == ["A1", "B1", "C1"]
@@ -1,6 +1,10 @@
+import copy
+
 import pytest
 
 from tests.fixtures import fixture_simple_one_tab
+from tidychef.models.source.cell import Cell
+from tidychef.models.source.table import Table
 from tidychef.selection.selectable import Selectable
 
 
@@ -25,3 +29,70 @@ def test_tables_have_expected_length(selectable_simple1: Selectable):
     """
 
     assert len(selectable_simple1) == 2600
+
+
+def test_livetable_shares_pristine_cells_by_default(selectable_simple1: Selectable):
+    """
+    Test that by default the filtered cells of a live table are the
+    very same cell objects as the pristine cells.
+    """
+
+    assert selectable_simple1.cells is not selectable_simple1.pcells
+    assert all(
+        c1 is c2 for c1, c2 in zip(selectable_simple1.cells, selectable_simple1.pcells)
+    )
+
+    # Selections derived from the table keep sharing the same cells
+    selection = selectable_simple1.excel_ref("B2")
+    assert selection.cells[0] is selectable_simple1.pcells[27]
+    assert selection.pristine is selectable_simple1.pristine
+
+
+def test_livetable_can_deep_copy_pristine_cells():
+    """
+    Test that where requested, the filtered cells of a live table
+    are built from a deep copy of the pristine cells.
+    """
+
+    table = Table()
+    for y in range(3):
+        for x in range(3):
+            table.add_cell(Cell(x=x, y=y, value=f"{x}-{y}"))
+
+    selectable = Selectable(table, share_pristine=False)
+    assert selectable.cells == selectable.pcells
+    assert all(c1 is not c2 for c1, c2 in zip(selectable.cells, selectable.pcells))
+    assert selectable.cells[4]._neighbour_up is selectable.cells[1]
+    assert selectable.pcells[4]._neighbour_up is selectable.pcells[1]
+
+
+def test_table_mask_follows_changes_to_held_cells(selectable_simple1: Selectable):
+    """
+    Test that the bitset of the cells held by a table is rebuilt
+    whenever the cells held change, including where the number of
+    cells held does not.
+    """
+
+    table = selectable_simple1.excel_ref("A1:C1").filtered
+    a1, b1, c1 = table.cells
+    d1 = selectable_simple1.excel_ref("D1").cells[0]
+    assert table.mask == 0b111
+
+    # Replacing a cell in place
+    table.cells[1] = d1
+    assert table.mask == 0b1101
+
+    # Swapping in another list of the same length
+    table.cells = [a1, b1, c1]
+    assert table.mask == 0b111
+
+    # Adding a cell
+    table.add_cell(d1)
+    assert table.mask == 0b1111
+
+    # A copy keeps the bitset until its own cells change
+    copied = copy.copy(table)
+    assert copied.mask == 0b1111
+    copied.cells.remove(b1)
+    assert copied.mask == 0b1101
+    assert table.mask == 0b1111
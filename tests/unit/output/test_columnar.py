@@ -0,0 +1,81 @@
+import copy
+
+from tidychef.models.source.cell import Cell, VirtualCell
+from tidychef.output.columnar import ColumnarData
+
+
+def columnar_data() -> ColumnarData:
+    """
+    Three rows of a value column and a dimension column,
+    the dimension using two distinct cells.
+    """
+    data = ColumnarData([VirtualCell(value="Value"), VirtualCell(value="Dimension")])
+    male, female = Cell(x=0, y=0, value="Male"), Cell(x=0, y=1, value="Female")
+    data.append_columns(
+        [
+            [Cell(x=1, y=0, value="1"), Cell(x=1, y=1, value="2")],
+            [male, female],
+        ],
+        2,
+    )
+    data.append_columns([[Cell(x=2, y=0, value="3")], [copy.copy(male)]], 1)
+    return data
+
+
+def test_columnar_data_encodes_each_distinct_cell_once():
+    """
+    Test that equal cells of a column share a single entry in the
+    dictionary of that column, with their provenance.
+    """
+    data = columnar_data()
+
+    assert len(data) == 4
+    assert len(data.cells[0]) == 3
+    assert [(x.value, x.x, x.y) for x in data.cells[1]] == [
+        ("Male", 0, 0),
+        ("Female", 0, 1),
+    ]
+    assert list(data.codes[1]) == [0, 1, 0]
+
+
+def test_columnar_data_behaves_as_rows():
+    """
+    Test that ColumnarData can be used as the list of rows,
+    header row first, that it represents.
+    """
+    data = columnar_data()
+
+    rows = [[x.value for x in row] for row in data]
+    assert rows == [
+        ["Value", "Dimension"],
+        ["1", "Male"],
+        ["2", "Female"],
+        ["3", "Male"],
+    ]
+    assert list(data.value_rows()) == rows
+    assert [x.value for x in data[-1]] == ["3", "Male"]
+    assert [[x.value for x in row] for row in data[1:]] == rows[1:]
+    assert data.to_dict() == {
+        "Value": ["1", "2", "3"],
+        "Dimension": ["Male", "Female", "Male"],
+    }
+
+
+def test_columnar_data_extend_and_drop_duplicates():
+    """
+    Test that extending ColumnarData with itself merges the
+    dictionaries, and that the duplicate rows can then be dropped.
+    """
+    data = columnar_data()
+    data.extend(columnar_data())
+
+    assert len(data) == 7
+    assert len(data.cells[1]) == 2
+
+    duplicates = data.drop_duplicates()
+    assert [[x.value for x in data.decode(codes)] for codes in duplicates] == [
+        ["1", "Male"],
+        ["2", "Female"],
+        ["3", "Male"],
+    ]
+    assert list(data.value_rows()) == list(columnar_data().value_rows())
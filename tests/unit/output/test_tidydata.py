@@ -1,6 +1,9 @@
 import copy
+import csv
 import json
+import multiprocessing
 import os
+import pickle
 import uuid
 from pathlib import Path
 
@@ -11,10 +14,17 @@ from tests.fixtures.helpers import path_to_fixture
 from tests.unit.helpers import assert_csvs_match
 from tidychef.column import Column
 from tidychef.direction.directions import above, below, left, right
-from tidychef.exceptions import DroppingNonColumnError, MisalignedHeadersError
+from tidychef.exceptions import (
+    DroppingNonColumnError,
+    DuplicateKeyColumnError,
+    LookupCheckError,
+    MisalignedHeadersError,
+)
 from tidychef.lookup.engines.constant import Constant
 from tidychef.lookup.engines.direct import Directly
+from tidychef.output.columnar import ColumnarData
 from tidychef.output.tidydata import TidyData
+from tidychef.output.workers import _pack
 from tidychef.selection import filters
 from tidychef.selection.selectable import Selectable
 
@@ -456,4 +466,477 @@ def test_add_column_after_transform_raises(tidy: TidyData):
     tidy2 = copy.deepcopy(tidy)
     tidy2._transform()
     with pytest.raises(AssertionError):
-        tidy2.add_column(Column.constant("NewColumn", "NewValue"))
\ No newline at end of file
+        tidy2.add_column(Column.constant("NewColumn", "NewValue"))
+
+def test_condition_column_depends_on_matches_undeclared():
+    """
+    Test condition columns declaring the columns they depend on
+    resolve the same tidy data as those that do not.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.excel_ref("B4:K6").filter(
+        filters.is_numeric
+    )
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank()
+    member = (
+        selectable_wide_band_tab.excel_ref("4:7")
+        .is_not_blank()
+        .filter(filters.is_not_numeric)
+    )
+
+    def tidy_data_as_strings(depends_on=None):
+        return TidyData(
+            observations.label_as("Value"),
+            Column(Directly("Assets", assets, above)),
+            Column(Directly("Member", member, left)),
+            Column.horizontal_condition(
+                "Condition",
+                lambda col: col["Member"] + " " + col["Assets"],
+                depends_on=depends_on,
+            ),
+        )._data_as_table_of_strings()
+
+    assert tidy_data_as_strings() == tidy_data_as_strings(["Member", "Assets"])
+
+
+@pytest.mark.parametrize("threads", [2, 3, 50])
+def test_tidydata_threaded_transform(threads: int):
+    """
+    Test that resolving the columns from many threads creates the
+    same tidy data as resolving them from one.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.filter(filters.is_numeric).label_as(
+        "Observation"
+    )
+    bands = (
+        selectable_wide_band_tab.excel_ref("A3")
+        | selectable_wide_band_tab.excel_ref("G3")
+    ).label_as("Band")
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank().label_as("Asset")
+    members = (
+        (
+            selectable_wide_band_tab.excel_ref("B")
+            | selectable_wide_band_tab.excel_ref("H")
+        )
+        .is_not_blank()
+        .label_as("Member")
+    )
+
+    def tidy_data(threads: int) -> TidyData:
+        return TidyData(
+            observations,
+            Column(bands.attach_closest(right), apply=lambda x: x.upper()),
+            Column(assets.attach_directly(below)),
+            Column(members.attach_directly(right)),
+            Column.horizontal_condition(
+                "Condition",
+                lambda col: col["Band"] + " " + col["Member"],
+                depends_on=["Band", "Member"],
+            ),
+            threads=threads,
+        )
+
+    assert (
+        tidy_data(threads)._data_as_table_of_strings()
+        == tidy_data(1)._data_as_table_of_strings()
+    )
+
+
+def test_tidydata_check():
+    """
+    Test that checking the lookups of a TidyData reports every
+    observation that cannot be resolved, per column, at once.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.excel_ref("B4:K6").filter(
+        filters.is_numeric
+    )
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank()
+    member = (
+        selectable_wide_band_tab.excel_ref("4:7")
+        .is_not_blank()
+        .filter(filters.is_not_numeric)
+    )
+
+    tidy_data = TidyData(
+        observations.label_as("Value"),
+        Column(Constant("Genre", "Rock & Roll")),
+        Column(Directly("Assets", assets, above)),
+        Column(Directly("Member", member, left)),
+    )
+    assert tidy_data.check() is tidy_data
+    assert tidy_data._data is None
+
+    late_member = member.excel_ref("H4:H7").label_as("Late Member")
+    tidy_data = TidyData(
+        observations.label_as("Value"),
+        Column(Directly("Late Member", late_member, left)),
+        Column(Directly("Assets", assets, above)),
+    )
+    with pytest.raises(LookupCheckError) as err:
+        tidy_data.check()
+
+    assert list(err.value.failures.keys()) == ["Late Member"]
+    expected = [c for c in observations.cells if c.x < 7]
+    assert err.value.failures["Late Member"] == expected
+    assert f"cannot be resolved for {len(expected)} observation(s)" in str(err.value)
+
+
+def test_tidydata_broadcast_transform():
+    """
+    Test that broadcasting lookups across a block of observations
+    creates the same tidy data as resolving every observation, while
+    only resolving one observation per column or row of the block.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.excel_ref("C4:E7").label_as("Value")
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank()
+    member = selectable_wide_band_tab.excel_ref("B4:B7").is_not_blank()
+
+    def tidy_data(broadcast: bool) -> TidyData:
+        return TidyData(
+            observations,
+            Column(Directly("Assets", assets, above)),
+            Column(Directly("Member", member, left)),
+            broadcast=broadcast,
+        )
+
+    broadcast = tidy_data(True)
+    resolved = []
+    for column in broadcast.columns:
+        resolve_many = column.engine.resolve_many
+
+        def counted_resolve_many(cells, *args, resolve_many=resolve_many):
+            resolved.append(len(cells))
+            return resolve_many(cells, *args)
+
+        column.engine.resolve_many = counted_resolve_many
+
+    assert (
+        broadcast._data_as_table_of_strings()
+        == tidy_data(False)._data_as_table_of_strings()
+    )
+    assert resolved == [3, 4]
+
+
+def test_tidydata_row_plan_orders_and_drops_columns():
+    """
+    Test that horizontal conditions, though resolved last, are output
+    in the position they were declared, and that dropped columns
+    (including the observations) are still available to them.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.excel_ref("C4:E7").label_as("Value")
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank()
+    member = selectable_wide_band_tab.excel_ref("B4:B7").is_not_blank()
+
+    tidy_data = TidyData(
+        observations,
+        Column.horizontal_condition("Late", lambda col: col["Early"] + "!", priority=1),
+        Column.horizontal_condition(
+            "Early", lambda col: col["Member"] + " " + col["Value"]
+        ),
+        Column(Directly("Assets", assets, above)),
+        Column(Directly("Member", member, left)),
+        drop=["Value", "Member"],
+    )
+
+    rows = tidy_data._data_as_table_of_strings()
+    assert rows[0] == ["Late", "Early", "Assets"]
+    for row, observation in zip(rows[1:], observations.cells):
+        assert row[0] == row[1] + "!"
+        assert row[1].endswith(" " + observation.value)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10000])
+def test_tidydata_iter_rows(tidy: TidyData, chunk_size: int):
+    """
+    Test that iterating the rows of a TidyData gives the same rows
+    as transforming it, without keeping them.
+    """
+    streamed = [[x.value for x in row] for row in tidy.iter_rows(chunk_size)]
+    assert tidy._data is None
+
+    assert streamed == tidy._data_as_table_of_strings()
+    assert [[x.value for x in row] for row in tidy.iter_rows()] == streamed
+
+
+def test_tidydata_to_csv_streams_unless_kept(tidy: TidyData):
+    """
+    Test that writing to csv does not keep the tidy data unless
+    asked to.
+    """
+    output_path = Path(__file__).parent / f"{uuid.uuid4()}.csv"
+    tidy.to_csv(output_path)
+    assert tidy._data is None
+    assert_csvs_match(output_path, path_to_fixture("csv", "test_output.csv"))
+
+    tidy.to_csv(output_path, keep=True)
+    assert tidy._data is not None
+    assert_csvs_match(output_path, path_to_fixture("csv", "test_output.csv"))
+
+
+def test_tidydata_columnar_matches_rows(tidy: TidyData):
+    """
+    Test that TidyData held as columnar data outputs the same tidy
+    data as when held as rows, including when added together and
+    with duplicates dropped.
+    """
+    columnar = copy.deepcopy(tidy)
+    columnar.columnar = True
+    columnar._transform()
+    assert isinstance(columnar._data, ColumnarData)
+
+    assert columnar._data_as_table_of_strings() == tidy._data_as_table_of_strings()
+    assert columnar.to_dict() == tidy.to_dict()
+
+    output_path = Path(__file__).parent / f"{uuid.uuid4()}.csv"
+    columnar.to_csv(output_path)
+    assert_csvs_match(output_path, path_to_fixture("csv", "test_output.csv"))
+
+    big_columnar = TidyData.from_tidy(columnar, tidy)
+    big_tidy = TidyData.from_tidy(tidy, tidy)
+    assert len(big_columnar) == len(big_tidy) == 37
+    assert (
+        big_columnar._data_as_table_of_strings() == big_tidy._data_as_table_of_strings()
+    )
+
+    assert (
+        big_columnar.drop_duplicates()._data_as_table_of_strings()
+        == big_tidy.drop_duplicates()._data_as_table_of_strings()
+        == tidy._data_as_table_of_strings()
+    )
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_drop_duplicates_by_value_and_keys(tidy: TidyData, columnar: bool):
+    """
+    Test that drop_duplicates compares the values of rows, optionally
+    only those of key columns, keeping the first of each duplicate.
+    """
+    tidy.columnar = columnar
+    expected = tidy._data_as_table_of_strings()
+
+    # The same values, from a different position
+    moved_cell = copy.copy(tidy._data[1][0])
+    moved_cell.x += 100
+    tidy2 = TidyData.from_tidy(tidy, copy.deepcopy(tidy))
+    if columnar:
+        tidy2._data.extend([tidy2._data[0], [moved_cell] + tidy2._data[1][1:]])
+    else:
+        tidy2._data.append([moved_cell] + tidy2._data[1][1:])
+
+    assert tidy2.drop_duplicates()._data_as_table_of_strings() == expected
+
+    by_member = tidy2.drop_duplicates(keys=["Member"])._data_as_table_of_strings()
+    members = [row[3] for row in expected[1:]]
+    assert by_member == [expected[0]] + [
+        row for i, row in enumerate(expected[1:]) if row[3] not in members[:i]
+    ]
+
+    with pytest.raises(DuplicateKeyColumnError):
+        tidy2.drop_duplicates(keys=["Not A Column"])
+
+
+def test_iter_rows_unique(tidy: TidyData):
+    """
+    Test that streaming the unique rows, including to csv, gives the
+    same rows as dropping duplicates.
+    """
+    big_tidy = TidyData.from_tidy(tidy, tidy)
+    big_tidy.columnar = True
+
+    for keys in [None, ["Assets", "Member"]]:
+        streamed = [
+            [x.value for x in row] for row in big_tidy.iter_rows(unique=True, keys=keys)
+        ]
+        assert (
+            streamed
+            == copy.deepcopy(big_tidy)
+            .drop_duplicates(keys=keys)
+            ._data_as_table_of_strings()
+        )
+
+    output_path = Path(__file__).parent / f"{uuid.uuid4()}.csv"
+    big_tidy.to_csv(output_path, drop_duplicates=True)
+    assert_csvs_match(output_path, path_to_fixture("csv", "test_output.csv"))
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_tidydata_from_tidy_list_leaves_sources_unchanged(
+    tidy: TidyData, columnar: bool
+):
+    """
+    Test that joining many TidyData objects creates one holding all
+    of their rows, without changing any of them.
+    """
+    tidy.columnar = columnar
+    rows = tidy._data_as_table_of_strings()
+
+    big_tidy = TidyData.from_tidy_list([tidy] * 200)
+    assert big_tidy._data_as_table_of_strings() == rows + rows[1:] * 199
+    assert tidy._data_as_table_of_strings() == rows
+
+    bigger_tidy = big_tidy + tidy
+    assert len(bigger_tidy) == len(big_tidy) + len(rows) - 1
+    assert len(big_tidy) == 1 + 200 * (len(rows) - 1)
+
+
+def test_tidydata_write_many(tidy: TidyData):
+    """
+    Test that many TidyData objects can be written to a single csv
+    without being kept, and that misaligned headers are raised before
+    anything is written.
+    """
+    output_path = Path(__file__).parent / f"{uuid.uuid4()}.csv"
+    tidy_data_objects = [copy.deepcopy(tidy) for _ in range(3)]
+    TidyData.write_many(output_path, tidy_data_objects)
+
+    assert all(x._data is None for x in tidy_data_objects)
+
+    with open(output_path) as f:
+        written = list(csv.reader(f))
+    rows = TidyData.from_tidy_list(tidy_data_objects)._data_as_table_of_strings()
+    assert written == rows
+    output_path.unlink()
+
+    misaligned = copy.deepcopy(tidy)
+    misaligned.drop = ["Genre"]
+    with pytest.raises(MisalignedHeadersError):
+        TidyData.write_many(output_path, [tidy, misaligned])
+    assert not output_path.exists()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="The platform cannot fork processes",
+)
+@pytest.mark.parametrize("workers", [2, 3])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_tidydata_multiprocess_transform(workers: int, columnar: bool):
+    """
+    Test that resolving the columns in many forked processes creates
+    the same tidy data as resolving them in one.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.filter(filters.is_numeric).label_as(
+        "Observation"
+    )
+    bands = (
+        selectable_wide_band_tab.excel_ref("A3")
+        | selectable_wide_band_tab.excel_ref("G3")
+    ).label_as("Band")
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank().label_as("Asset")
+    members = (
+        (
+            selectable_wide_band_tab.excel_ref("B")
+            | selectable_wide_band_tab.excel_ref("H")
+        )
+        .is_not_blank()
+        .label_as("Member")
+    )
+
+    def tidy_data(workers: int) -> TidyData:
+        return TidyData(
+            observations,
+            Column(bands.attach_closest(right), apply=lambda x: x.upper()),
+            Column(assets.attach_directly(below)),
+            Column(members.attach_directly(right)),
+            Column.horizontal_condition(
+                "Condition",
+                lambda col: col["Band"] + " " + col["Member"],
+                depends_on=["Band", "Member"],
+            ),
+            obs_apply=lambda x: x + "!",
+            columnar=columnar,
+            workers=workers,
+            start_method="fork",
+        )
+
+    multiprocess = tidy_data(workers)
+    assert (
+        multiprocess._data_as_table_of_strings()
+        == tidy_data(1)._data_as_table_of_strings()
+    )
+
+    # Resolved cells of the source table are the cells themselves
+    observation_cells = [row[0] for row in list(multiprocess._data)[1:]]
+    member_cells = [row[3] for row in list(multiprocess._data)[1:]]
+    assert [(c.x, c.y) for c in observation_cells] == [
+        (c.x, c.y) for c in observations.cells
+    ]
+    assert all(
+        c is selectable_wide_band_tab.pcells[0]._table._by_id[c._id]
+        for c in member_cells
+    )
+
+
+def _shout(value: str) -> str:
+    return value.upper()
+
+
+def _exclaim(value: str) -> str:
+    return value + "!"
+
+
+def test_tidydata_multiprocess_transform_spawned():
+    """
+    Test that resolving the columns in spawned processes, which are
+    sent the TidyData pickled, creates the same tidy data as resolving
+    them in one.
+    """
+    selectable_wide_band_tab: Selectable = fixture_wide_band_tab()
+
+    observations = selectable_wide_band_tab.filter(filters.is_numeric).label_as(
+        "Observation"
+    )
+    bands = (
+        selectable_wide_band_tab.excel_ref("A3")
+        | selectable_wide_band_tab.excel_ref("G3")
+    ).label_as("Band")
+    assets = selectable_wide_band_tab.excel_ref("2").is_not_blank().label_as("Asset")
+    members = (
+        (
+            selectable_wide_band_tab.excel_ref("B")
+            | selectable_wide_band_tab.excel_ref("H")
+        )
+        .is_not_blank()
+        .label_as("Member")
+    )
+
+    def tidy_data(workers: int) -> TidyData:
+        return TidyData(
+            observations,
+            Column(bands.attach_closest(right), apply=_shout),
+            Column(assets.attach_directly(below)),
+            Column(members.attach_directly(right)),
+            Column(Constant("Unit", "Count")),
+            obs_apply=_exclaim,
+            workers=workers,
+            start_method="spawn",
+        )
+
+    spawned = tidy_data(2)
+    assert (
+        spawned._data_as_table_of_strings() == tidy_data(1)._data_as_table_of_strings()
+    )
+
+    # Resolved cells of the source table are the cells themselves
+    table = selectable_wide_band_tab.pcells[0]._table
+    assert all(row[3] is table._by_id[row[3]._id] for row in list(spawned._data)[1:])
+
+    # Only the cells the columns look up are sent as the workers start,
+    # rather than the table
+    cell_data, packed = _pack(spawned, spawned._compile_plan(), table)
+    assert {x[0] for x in pickle.loads(cell_data)} == {
+        c._id for c in bands.cells + assets.cells + members.cells
+    }
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(packed)
@@ -1,6 +1,7 @@
 import pytest
 
 from tests.fixtures import fixture_simple_one_tab
+from tidychef import acquire
 from tidychef.selection.selectable import Selectable
 
 
@@ -38,4 +39,52 @@ def test_cells_selector_not_strict(selectable_simple1: Selectable):
     Test we can select multiple cells from a selection, not strictly.
     """
     selection = selectable_simple1.cells_containing_string("2val", strict=False)
-    assert len(selection) == 260
\ No newline at end of file
+    assert len(selection) == 260
+
+
+def test_cells_selector_respects_current_selection(selectable_simple1: Selectable):
+    """
+    Test a strict search only returns matching cells that are
+    within the current selection.
+    """
+    assert len(selectable_simple1.column("A").cells_containing_string("A2val")) == 1
+    assert len(selectable_simple1.column("B").cells_containing_string("A2val")) == 0
+
+
+def test_value_index_is_shared_by_selections(selectable_simple1: Selectable):
+    """
+    Test the value index is built once and shared by every
+    selection made from the same table.
+    """
+    selection = selectable_simple1.column("W").cell_containing_string("W97val")
+    assert "value" in selectable_simple1.filtered._lazy_indexes
+    assert selection.filtered._lazy_indexes is selectable_simple1.filtered._lazy_indexes
+    assert (
+        selectable_simple1.pristine._lazy_indexes
+        is selectable_simple1.filtered._lazy_indexes
+    )
+
+
+def test_cells_selector_not_strict_keeps_order(selectable_simple1: Selectable):
+    """
+    Test that selecting cells by a substring keeps the order the
+    cells are selected in.
+    """
+    s = selectable_simple1.excel_ref("A2:C2") | selectable_simple1.excel_ref("A1:C1")
+    selection = s.cells_containing_string("val", strict=False)
+    assert [x._excel_ref() for x in selection] == ["A2", "B2", "C2", "A1", "B1", "C1"]
+
+
+def test_cells_selector_keeps_order():
+    """
+    Test that selecting cells by value keeps the order the
+    cells are selected in.
+    """
+    table = acquire.python.list_of_lists([["a", "b", "a"], ["a", "a", "b"]])
+    s = table.excel_ref("A2:C2") | table.excel_ref("A1:C1")
+    assert [x._excel_ref() for x in s.cells_containing_string("a")] == [
+        "A2",
+        "B2",
+        "A1",
+        "C1",
+    ]
@@ -21,4 +21,18 @@ def test_column_containing_strings(selectable_simple1: Selectable):
     Test we can select exactly one column from a selection
     where the column contains all of the strings in the provided list.
     """
-    selectable_simple1.column_containing_strings(["A2val", "A5val"]).assert_single_column()
\ No newline at end of file
+    selectable_simple1.column_containing_strings(["A2val", "A5val"]).assert_single_column()
+
+
+def test_column_containing_strings_keeps_order(selectable_simple1: Selectable):
+    """
+    Test that selecting a column keeps the order the cells of the
+    column are selected in.
+    """
+    s = (
+        selectable_simple1.excel_ref("A2:B2")
+        | selectable_simple1.excel_ref("A1")
+        | selectable_simple1.excel_ref("A3")
+    )
+    selection = s.column_containing_strings(["A1val"])
+    assert [x._excel_ref() for x in selection] == ["A2", "A1", "A3"]
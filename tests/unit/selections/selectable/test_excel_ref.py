@@ -5,6 +5,7 @@ from tidychef.exceptions import (
     BadExcelReferenceError,
     LoneValueOnMultipleCellsError,
     ReferenceOutsideSelectionError,
+    ReversedExcelRefError,
 )
 from tidychef.selection.selectable import Selectable
 
@@ -120,3 +121,86 @@ def test_list_excel_refs(selectable_simple1: Selectable):
         "C7",
         "E7",
     ]
+
+
+def test_excel_ref_reversed_range_raises(selectable_simple1: Selectable):
+    """
+    Test that a multi cell reference given bottom right to top
+    left raises the appropriate error.
+    """
+
+    with pytest.raises(ReversedExcelRefError):
+        selectable_simple1.excel_ref("C5:A1")
+
+
+def test_excel_ref_against_partial_selections(selectable_simple1: Selectable):
+    """
+    Test that the row, column and range references are resolved
+    against the current selection rather than the whole table.
+    """
+
+    selection = selectable_simple1.excel_ref("B2:D4") - selectable_simple1.excel_ref(
+        "C3"
+    )
+
+    # Columns only need one selected cell and select only the selected cells
+    assert selection.excel_ref("C")._get_excel_references() == ["C2", "C4"]
+    assert selection.excel_ref("C:D")._get_excel_references() == [
+        "C2",
+        "D2",
+        "D3",
+        "C4",
+        "D4",
+    ]
+    with pytest.raises(ReferenceOutsideSelectionError):
+        selection.excel_ref("E")
+    with pytest.raises(ReferenceOutsideSelectionError):
+        selection.excel_ref("C:E")
+
+    # Cells and ranges must be entirely selected
+    assert selection.excel_ref("B3")._get_excel_references() == ["B3"]
+    assert len(selection.excel_ref("B2:D2")) == 3
+    with pytest.raises(ReferenceOutsideSelectionError):
+        selection.excel_ref("C3")
+    with pytest.raises(ReferenceOutsideSelectionError):
+        selection.excel_ref("B3:D3")
+
+    # As must rows, in their entirety
+    with pytest.raises(ReferenceOutsideSelectionError):
+        selection.excel_ref("2")
+    assert len(selectable_simple1.excel_ref("2:3")) == 52
+    assert len(selectable_simple1.row(4)) == 26
+
+
+@pytest.mark.parametrize(
+    "excel_ref,expected",
+    [
+        ("A", ["A2", "A3", "A1"]),
+        ("A:B", ["A2", "B2", "A3", "B3", "A1", "B1"]),
+        ("A1:B2", ["A2", "B2", "A1", "B1"]),
+        ("B3", ["B3"]),
+    ],
+)
+def test_excel_ref_keeps_order(
+    selectable_simple1: Selectable, excel_ref: str, expected: list
+):
+    """
+    Test that an excel reference keeps the order the cells are
+    currently selected in.
+    """
+    s = selectable_simple1.excel_ref("A2:C3") | selectable_simple1.excel_ref("A1:C1")
+    assert [x._excel_ref() for x in s.excel_ref(excel_ref)] == expected
+
+
+def test_excel_ref_checks_each_cell_is_selected(selectable_simple1: Selectable):
+    """
+    Test that single cell and larger references outside of the
+    current selection raise.
+    """
+    s = selectable_simple1.excel_ref("A1:J10") - selectable_simple1.excel_ref("C5")
+    assert s.excel_ref("C4").lone_value() == "C4val"
+    with pytest.raises(ReferenceOutsideSelectionError):
+        s.excel_ref("C5")
+    with pytest.raises(ReferenceOutsideSelectionError):
+        s.excel_ref("A1:J10")
+    assert len(s.excel_ref("A6:J10")) == 50
@@ -94,3 +94,32 @@ def test_extrude_boundary_cases(selectable_simple1: Selectable):
     # This should raise an error because Z50 cannot extrude further right
     with pytest.raises(OutOfBoundsError):
         selectable_simple1.excel_ref("Y50:Z50").extrude(right)
+
+
+def test_extrude_out_of_bounds_reports_step(selectable_simple1: Selectable):
+    """
+    Test the OutOfBoundsError raised by extrude reports the step at
+    which the table boundary was hit.
+    """
+
+    with pytest.raises(
+        OutOfBoundsError, match=r"10 steps downwards \(stopped at step 5\)"
+    ):
+        selectable_simple1.excel_ref("B96").extrude(down(10))
+
+    with pytest.raises(
+        OutOfBoundsError, match=r"3 steps to the left \(stopped at step 2\)"
+    ):
+        selectable_simple1.excel_ref("B6").extrude(left(3))
+
+
+def test_extrude_order(selectable_simple1: Selectable):
+    """
+    Test extruded cells are added moving outwards from each selected cell.
+    """
+
+    extruded = selectable_simple1.excel_ref("D6").extrude(left(3))
+    assert [c._excel_ref() for c in extruded] == ["D6", "C6", "B6", "A6"]
+
+    extruded = selectable_simple1.excel_ref("D6").extrude(up(2))
+    assert [c._excel_ref() for c in extruded] == ["D6", "D5", "D4"]
@@ -4,6 +4,7 @@ import pytest
 
 from tests.fixtures import fixture_simple_one_tab
 from tidychef import datafuncs as dfc
+from tidychef import filters
 from tidychef.models.source.cell import Cell
 from tidychef.selection.selectable import Selectable
 
@@ -66,3 +67,57 @@ def test_filter_with_function(selectable_simple1: Selectable):
     s = s.filter(ContainsSpecificLetter("A"))
     assert len(s.cells) == 12
     assert dfc.basecells_to_excel_ref(s.cells) == "A1:A12"
+
+
+@pytest.mark.parametrize("substr", ["A", "1v", "val", "A1val", "12va", "xyz", ""])
+def test_filter_with_contains_string(selectable_simple1: Selectable, substr: str):
+    """
+    Confirm that the indexed contains_string filter selects the same
+    cells as checking every cell in the selection.
+    """
+    s = selectable_simple1.excel_ref("A1:C12")
+    expected = [c for c in s.cells if substr in c.value]
+    found = s.filter(filters.contains_string(substr))
+    assert {c._id for c in found.cells} == {c._id for c in expected}
+    assert "trigram" in selectable_simple1.filtered._lazy_indexes or len(substr) < 3
+
+
+def test_filter_by_value_calls_once_per_value(selectable_simple1: Selectable):
+    """
+    Confirm that filtering by value calls the check once per distinct
+    value, with the result applied to every cell holding that value.
+    """
+
+    s = selectable_simple1.excel_ref("A1:B12")
+    for cell in s.cells:
+        cell.value = "A" if cell.x == 0 else "B"
+
+    seen = []
+
+    def is_a(cell: Cell):
+        seen.append(cell.value)
+        return cell.value == "A"
+
+    assert len(s.filter(is_a, by_value=True).cells) == 12
+    assert sorted(seen) == ["A", "B"]
+
+    seen.clear()
+    assert len(s.filter(is_a).cells) == 12
+    assert len(seen) == 24
+
+
+def test_filter_with_contains_string_keeps_order(selectable_simple1: Selectable):
+    """
+    Test that filtering with contains_string keeps the order the cells
+    are selected in, as filtering with any other check does.
+    """
+    s = selectable_simple1.excel_ref("A2:C3") | selectable_simple1.excel_ref("A1:C1")
+    expected = ["A2", "B2", "C2", "A3", "B3", "C3", "A1", "B1", "C1"]
+
+    assert [x._excel_ref() for x in s.filter(filters.contains_string(""))] == expected
+    assert [x._excel_ref() for x in s.filter(lambda x: True)] == expected
+    assert [x._excel_ref() for x in s.filter(filters.contains_string("2"))] == [
+        "A2",
+        "B2",
+        "C2",
+    ]
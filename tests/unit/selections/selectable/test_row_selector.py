@@ -31,3 +31,20 @@ def test_row_containing_strings_not_strict(selectable_simple1: Selectable):
     but not strictly (i.e. martial string match).
     """
     selectable_simple1.row_containing_strings(["A2v", "D2v"], strict=False).assert_single_row()
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_row_containing_strings_keeps_order(
+    selectable_simple1: Selectable, strict: bool
+):
+    """
+    Test that selecting a row keeps the order the cells of the
+    row are selected in.
+    """
+    s = (
+        selectable_simple1.excel_ref("C1")
+        | selectable_simple1.excel_ref("A1:B1")
+        | selectable_simple1.excel_ref("C2")
+    )
+    selection = s.row_containing_strings(["A1val"], strict=strict)
+    assert [x._excel_ref() for x in selection] == ["C1", "A1", "B1"]
@@ -1,6 +1,7 @@
 import pytest
 
 from tests.fixtures import fixture_simple_one_tab
+from tidychef import acquire
 from tidychef import datafuncs as dfc
 from tidychef.direction.directions import down, left, right, up
 from tidychef.exceptions import BadShiftParameterError, OutOfBoundsError
@@ -79,3 +80,28 @@ def test_shift_out_of_bounds_raises(selectable_simple1: Selectable):
 
     with pytest.raises(OutOfBoundsError):
         selectable_simple1.excel_ref("Z100").shift(right)
+
+
+def test_shift_large_offsets():
+    """
+    Confirm that shifting by a large offset happens in a single
+    move rather than one step (and one recursive call) at a time.
+    """
+
+    table = acquire.python.list_of_lists([[str(y)] * 3 for y in range(5000)])
+
+    s = table.excel_ref("A1:B2").shift(down(4500))
+    assert dfc.basecells_to_excel_ref(s.cells) == "A4501:B4502"
+
+    s = s.shift(1, -4000)
+    assert dfc.basecells_to_excel_ref(s.cells) == "B501:C502"
+
+
+def test_shift_partially_out_of_bounds(selectable_simple1: Selectable):
+    """
+    Confirm that when shifting, cells that move beyond the boundary
+    of the table are dropped from the selection.
+    """
+
+    s = selectable_simple1.excel_ref("X1:Z2").shift(right(2))
+    assert dfc.basecells_to_excel_ref(s.cells) == "Z1:Z2"
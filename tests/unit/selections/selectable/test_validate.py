@@ -2,7 +2,9 @@ import pytest
 
 from tests.fixtures import fixture_simple_one_tab
 from tidychef import against
+from tidychef.against.implementations.base import BaseValidator
 from tidychef.exceptions import CellValidationError
+from tidychef.models.source.cell import Cell
 from tidychef.selection.selectable import Selectable
 
 
@@ -26,3 +28,38 @@ def test_selection_validation(selectable_simple1: Selectable):
         )
 
     selectable_simple1.excel_ref("B1").validate(against.regex("B1val"))
+
+
+def test_selection_validation_by_value(selectable_simple1: Selectable):
+    """
+    Test that a value only validator is called once per distinct
+    value, while still reporting an error for every invalid cell.
+    """
+
+    class CountingValidator(BaseValidator):
+        value_only = True
+
+        def __init__(self):
+            self.calls = 0
+
+        def __call__(self, cell: Cell) -> bool:
+            self.calls += 1
+            return cell.value == "valid"
+
+        def msg(self, cell: Cell) -> str:
+            return f"{cell.value} is not valid"
+
+    selection = selectable_simple1.excel_ref("A1:A4")
+    for cell, value in zip(selection.cells, ["valid", "bad", "valid", "bad"]):
+        cell.value = value
+
+    validator = CountingValidator()
+    with pytest.raises(CellValidationError) as err:
+        selection.validate(validator)
+    assert validator.calls == 2
+    assert str(err.value).count("bad is not valid") == 2
+
+    validator = CountingValidator()
+    with pytest.raises(CellValidationError):
+        selection.validate(validator, by_value=False)
+    assert validator.calls == 4
@@ -0,0 +1,35 @@
+from tidychef.utils import bitset
+
+
+def test_bitset_round_trip():
+    """
+    Test that ids converted to a bitset can be converted back
+    to the same ids, in ascending order.
+    """
+    ids = [0, 7, 8, 9, 63, 64, 1000]
+    mask = bitset.from_ids(reversed(ids), 10)
+    assert list(bitset.to_ids(mask)) == ids
+    assert bitset.count(mask) == len(ids)
+
+
+def test_bitset_empty():
+    """
+    Test the empty bitset behaves as expected.
+    """
+    mask = bitset.from_ids([])
+    assert mask == 0
+    assert list(bitset.to_ids(mask)) == []
+    assert bitset.count(mask) == 0
+
+
+def test_bitset_operators():
+    """
+    Test that python bitwise operators act as set operations
+    on bitsets.
+    """
+    a = bitset.from_ids([1, 2, 3])
+    b = bitset.from_ids([3, 4])
+    assert list(bitset.to_ids(a | b)) == [1, 2, 3, 4]
+    assert list(bitset.to_ids(a & b)) == [3]
+    assert list(bitset.to_ids(a & ~b)) == [1, 2]
+    assert list(bitset.to_ids(a ^ b)) == [1, 2, 4]
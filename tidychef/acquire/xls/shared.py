@@ -95,7 +95,7 @@ def sheets_from_workbook(
                 if hasattr(xf, 'alignment') and hasattr(xf.alignment, 'indent_level'):
                     indent_level = xf.alignment.indent_level
                 
-                cell_formatting = CellFormatting(
+                cell_formatting = CellFormatting.interned(
                     bold=is_bold,
                     italic=is_italic,
                     underline=is_underline,
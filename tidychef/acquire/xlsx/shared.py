@@ -69,7 +69,7 @@ def sheets_from_workbook(
                 # Check if cell is a hyperlink
                 is_hyperlink = opycell.hyperlink is not None
                 
-                cell_formatting = CellFormatting(
+                cell_formatting = CellFormatting.interned(
                     bold=is_bold,
                     italic=is_italic,
                     underline=is_underline,
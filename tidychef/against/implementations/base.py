@@ -7,8 +7,14 @@ class BaseValidator(metaclass=ABCMeta):
     """
     The standard Matcher used to validate a
     single cell object.
+
+    Validators that read nothing but the value of the
+    cell should set value_only to True, so a selection
+    can be validated once per distinct value.
     """
 
+    value_only: bool = False
+
     @abstractmethod
     def __call__(self, cell: Cell) -> bool:
         """
@@ -14,6 +14,7 @@ class ItemsValidator(BaseValidator):
     """
 
     items: List[str]
+    value_only = True
 
     def __call__(self, cell: Cell) -> bool:
         """
@@ -15,6 +15,7 @@ class LengthValidator(BaseValidator):
 
     least: Optional[int] = None
     most: Optional[int] = None
+    value_only = True
 
     def __post_init__(self):
         assert not all([self.least is None, self.most is None]), (
@@ -9,6 +9,8 @@ class IsNumericOrFloatValidator(BaseValidator):
     Cell object.
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell) -> bool:
         """
         Is the value property of the Cell
@@ -44,6 +46,8 @@ class IsNotNumericOrFloatValidator(BaseValidator):
     Cell object.
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell) -> bool:
         """
         Is the value property of the Cell
@@ -79,6 +83,8 @@ class IsNotNumericValidator(BaseValidator):
     Cell object.
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell) -> bool:
         """
         Is the value property of the Cell
@@ -113,6 +119,8 @@ class IsNumericValidator(BaseValidator):
     Cell object.
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell) -> bool:
         """
         Is the value property of the Cell
@@ -11,6 +11,7 @@ from tidychef.models.source.cell import Cell
 class RegexValidator(BaseValidator):
     pattern: str
     _compiled: Optional[Pattern] = None
+    value_only = True
 
     def __call__(self, cell: Cell) -> bool:
         """
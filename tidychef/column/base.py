@@ -1,4 +1,6 @@
+import threading
 from abc import ABCMeta
+from typing import Dict, Hashable, List
 
 from tidychef.lookup.base import BaseLookupEngine
 from tidychef.models.source.cell import Cell
@@ -38,9 +40,32 @@ class BaseColumn(metaclass=ABCMeta):
         self.engine = engine
         self.label = engine.label
 
+        # Cells resolved (post lookup) keyed by the part of the observation
+        # the engine depends on, see BaseLookupEngine.cache_key()
+        self._lookup_cache: Dict[Hashable, Cell] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Guards the caches of the column, so a column can resolve
+        # observations from many threads at once.
+        self._lock = threading.RLock()
+
         # See _post_init() docstring
         self._post_init(self, engine, *args, **kwargs)
 
+    def __getstate__(self):
+        """
+        Locks cannot be copied or pickled, so are left out
+        and recreated.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
     def _pre_init(
         self,
         engine: BaseLookupEngine,
@@ -97,9 +122,145 @@ class BaseColumn(metaclass=ABCMeta):
         this particular Column is applying custom handling of
         some sort.
 
+        Where the engine provides a cache key for the observation
+        the result is cached against that key.
+
         :param cell: A single tidychef Cell object.
         :return: A single tidychef Cell object.
         """
+        key = self.engine.cache_key(observation_cell)
+        if key is not None:
+            with self._lock:
+                cell = self._lookup_cache.get(key)
+                if cell is not None:
+                    self.cache_hits += 1
+                    return cell
+                self.cache_misses += 1
+
         cell = self.engine.resolve(observation_cell, *args)
         cell = self._post_lookup(cell)
+        if key is not None:
+            with self._lock:
+                cell = self._lookup_cache.setdefault(key, cell)
         return cell
+
+    def resolve_column_cells_from_obs_cells(
+        self, observation_cells: List[Cell], *args, broadcast: bool = True
+    ) -> List[Cell]:
+        """
+        Use the provided lookup engine to return the values
+        of this Column against many observations at once,
+        according to the lookup engine in use.
+
+        Each distinct found cell is ran through _post_lookup()
+        once, with the result reused wherever that cell was
+        found again.
+
+        Where the engine provides cache keys for the observations,
+        only one observation per key not already cached is
+        resolved by the engine. Else, where the engine says its
+        lookups depend only on the column or only on the row of
+        the observations within their bounding block, only one
+        observation per column or row is resolved and broadcast.
+
+        :param observation_cells: The tidychef Cell objects
+        representing the observations.
+        :param broadcast: Broadcast per column or row where the
+        engine allows it.
+        :return: A tidychef Cell object per observation.
+        """
+        if args:
+            return self._resolve_many(observation_cells, *args)
+
+        cache_key = self.engine.cache_key
+        keys = [cache_key(cell) for cell in observation_cells]
+        if all(key is None for key in keys):
+            if broadcast and observation_cells:
+                return self._resolve_block(observation_cells)
+            return self._resolve_many(observation_cells)
+
+        resolved: List[Cell] = [None] * len(observation_cells)
+        to_resolve: List[int] = []
+        first_of_key = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key is None:
+                    to_resolve.append(i)
+                elif key in self._lookup_cache:
+                    resolved[i] = self._lookup_cache[key]
+                    self.cache_hits += 1
+                elif key in first_of_key:
+                    self.cache_hits += 1
+                else:
+                    first_of_key[key] = i
+                    to_resolve.append(i)
+                    self.cache_misses += 1
+
+        found_cells = self._resolve_many([observation_cells[i] for i in to_resolve])
+        found_by_key = {}
+        with self._lock:
+            for i, cell in zip(to_resolve, found_cells):
+                if keys[i] is not None:
+                    cell = self._lookup_cache.setdefault(keys[i], cell)
+                    found_by_key[keys[i]] = cell
+                resolved[i] = cell
+
+        for i, cell in enumerate(resolved):
+            if cell is None:
+                resolved[i] = found_by_key[keys[i]]
+
+        return resolved
+
+    def _resolve_block(self, observation_cells: List[Cell]) -> List[Cell]:
+        """
+        Resolve many observations, broadcasting the lookup of one
+        observation per column or row of their bounding block where
+        the engine allows it.
+
+        :param observation_cells: The tidychef Cell objects
+        representing the observations.
+        :return: A tidychef Cell object per observation.
+        """
+        xs = [cell.x for cell in observation_cells]
+        ys = [cell.y for cell in observation_cells]
+        axis = self.engine.broadcast_axis(min(xs), min(ys), max(xs), max(ys))
+        if axis is None:
+            return self._resolve_many(observation_cells)
+
+        offsets = xs if axis == "x" else ys
+        first_at_offset: Dict[int, int] = {}
+        for i, offset in enumerate(offsets):
+            first_at_offset.setdefault(offset, i)
+
+        representatives = [observation_cells[i] for i in first_at_offset.values()]
+        try:
+            found_cells = self._resolve_many(representatives)
+        except Exception:
+            # Resolve every observation, so any exception reports all of
+            # the observations that cannot be resolved.
+            return self._resolve_many(observation_cells)
+
+        found_at_offset = dict(zip(first_at_offset, found_cells))
+        return [found_at_offset[offset] for offset in offsets]
+
+    def _resolve_many(self, observation_cells: List[Cell], *args) -> List[Cell]:
+        """
+        Use the provided lookup engine to return the values of this
+        Column against many observations, running each distinct found
+        cell through _post_lookup() once.
+
+        :param observation_cells: The tidychef Cell objects
+        representing the observations.
+        :return: A tidychef Cell object per observation.
+        """
+        # found_cells keeps every found cell alive until we're done, so
+        # no two of them can share an id()
+        found_cells = self.engine.resolve_many(observation_cells, *args)
+        post_lookups = {}
+        resolved = []
+        for cell in found_cells:
+            post_lookup_cell = post_lookups.get(id(cell))
+            if post_lookup_cell is None:
+                post_lookup_cell = post_lookups[id(cell)] = self._post_lookup(cell)
+            resolved.append(post_lookup_cell)
+        return resolved
@@ -8,6 +8,7 @@ from tidychef.exceptions import CellValidationError
 from tidychef.lookup.base import BaseLookupEngine
 from tidychef.lookup.engines.constant import Constant
 from tidychef.lookup.engines.horizontal_condition import HorizontalCondition
+from tidychef.lookup.engines.join import CodeList, Join
 from tidychef.models.source.cell import Cell
 
 
@@ -39,7 +40,10 @@ class Column(BaseColumn):
 
     @staticmethod
     def horizontal_condition(
-        column_label: str, resolver: Callable, priority=0
+        column_label: str,
+        resolver: Callable,
+        priority=0,
+        depends_on: Optional[List[str]] = None,
     ) -> Column:
         """
         Creates a column that populates based on the
@@ -49,10 +53,42 @@ class Column(BaseColumn):
         :param resolver: A callable to resolve the horizontal condition logic.
         :priority: controls order of resolution for all present HorizontalCondition objects,
         lower values are resolved first.
+        :param depends_on: The labels of the columns the resolver reads, where
+        provided the resolver is called once per distinct combination of their values.
         :return: A Column object populated with a configured HorizontalCondition
         lookup engine.
         """
-        return Column(HorizontalCondition(column_label, resolver, priority=priority))
+        return Column(
+            HorizontalCondition(
+                column_label, resolver, priority=priority, depends_on=depends_on
+            )
+        )
+
+    @staticmethod
+    def join(
+        column_label: str,
+        code_list: CodeList,
+        on: str,
+        default: Optional[str] = None,
+        priority=0,
+    ) -> Column:
+        """
+        Creates a column that populates by joining the values resolved
+        for another column (or the observations) to an external code list.
+
+        :param column_label: The label we wish to give to the column.
+        :param code_list: The code list to join to, see CodeList.from_csv().
+        :param on: The label of the column (or observations) whose values
+        are the keys of the code list.
+        :param default: The value to use for keys not in the code list,
+        where not provided a missing key raises.
+        :priority: controls order of resolution for all present HorizontalCondition objects,
+        lower values are resolved first.
+        :return: A Column object populated with a configured Join lookup engine.
+        """
+        return Column(
+            Join(column_label, code_list, on, default=default, priority=priority)
+        )
 
     @staticmethod
     def constant(column_label: str, constant: str) -> Column:
@@ -113,35 +149,17 @@ class Column(BaseColumn):
         # input value (each column cell can resolve for many
         # observations)
         if self.apply is not None:
-            already_applied_cell = self._apply_cache.get(cell.value, None)
+            with self._lock:
+                already_applied_cell = self._apply_cache.get(cell.value, None)
             if already_applied_cell is None:
-
-                # Clear neighbor references before deepcopy to prevent RecursionError
-                # that will occur as most cells (those of type Cell) have references to
-                # other cells (neighbours)
-                if isinstance(cell, Cell):
-                    old_neighbour_up = cell._neighbour_up
-                    old_neighbour_down = cell._neighbour_down
-                    old_neighbour_left = cell._neighbour_left
-                    old_neighbour_right = cell._neighbour_right
-                    
-                    cell._neighbour_up = None
-                    cell._neighbour_down = None
-                    cell._neighbour_left = None
-                    cell._neighbour_right = None
-                
-                applied_cell = copy.deepcopy(cell)
+                # A shallow copy is enough as we're only changing the value,
+                # a cell references the table it belongs to so a deep copy
+                # would copy the whole table.
+                applied_cell = copy.copy(cell)
                 applied_cell.value = self.apply(applied_cell.value)
-                
-                if isinstance(cell, Cell):
-                    # Restore neighbor references on original cell
-                    cell._neighbour_up = old_neighbour_up
-                    cell._neighbour_down = old_neighbour_down
-                    cell._neighbour_left = old_neighbour_left
-                    cell._neighbour_right = old_neighbour_right
-                
-                self._apply_cache[cell.value] = applied_cell
-                cell = applied_cell
+                with self._lock:
+                    # Another thread may have got there first, if so use theirs
+                    cell = self._apply_cache.setdefault(cell.value, applied_cell)
             else:
                 cell = already_applied_cell
 
@@ -149,9 +167,12 @@ class Column(BaseColumn):
         # --------
         # Any _unique_ Cell value is either valid in this context or it
         # isn't, so only check its valid once.
-        if self.validation is not None and cell not in self._validated_cells:
-            self._validated_cells.append(cell)
-            if not self.validation(cell):
+        if self.validation is not None:
+            with self._lock:
+                unvalidated = cell not in self._validated_cells
+                if unvalidated:
+                    self._validated_cells.append(cell)
+            if unvalidated and not self.validation(cell):
                 if hasattr(self.validation, "msg"):
                     msg = f"Message is: {self.validation.msg(cell)}"
                 else:
@@ -89,6 +89,13 @@ class Direction(BaseDirection):
         """
         return self.is_upwards or self.is_downwards
 
+    def __reduce__(self):
+        """
+        The module level name Direction is the (dontmutate) wrapped
+        class, so pickle rebuilds a direction by calling that.
+        """
+        return Direction, (self.x, self.y, self.name, self._locked)
+
     def inverted(self) -> Direction:
         """
         Returns a direction that is the direct inversion of
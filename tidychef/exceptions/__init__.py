@@ -19,6 +19,7 @@ from .common import (
     BadConditionalResolverError,
     CellsDoNotExistError,
     DroppingNonColumnError,
+    DuplicateKeyColumnError,
     FileInputError,
     HorizontalConditionalHeaderError,
     ImpossibleLookupError,
@@ -30,7 +31,12 @@ from .common import (
     UnalignedTableOperation,
     ZeroAcquiredTablesError,
 )
-from .lookups import AmbiguousLookupError, FailedLookupError, MissingDirectLookupError
+from .lookups import (
+    AmbiguousLookupError,
+    FailedLookupError,
+    LookupCheckError,
+    MissingDirectLookupError,
+)
 
 __all__ = [
     "AmbiguousWaffleError",
@@ -49,6 +55,7 @@ __all__ = [
     "BadConditionalResolverError",
     "CellsDoNotExistError",
     "DroppingNonColumnError",
+    "DuplicateKeyColumnError",
     "FileInputError",
     "HorizontalConditionalHeaderError",
     "ImpossibleLookupError",
@@ -61,5 +68,6 @@ __all__ = [
     "ZeroAcquiredTablesError",
     "AmbiguousLookupError",
     "FailedLookupError",
+    "LookupCheckError",
     "MissingDirectLookupError",
 ]
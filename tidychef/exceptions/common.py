@@ -140,3 +140,13 @@ class DroppingNonColumnError(Exception):
 
     def __init__(self, msg):
         self.msg = msg
+
+
+class DuplicateKeyColumnError(Exception):
+    """
+    Raised where a user is dropping duplicates by one or more
+    key columns but a key column does not exist.
+    """
+
+    def __init__(self, msg):
+        self.msg = msg
@@ -26,3 +26,15 @@ class FailedLookupError(Exception):
 
     def __init__(self, msg):
         self.msg = msg
+
+
+class LookupCheckError(Exception):
+    """
+    Raised where a check of the lookups of a TidyData finds one or
+    more observation cells that cannot be resolved, reporting all of
+    them at once.
+    """
+
+    def __init__(self, msg, failures=None):
+        self.msg = msg
+        self.failures = failures
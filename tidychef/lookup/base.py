@@ -1,5 +1,11 @@
 from abc import ABCMeta, abstractmethod
+from typing import Hashable, List, Optional
 
+from tidychef.exceptions import (
+    FailedLookupError,
+    ImpossibleLookupError,
+    MissingDirectLookupError,
+)
 from tidychef.models.source.cell import Cell
 
 
@@ -15,3 +21,68 @@ class BaseLookupEngine(metaclass=ABCMeta):
         the lookup, returning the relevant cell
         value as defined by this visual relationship.
         """
+
+    def cache_key(self, cell: Cell) -> Optional[Hashable]:
+        """
+        The part of an observation cell that the lookup
+        actually depends on, such that all observations
+        sharing a key resolve to the same cell.
+
+        Returns None (the default) where there is no such
+        key, so the result of the lookup cannot be cached.
+
+        :param cell: A single observation cell.
+        """
+        return None
+
+    def broadcast_axis(self, x0: int, y0: int, x1: int, y1: int) -> Optional[str]:
+        """
+        Where, for observations within the given block, the
+        lookup depends only on the column ("x") or only on the
+        row ("y") of the observation, say which. So a lookup
+        can be resolved once per column or row of the block and
+        broadcast to the rest.
+
+        Returns None (the default) where it depends on both.
+
+        :param x0: Lowest horizontal index of the block
+        :param y0: Lowest vertical index of the block
+        :param x1: Highest horizontal index of the block
+        :param y1: Highest vertical index of the block
+        """
+        return None
+
+    def resolve_many(self, cells: List[Cell], *args) -> List[Cell]:
+        """
+        Given many observation cells, resolve the
+        lookup for each of them, returning the relevant
+        cells in the same order as the observations.
+
+        Engines should override this where resolving
+        the observations together can be done more
+        efficiently than one at a time.
+
+        :param cells: The observation cells to resolve.
+        :return: The resolved cells, one per observation.
+        """
+        return [self.resolve(cell, *args) for cell in cells]
+
+    def unresolvable(self, cells: List[Cell]) -> List[Cell]:
+        """
+        Given many observation cells, return those the
+        lookup cannot be resolved for, without raising.
+
+        Engines should override this where it can be
+        checked more efficiently than attempting each
+        lookup in turn.
+
+        :param cells: The observation cells to check.
+        :return: The observation cells that cannot be resolved.
+        """
+        failures = []
+        for cell in cells:
+            try:
+                self.resolve(cell)
+            except (FailedLookupError, ImpossibleLookupError, MissingDirectLookupError):
+                failures.append(cell)
+        return failures
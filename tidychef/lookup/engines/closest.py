@@ -1,5 +1,7 @@
+import threading
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from tidychef.direction.directions import Direction
 from tidychef.exceptions import AmbiguousLookupError, ImpossibleLookupError
@@ -185,6 +187,14 @@ class CellRanges:
 
         assert len(self.ordered_cell_ranges) == len(selection.cells)
 
+        # The same ranges, as sorted arrays of boundaries to bisect.
+        ordered = [
+            self.ordered_cell_ranges[i] for i in range(len(ordered_break_points))
+        ]
+        self.lows: List[int] = [x.low for x in ordered]
+        self.highs: List[int] = [x.high for x in ordered]
+        self.cells: List[Cell] = [x.cell for x in ordered]
+
     def _as_dict(self):
         """
         Reproduce the defined ranges as a dict.
@@ -218,54 +228,54 @@ class Closest(BaseLookupEngine):
         self.table = table
         self.direction = direction
         self.ranges = CellRanges(selection, direction, table)
-        self.bumped = True
-        self.start_index = None
         self.label = label
 
-    def _resolve_at_lower_range(self, index, cell, ceiling, floor):
-        """
-        Move the index down as as the cell offset was down/less-than the
-        last ranged we looked at then attempt to resolve again.
+        # The index of the range the last lookup resolved to, see resolve().
+        # Held per thread, so each thread resolving via this engine has a
+        # cursor following its own stream of observations.
+        self._local = threading.local()
 
-        :param index: The index of the last range we looked at
-        :param cell: The cell we're trying to find the correct range for
-        :param ceiling: The highest range index to consider
-        :param floor: The lowest range index to consider
+    def __getstate__(self):
         """
+        Per thread cursors cannot be copied or pickled, so are left out
+        and recreated.
+        """
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
 
-        if self.bumped is False and index != 0:
-            new_index = index - 1
-            self.bumped = True
-        else:
-            potential_range = ceiling - floor
-            new_index = index - int(potential_range / 2)
-            new_index = new_index if new_index != index else new_index - 1
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
 
-        if new_index < 0:
-            new_index = 0
+    @property
+    def cursor(self) -> int:
+        """
+        The index of the range the last lookup made by
+        this thread resolved to.
+        """
+        return getattr(self._local, "cursor", 0)
 
-        return self.resolve(cell, index=new_index, ceiling=index, floor=floor)
+    @cursor.setter
+    def cursor(self, index: int):
+        self._local.cursor = index
 
-    def _resolve_at_higher_range(self, index, cell, ceiling, floor):
+    def _offset(self, cell: Cell) -> int:
         """
-        Move the index down as as the cell offset was above/greater-than the
-        last ranged we looked at then attempt to resolve again.
+        The offset of the cell along the axis in question.
 
-        :param index: The index of the last range we looked at
-        :param cell: The cell we're trying to find the correct range for
-        :param ceiling: The lowest range index to consider
-        :param floor: The highest range index to consider
+        :param cell: A tidychef Cell object.
         """
+        return cell.x if self.direction.is_horizontal else cell.y
 
-        if self.bumped is False and index != len(self.ranges.ordered_cell_ranges):
-            new_index = index + 1
-            self.bumped = True
-        else:
-            potential_range = ceiling - floor
-            new_index = index + int(potential_range / 2)
-            new_index = new_index if new_index != index else new_index + 1
+    def cache_key(self, cell: Cell) -> int:
+        """
+        A closest lookup depends only on the offset of the
+        observation along the axis in question.
 
-        return self.resolve(cell, index=new_index, ceiling=ceiling, floor=index)
+        :param cell: A single observation cell.
+        """
+        return self._offset(cell)
 
     def _confirm_within_bounds(self, cell: Cell):
         """
@@ -317,59 +327,77 @@ class Closest(BaseLookupEngine):
                 )
             )
 
-    def resolve(self, cell: Cell, index=None, ceiling=None, floor=0) -> Cell:
+    def resolve(self, cell: Cell) -> Cell:
         """
         Given the cell we want to lookup the relative column value for, use
-        a bisection search to identify the correct range in our ordered list of ranges.
+        a bisection search to identify the correct range in our ordered list
+        of ranges.
 
-        Note - this method is called recursively, using the kwargs to start
-        again at a different point in the indexed list of ranges.
-
-        :param index: The index of the last range we looked at
         :param cell: The cell we're trying to find the correct range for
-        :param ceiling: The lowest range index to consider
-        :param floor: The highest range index to consider
         :return: The tidychef Cell object representing the
         column cell.
         """
+        self._confirm_within_bounds(cell)
+
+        offset = self._offset(cell)
+        lows, highs = self.ranges.lows, self.ranges.highs
+
+        # Lookup Caching
+        # --------------
+        # cells are implicitly selected right->down-a-row->right as you look at a tabulated
+        # (i.e as per standard human reading convention) so there's a significant chance
+        # the next obs lookup is in the same range as the last, and (often, not guaranteed)
+        # if it isn't then its in the neighbouring range. So check both of those before
+        # falling back to a bisection search.
+        index = self.cursor
+        if not lows[index] <= offset <= highs[index]:
+            index += 1
+            if index == len(lows) or not lows[index] <= offset <= highs[index]:
+                index = bisect_right(lows, offset) - 1
+            self.cursor = index
+
+        return self.ranges.cells[index]
+
+    def unresolvable(self, cells: List[Cell]) -> List[Cell]:
+        """
+        Given many observation cells, return those beyond the
+        boundary of the ranges, with no column cell in the
+        direction in question.
 
-        # If neither the index or ceiling have been passed in, then its the
-        # very first lookup - confirm cell is within the bounds and therefore
-        # this lookup is theoretically possible.
-        if not ceiling and not index:
-            self._confirm_within_bounds(cell)
+        :param cells: The observation cells to check.
+        :return: The observation cells that cannot be resolved.
+        """
+        if self.direction.is_upwards or self.direction.is_left:
+            boundary = self.ranges.lowest_possible_offset
+            return [cell for cell in cells if self._offset(cell) < boundary]
+        boundary = self.ranges.highest_possible_offset
+        return [cell for cell in cells if self._offset(cell) > boundary]
+
+    def resolve_many(self, cells: List[Cell]) -> List[Cell]:
+        """
+        Given many observation cells, resolve the relative column
+        cell for each of them.
 
-        # If no maximum cell range (ceiling) is set then its the absolute maximum
-        if ceiling is None:
-            ceiling: int = len(self.ranges.ordered_cell_ranges) - 1
+        The observations are sorted by their offset along the axis
+        in question, then resolved in a single sweep over the ordered
+        ranges.
 
-        if index is None:
-            # When starting range index is not passed in, start at the mid point.
-            mid_point: int = int(len(self.ranges.ordered_cell_ranges) / 2)
-            index = list(self.ranges.ordered_cell_ranges.keys())[mid_point]
+        :param cells: The observation cells we're trying to find the
+        correct ranges for.
+        :return: The tidychef Cell objects representing the
+        column cells, one per observation.
+        """
+        for cell in cells:
+            self._confirm_within_bounds(cell)
 
-        considered_range: CellRange = self.ranges.get_range_by_index(index)
+        offsets = [self._offset(cell) for cell in cells]
+        highs, range_cells = self.ranges.highs, self.ranges.cells
 
-        if considered_range.spans_lower_range_than(cell):
-            return self._resolve_at_higher_range(
-                index, cell, ceiling=ceiling, floor=floor
-            )
-        elif considered_range.spans_higher_range_than(cell):
-            return self._resolve_at_lower_range(
-                index, cell, ceiling=ceiling, floor=floor
-            )
-        else:
-            # Lookup Caching
-            # --------------
-            # cells are implicitly selected right->down-a-row->right as you look at a tabulated
-            # (i.e as per standard human reading convention) so we'll cache this range index as
-            # there's a significant chance the next obs lookup is in the same range
-            #
-            # this right-then-down-then-right pattern also means that (often, not guaranteed),
-            # if the next obs isn't in the last range checked, there's a decent chance it's in a
-            # neighbouring range, so we'll also always "bump" the index once in the relevant
-            # direction on a first miss.
-            self.index = index
-            self.bumped = False
-
-            return considered_range.cell
+        resolved: List[Cell] = [None] * len(cells)
+        j = 0
+        for i in sorted(range(len(cells)), key=offsets.__getitem__):
+            while highs[j] < offsets[i]:
+                j += 1
+            resolved[i] = range_cells[j]
+
+        return resolved
@@ -1,3 +1,5 @@
+from typing import List
+
 from tidychef.models.source.cell import Cell, VirtualCell
 
 from ..base import BaseLookupEngine
@@ -24,6 +26,16 @@ class Constant(BaseLookupEngine):
         self.cell = VirtualCell(value=value)
         self.label = label
 
+    def cache_key(self, _: Cell) -> bool:
+        """
+        A constant lookup does not depend on the observation
+        cell at all, so every observation shares a key.
+
+        :param _: Unused Cell object required to keep api
+        signature in keeping with the other engines
+        """
+        return True
+
     def resolve(self, _: Cell):
         """
         Regardless of the observation cell,
@@ -33,3 +45,21 @@ class Constant(BaseLookupEngine):
         signature in keeping with the other engines
         """
         return self.cell
+
+    def resolve_many(self, cells: List[Cell]) -> List[VirtualCell]:
+        """
+        Regardless of the observation cells,
+        return the constant cell for each of them.
+
+        :param cells: The observation cells to resolve.
+        """
+        return [self.cell] * len(cells)
+
+    def unresolvable(self, _: List[Cell]) -> List[Cell]:
+        """
+        A constant lookup resolves for any observation cell.
+
+        :param _: Unused Cell objects required to keep api
+        signature in keeping with the other engines
+        """
+        return []
@@ -1,4 +1,6 @@
-from typing import List
+from operator import attrgetter
+from os import linesep
+from typing import Dict, List, Optional
 
 from tidychef import datafuncs as dfc
 from tidychef.direction.directions import BaseDirection, Direction
@@ -12,6 +14,19 @@ from tidychef.models.source.table import LiveTable
 
 from ..base import BaseLookupEngine
 
+# Is the column cell (pcell) in the direction of travel from the observation (cell)
+CHECKERS = {
+    "left": lambda cell, pcell: cell.x > pcell.x,
+    "right": lambda cell, pcell: cell.x < pcell.x,
+    "up": lambda cell, pcell: cell.y > pcell.y,
+    "above": lambda cell, pcell: cell.y > pcell.y,
+    "down": lambda cell, pcell: cell.y < pcell.y,
+    "below": lambda cell, pcell: cell.y < pcell.y,
+}
+
+# The most unresolvable observations listed by a single exception
+MAX_REPORTED = 20
+
 
 class Directly(BaseLookupEngine):
     """
@@ -33,6 +48,7 @@ class Directly(BaseLookupEngine):
         selection: LiveTable,
         direction: Direction,
         table: str = "Unnamed Table",
+        precompute: bool = False,
     ):
         """
         A class to resolve a direct lookup between
@@ -45,6 +61,10 @@ class Directly(BaseLookupEngine):
         :param: direction: one of up,down,left,right,above,below
         :param: Selection: the selection of cells that hold the column values being looked to.
         :param table: the name of the table data is being extracted from
+        :param precompute: precompute the answer for every offset along each
+        row or column holding column cells, so each lookup is a single index.
+        Costs memory in proportion to the number of such rows or columns
+        times the extent of the table, so off by default.
         """
         self.table = table
         self.label = label
@@ -94,6 +114,10 @@ class Directly(BaseLookupEngine):
                 self._lookups[self._index(cell)] = []
             self._lookups[self._index(cell)].append(cell)
 
+        self._answers: Optional[Dict[int, List[Optional[Cell]]]] = None
+        if precompute:
+            self._precompute(cells)
+
     def _index(self, cell: Cell):
         """
         Get the x or y offset we're interested in.
@@ -109,60 +133,274 @@ class Directly(BaseLookupEngine):
             return cell.y
         return cell.x
 
-    def resolve(self, cell: Cell) -> Cell:
+    def _precompute(self, cells: List[Cell]):
         """
-        Given an observation cell, return the
-        appropriate cell as declared via this
-        visual relationship.
+        For every row (horizontal lookups) or column (vertical lookups)
+        holding column cells, create a dense list of the cell resolved
+        at every offset across the extent of the table. Akin to a "last
+        column cell to the left" prefix fill.
+
+        :param cells: The cells that hold the column values being looked to.
+        """
+        if not cells:
+            self._answers = {}
+            return
+
+        grid = getattr(cells[0]._table, "grid", None)
+        if grid is not None and self.direction.is_horizontal:
+            extent = grid.max_x + 1
+        elif grid is not None:
+            extent = grid.max_y + 1
+        else:
+            extent = max(self._axis(c) for c in cells) + 1
+
+        towards_start = self.direction.is_left or self.direction.is_upwards
+        self._answers = {}
+        for index, potential_cells in self._lookups.items():
+            answers: List[Optional[Cell]] = [None] * extent
+            following_cells = potential_cells[1:] + [None]
+            for pcell, next_pcell in zip(potential_cells, following_cells):
+                if towards_start:
+                    # Ascending, so a column cell answers every offset after
+                    # it up to and including that of the next column cell.
+                    low = self._axis(pcell) + 1
+                    high = extent - 1 if next_pcell is None else self._axis(next_pcell)
+                else:
+                    # Descending, so a column cell answers every offset before
+                    # it down to and including that of the next column cell.
+                    low = 0 if next_pcell is None else self._axis(next_pcell)
+                    high = self._axis(pcell) - 1
+                high = min(high, extent - 1)
+                answers[low : high + 1] = [pcell] * (high + 1 - low)
+            self._answers[index] = answers
+
+    def _walk(self, cell: Cell) -> Optional[Cell]:
+        """
+        Walk the column cells on the same row or column as the observation
+        cell along the direction of travel, returning the closest column
+        cell found (if there is one).
 
         :param cell: The tidychef Cell object we're trying
         to resolve the relative column cell object for.
-        :return: The tidychef Cell object representing the
-        column cell.
         """
-
         potential_cells: List[Cell] = self._lookups.get(self._index(cell))
         if not potential_cells:
-            raise MissingDirectLookupError(
+            return None
+
+        checker = CHECKERS[self.direction.name]
+        chosen_cell = None
+        for pcell in potential_cells:
+            if checker(cell, pcell):
+                chosen_cell = pcell
+            else:
+                break
+        return chosen_cell
+
+    def _answer(self, cell: Cell) -> Optional[Cell]:
+        """
+        The precomputed answer for an observation cell, walking the
+        column cells where there isn't one.
+
+        :param cell: The tidychef Cell object we're trying
+        to resolve the relative column cell object for.
+        """
+        answers = self._answers.get(self._index(cell))
+        if answers is None:
+            return None
+        offset = self._axis(cell)
+        if 0 <= offset < len(answers):
+            return answers[offset]
+        return self._walk(cell)
+
+    def _lookup_error(self, cells: List[Cell]) -> Exception:
+        """
+        Create the exception for observation cells we could not resolve
+        a column cell for.
+
+        :param cells: The observation cells that could not be resolved.
+        """
+        shown = cells[:MAX_REPORTED]
+        observations = linesep.join(
+            f'{c._excel_ref()}, x position "{c.x}", y position "{c.y}", value: "{c.value}"'
+            for c in shown
+        )
+        if len(cells) > len(shown):
+            observations += f"{linesep}...and {len(cells) - len(shown)} more."
+
+        if len(cells) == 1:
+            in_question = "The observation cell in question is:"
+        else:
+            in_question = f"The {len(cells)} observation cells in question are:"
+
+        if any(self._index(c) not in self._lookups for c in cells):
+            return MissingDirectLookupError(
                 f"""
                 When processing table "{self.table}" a direct lookup for column
                 "{self.label}" failed because no column value exists in your
                 column selection with direction: "{self.direction.name}" relative
                 to the observation cell being resolved.
                 
-                The observation cell in question is:
-                {cell._excel_ref()}, x position "{cell.x}", y position "{cell.y}",
-                value: "{cell.value}"
+                {in_question}
+                {observations}
             """
             )
 
-        checker = {
-            "left": lambda cell, pcell: cell.x > pcell.x,
-            "right": lambda cell, pcell: cell.x < pcell.x,
-            "up": lambda cell, pcell: cell.y > pcell.y,
-            "above": lambda cell, pcell: cell.y > pcell.y,
-            "down": lambda cell, pcell: cell.y < pcell.y,
-            "below": lambda cell, pcell: cell.y < pcell.y,
-        }
-
-        chosen_cell = None
-        for pcell in potential_cells:
-            if checker[self.direction.name](cell, pcell):
-                chosen_cell = pcell
-            else:
-                break
-
-        if not chosen_cell:
-            raise FailedLookupError(
-                f"""
+        return FailedLookupError(
+            f"""
                 When processing table "{self.table}" a Direct lookup for
                 column "{self.label}" could not resolve with direction:
                 "{self.direction.name}".
 
-                The observation cell in question is:
-                {cell._excel_ref()}, x position "{cell.x}", y position "{cell.y}",
-                value: "{cell.value}"
+                {in_question}
+                {observations}
                     """
-            )
+        )
+
+    def resolve(self, cell: Cell) -> Cell:
+        """
+        Given an observation cell, return the
+        appropriate cell as declared via this
+        visual relationship.
+
+        :param cell: The tidychef Cell object we're trying
+        to resolve the relative column cell object for.
+        :return: The tidychef Cell object representing the
+        column cell.
+        """
+        if self._answers is not None:
+            chosen_cell = self._answer(cell)
+        else:
+            chosen_cell = self._walk(cell)
+
+        if chosen_cell is None:
+            raise self._lookup_error([cell])
 
         return chosen_cell
+
+    def broadcast_axis(self, x0: int, y0: int, x1: int, y1: int) -> Optional[str]:
+        """
+        Where none of the column cells on the rows (horizontal lookups)
+        or columns (vertical lookups) of the block lie within the block,
+        every observation on a row or column of the block resolves to
+        the same cell.
+
+        :param x0: Lowest horizontal index of the block
+        :param y0: Lowest vertical index of the block
+        :param x1: Highest horizontal index of the block
+        :param y1: Highest vertical index of the block
+        """
+        if self.direction.is_horizontal:
+            index_range, axis_range, axis = (y0, y1), (x0, x1), "y"
+        else:
+            index_range, axis_range, axis = (x0, x1), (y0, y1), "x"
+
+        for index, potential_cells in self._lookups.items():
+            if index_range[0] <= index <= index_range[1]:
+                for pcell in potential_cells:
+                    if axis_range[0] <= self._axis(pcell) <= axis_range[1]:
+                        return None
+        return axis
+
+    def _axis(self, cell: Cell) -> int:
+        """
+        Get the x or y offset along the direction of travel,
+        i.e cell.x (column index) for horizontal lookups
+        else y (row index).
+
+        :param cell: A tidychef Cell object.
+        """
+        if self.direction.is_horizontal:
+            return cell.x
+        return cell.y
+
+    def resolve_many(self, cells: List[Cell]) -> List[Cell]:
+        """
+        Given many observation cells, return the appropriate
+        cell for each as declared via this visual relationship.
+
+        Where the answers are not precomputed, observations are
+        bucketed by the row or column they share with their potential
+        column cells, then each bucket is resolved in a single sweep
+        along the direction of travel.
+
+        Every observation that cannot be resolved is reported by a
+        single exception.
+
+        :param cells: The tidychef Cell objects we're trying
+        to resolve the relative column cell objects for.
+        :return: The tidychef Cell objects representing the
+        column cells, one per observation.
+        """
+        if self._answers is not None:
+            answer = self._answer
+            resolved = [answer(cell) for cell in cells]
+        else:
+            resolved = self._sweep(cells)
+
+        failures = [cells[i] for i, x in enumerate(resolved) if x is None]
+        if failures:
+            raise self._lookup_error(failures)
+
+        return resolved
+
+    def unresolvable(self, cells: List[Cell]) -> List[Cell]:
+        """
+        Given many observation cells, return those with no column
+        cell in the direction of travel.
+
+        :param cells: The observation cells to check.
+        :return: The observation cells that cannot be resolved.
+        """
+        if self._answers is not None:
+            answer = self._answer
+            return [cell for cell in cells if answer(cell) is None]
+        return [cell for cell, x in zip(cells, self._sweep(cells)) if x is None]
+
+    def _sweep(self, cells: List[Cell]) -> List[Optional[Cell]]:
+        """
+        Resolve many observation cells by sweeping each row or column
+        of them along the direction of travel.
+
+        :param cells: The tidychef Cell objects we're trying
+        to resolve the relative column cell objects for.
+        :return: The column cell (or None where there isn't one) for
+        each observation.
+        """
+        # As _index and _axis, fixed once rather than per cell
+        horizontal = self.direction.is_horizontal
+        index_of = attrgetter("y" if horizontal else "x")
+        axis_of = attrgetter("x" if horizontal else "y")
+
+        buckets: Dict[int, List[int]] = {}
+        for i, cell in enumerate(cells):
+            buckets.setdefault(index_of(cell), []).append(i)
+
+        resolved: List[Optional[Cell]] = [None] * len(cells)
+        towards_start = self.direction.is_left or self.direction.is_upwards
+
+        for index, positions in buckets.items():
+            potential_cells = self._lookups.get(index)
+            if not potential_cells:
+                continue
+
+            # Potential cells are ordered along the direction of travel,
+            # we want them ascending along the axis.
+            ascending = potential_cells if towards_start else potential_cells[::-1]
+            offsets = [axis_of(c) for c in ascending]
+
+            j = 0
+            for offset, i in sorted((axis_of(cells[i]), i) for i in positions):
+                if towards_start:
+                    # The closest column cell before the observation
+                    while j < len(offsets) and offsets[j] < offset:
+                        j += 1
+                    if j > 0:
+                        resolved[i] = ascending[j - 1]
+                else:
+                    # The closest column cell after the observation
+                    while j < len(offsets) and offsets[j] <= offset:
+                        j += 1
+                    if j < len(offsets):
+                        resolved[i] = ascending[j]
+
+        return resolved
@@ -1,4 +1,5 @@
-from typing import Callable, Dict
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
 from tidychef.exceptions import (
     BadConditionalResolverError,
@@ -21,6 +22,7 @@ class HorizontalCondition(BaseLookupEngine):
         resolver: Callable[[Dict[str, str]], str],
         priority: int = 0,
         table: str = "Unnamed Table",
+        depends_on: Optional[List[str]] = None,
     ):
         """
         A lookup engine to populate the contents of a column based
@@ -32,11 +34,35 @@ class HorizontalCondition(BaseLookupEngine):
         :param priority: The priority used when resolving multiple horizontal
         conditions, 0 is highest priority and the default.
         :param table: the name of the table data is being extracted from
+        :param depends_on: The labels of the columns the resolver reads. Where
+        provided, the resolver is only given those columns and is called once
+        per distinct combination of their values, with the resulting cell
+        reused for every row with that same combination.
         """
         self.label = label
         self.resolver = resolver
         self.priority = priority
         self.table = table
+        self.depends_on = depends_on
+
+        # Where depends_on is provided, resolved cells by the tuple of
+        # values they were resolved from and by their own value.
+        self._resolved: Dict[Tuple[str, ...], VirtualCell] = {}
+        self._interned: Dict[str, VirtualCell] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """
+        Locks cannot be copied or pickled, so are left out
+        and recreated.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def resolve(self, _: Cell, cells_on_row: Dict[str, str]) -> VirtualCell:
         """
@@ -63,6 +89,34 @@ class HorizontalCondition(BaseLookupEngine):
                 """
             )
 
+        if self.depends_on is None:
+            return VirtualCell(value=self._resolve_value(cells_on_row))
+
+        try:
+            key = tuple(cells_on_row[label] for label in self.depends_on)
+        except KeyError as err:
+            raise self._header_error(err, cells_on_row) from err
+
+        with self._lock:
+            cell = self._resolved.get(key)
+        if cell is None:
+            column_value = self._resolve_value(dict(zip(self.depends_on, key)))
+            with self._lock:
+                cell = self._interned.setdefault(
+                    column_value, VirtualCell(value=column_value)
+                )
+                cell = self._resolved.setdefault(key, cell)
+        return cell
+
+    def _resolve_value(self, cells_on_row: Dict[str, str]) -> str:
+        """
+        Call the resolver to get the column value for an observation
+        row, confirming it returns a string.
+
+        :param cells_on_row: Dictionary containing contents of other
+        columns already resolve against the observation cell.
+        :return: The value for the column.
+        """
         try:
             column_value = self.resolver(cells_on_row)
             if not isinstance(column_value, str):
@@ -79,28 +133,71 @@ class HorizontalCondition(BaseLookupEngine):
                     return value: {column_value} 
                     """
                 )
-            return VirtualCell(value=column_value)
+            return column_value
 
         except KeyError as err:
-            raise HorizontalConditionalHeaderError(
-                f"""
-                Issue encountered when processing table: "{self.table}".
-
-                Unable to resolve lookup for "{self.label}".
-                                               
-                The column header key "{err.args[0]}" was specified in:
-                the condition but is not (yet?) present on the resolved row:
-                
-                Header Keys: {cells_on_row.keys()}
+            raise self._header_error(err, cells_on_row) from err
 
-                Note - please be aware of ordering when using horizontal conditions
-                that interact (i.e where condition 2 required condition 1 to be
-                resolved first)
+    def _header_error(
+        self, err: KeyError, cells_on_row: Dict[str, str]
+    ) -> HorizontalConditionalHeaderError:
+        """
+        Create the exception for a condition that reads a column
+        that is not present on the resolved row.
 
-                The priority= keyword can be used with the Column.horizontal_condition()
-                constructor where conditionals must be sequenced. The lower the priority
-                the sooner the condition is executed.
+        :param err: The KeyError raised when reading the column.
+        :param cells_on_row: Dictionary containing contents of other
+        columns already resolve against the observation cell.
+        """
+        depends_on = ""
+        if self.depends_on is not None:
+            depends_on = f"""
+                Note - this condition declares it depends_on: {self.depends_on}
+                and is only given those columns.
                 """
-            ) from err
-        except Exception as err:
-            raise err
+        return HorizontalConditionalHeaderError(
+            f"""
+            Issue encountered when processing table: "{self.table}".
+
+            Unable to resolve lookup for "{self.label}".
+                                           
+            The column header key "{err.args[0]}" was specified in:
+            the condition but is not (yet?) present on the resolved row:
+            
+            Header Keys: {cells_on_row.keys()}
+
+            Note - please be aware of ordering when using horizontal conditions
+            that interact (i.e where condition 2 required condition 1 to be
+            resolved first)
+
+            The priority= keyword can be used with the Column.horizontal_condition()
+            constructor where conditionals must be sequenced. The lower the priority
+            the sooner the condition is executed.
+            {depends_on}"""
+        )
+
+    def resolve_many(
+        self, cells: List[Cell], cells_on_rows: List[Dict[str, str]]
+    ) -> List[VirtualCell]:
+        """
+        For many observation rows, resolve the column value of each.
+
+        :param cells: Tidychef cell objects representing the observations
+        in question.
+        :param cells_on_rows: A dictionary per observation containing contents
+        of other columns already resolved against that observation cell.
+        :return: The values for the column, one per observation.
+        """
+        resolve = self.resolve
+        return [resolve(cell, row) for cell, row in zip(cells, cells_on_rows)]
+
+    def unresolvable(self, _: List[Cell]) -> List[Cell]:
+        """
+        A horizontal condition depends on the values resolved for
+        the other columns, so cannot be checked ahead of them being
+        resolved. It is considered resolvable for any observation.
+
+        :param _: Unused Cell objects required to keep api
+        signature in keeping with the other engines
+        """
+        return []
@@ -0,0 +1,190 @@
+"""
+A lookup engine joining an already resolved column to an external
+code list.
+"""
+
+from __future__ import annotations
+
+import csv
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from tidychef.exceptions import FailedLookupError
+from tidychef.models.source.cell import Cell, VirtualCell
+
+from .horizontal_condition import HorizontalCondition
+
+# Code lists loaded from csv, by (path, key column, value column), so a
+# code list is loaded once and shared by every column joining to it. Held
+# weakly, so a code list is freed once nothing is joining to it.
+_REGISTRY: weakref.WeakValueDictionary[
+    Tuple[str, str, str], CodeList
+] = weakref.WeakValueDictionary()
+_REGISTRY_LOCK = threading.Lock()
+
+
+class CodeList:
+    """
+    An external table of key to value, hash indexed, with every value
+    held as a single VirtualCell shared by every join to it.
+    """
+
+    def __init__(self, mapping: Dict[str, str], name: str = "Unnamed Code List"):
+        """
+        An external table of key to value, hash indexed, with every value
+        held as a single VirtualCell shared by every join to it.
+
+        :param mapping: The key to value pairs of the code list.
+        :param name: A name for the code list, used in error messages.
+        """
+        self.name = name
+        # The (modification time, size) of the file loaded from, if any.
+        self._stamp: Optional[Tuple[int, int]] = None
+        interned: Dict[str, VirtualCell] = {}
+        self.cells: Dict[str, VirtualCell] = {}
+        for key, value in mapping.items():
+            cell = interned.get(value)
+            if cell is None:
+                cell = interned[value] = VirtualCell(value=value)
+            self.cells[key] = cell
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    @staticmethod
+    def from_csv(
+        path: Union[str, Path], key: str, value: str, reload: bool = False
+    ) -> CodeList:
+        """
+        Load a code list from the key and value columns of a csv file
+        with a header row.
+
+        The code list is loaded once, then shared by every later call
+        for the same file and columns, until the file changes (by
+        modification time or size) or nothing is using it any more.
+
+        :param path: The location of the csv file.
+        :param key: The header of the column holding the keys.
+        :param value: The header of the column holding the values.
+        :param reload: Load the file again, replacing the shared code list.
+        :return: A CodeList
+        """
+        path = Path(path)
+        registry_key = (str(path.absolute()), key, value)
+
+        with _REGISTRY_LOCK:
+            stat = path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            code_list = _REGISTRY.get(registry_key)
+            if code_list is None or code_list._stamp != stamp or reload:
+                with open(path, newline="") as csvfile:
+                    mapping = {row[key]: row[value] for row in csv.DictReader(csvfile)}
+                code_list = CodeList(mapping, name=path.name)
+                code_list._stamp = stamp
+                _REGISTRY[registry_key] = code_list
+        return code_list
+
+
+class Join(HorizontalCondition):
+    """
+    A lookup engine to populate the contents of a column by joining
+    the value resolved for another column (or the observation) to
+    an external code list.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        code_list: CodeList,
+        on: str,
+        default: Optional[str] = None,
+        priority: int = 0,
+        table: str = "Unnamed Table",
+    ):
+        """
+        A lookup engine to populate the contents of a column by joining
+        the value resolved for another column (or the observation) to
+        an external code list.
+
+        :param label: The label of the column informed
+        by this lookup engine.
+        :param code_list: The code list to join to.
+        :param on: The label of the column (or observations) whose
+        values are the keys of the code list.
+        :param default: The value to use for keys not in the code list,
+        where not provided a missing key raises.
+        :param priority: The priority used when resolving multiple horizontal
+        conditions, 0 is highest priority and the default.
+        :param table: the name of the table data is being extracted from
+        """
+        super().__init__(
+            label, self._join_value, priority=priority, table=table, depends_on=[on]
+        )
+        self.code_list = code_list
+        self.on = on
+        self.default = None if default is None else VirtualCell(value=default)
+
+    def _join_value(self, cells_on_row: Dict[str, str]) -> str:
+        """
+        The value of the code list for a row, so the join
+        can also be used as a plain resolver.
+
+        :param cells_on_row: Dictionary containing contents of other
+        columns already resolve against the observation cell.
+        """
+        return self._join(cells_on_row[self.on]).value
+
+    def _join(self, key: str) -> VirtualCell:
+        """
+        The shared cell of the code list for a key.
+
+        :param key: A key of the code list.
+        """
+        cell = self.code_list.cells.get(key, self.default)
+        if cell is None:
+            raise FailedLookupError(
+                f"""
+                When processing table "{self.table}" a join for column
+                "{self.label}" failed because the value "{key}" of column
+                "{self.on}" is not a key of code list "{self.code_list.name}".
+                """
+            )
+        return cell
+
+    def resolve(self, _: Cell, cells_on_row: Dict[str, str]) -> VirtualCell:
+        """
+        For a given observation row, join to the code list.
+
+        :param _: Unused tidychef cell object representing the observation in
+        question. Required to match api signature used by other look engines.
+        :param cells_on_row: Dictionary containing contents of other
+        columns already resolve against the observation cell.
+        :return: The shared code list cell.
+        """
+        try:
+            key = cells_on_row[self.on]
+        except KeyError as err:
+            raise self._header_error(err, cells_on_row) from err
+        return self._join(key)
+
+    def resolve_many(
+        self, cells: List[Cell], cells_on_rows: List[Dict[str, str]]
+    ) -> List[VirtualCell]:
+        """
+        For many observation rows, join each to the code list.
+
+        :param cells: Tidychef cell objects representing the observations
+        in question.
+        :param cells_on_rows: A dictionary per observation containing contents
+        of other columns already resolved against that observation cell.
+        :return: The shared code list cells, one per observation.
+        """
+        try:
+            keys = [row[self.on] for row in cells_on_rows]
+        except KeyError as err:
+            raise self._header_error(err, cells_on_rows[0]) from err
+
+        joined = {key: self._join(key) for key in set(keys)}
+        return [joined[key] for key in keys]
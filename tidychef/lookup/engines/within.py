@@ -1,6 +1,6 @@
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
 
-from tidychef import datafuncs as dfc
 from tidychef.direction.directions import Direction
 from tidychef.exceptions import ImpossibleLookupError, WithinAxisDeclarationError
 from tidychef.models.source.cell import Cell
@@ -107,119 +107,73 @@ class Within(BaseLookupEngine):
 
         self.cells: List[Cell] = selection.cells
 
-    def _order(self, cells: List[Cell]) -> List[Cell]:
+        # Index the cells by their offset on the axis the start= and end=
+        # params scan along (the "window" axis), then by their offset
+        # along the direction of the lookup, so the closest cell in any
+        # window can be found by bisection.
+        by_window: Dict[int, List[Cell]] = {}
+        for c in self.cells:
+            by_window.setdefault(self._window_offset(c), []).append(c)
+
+        self._window_offsets: List[int] = sorted(by_window)
+        self._lookup_offsets: Dict[int, List[int]] = {}
+        self._lookup_cells: Dict[int, List[Cell]] = {}
+        for offset, cells in by_window.items():
+            cells.sort(key=self._lookup_offset)
+            self._lookup_offsets[offset] = [self._lookup_offset(c) for c in cells]
+            self._lookup_cells[offset] = cells
+
+    def _window_offset(self, cell: Cell) -> int:
         """
-        Order cells appropriately based on how the lookup engine has been configured
+        The offset of a cell on the axis the start= and end= params
+        scan along.
 
-        :param cells: A list of cells to be ordered.
-        :return: The ordered list of cells.
+        :param cell: A tidychef Cell object.
         """
+        return cell.x if self.direction_of_travel.is_horizontal else cell.y
 
-        # Right
-        if any([self.direction_of_travel.is_right and self.direction.is_downwards]):
-            return dfc.order_cells_leftright_topbottom(cells)
-        elif any([self.direction_of_travel.is_right and self.direction.is_upwards]):
-            return dfc.order_cells_leftright_bottomtop(cells)
-
-        # Left
-        elif any([self.direction_of_travel.is_left and self.direction.is_downwards]):
-            return dfc.order_cells_rightleft_topbottom(cells)
-        elif any([self.direction_of_travel.is_left and self.direction.is_upwards]):
-            return dfc.order_cells_rightleft_bottomtop(cells)
-
-        # Downwards
-        elif any([self.direction_of_travel.is_downwards and self.direction.is_right]):
-            return dfc.order_cells_topbottom_leftright(cells)
-        elif any([self.direction_of_travel.is_downwards and self.direction.is_left]):
-            return dfc.order_cells_topbottom_rightleft(cells)
-
-        # Upwards
-        elif any([self.direction_of_travel.is_upwards and self.direction.is_right]):
-            return dfc.order_cells_bottomtop_leftright(cells)
-        elif any([self.direction_of_travel.is_upwards and self.direction.is_left]):
-            return dfc.order_cells_bottomtop_rightleft(cells)
-
-    def _feasible_cells(self, cell: Cell) -> List[Cell]:
+    def _lookup_offset(self, cell: Cell) -> int:
         """
-        Filters cells known to the engine to create a list of cells that are
-        valid within the start= and end= params relative to the cell in question.
+        The offset of a cell on the axis of the direction of the lookup.
+
+        :param cell: A tidychef Cell object.
+        """
+        return cell.x if self.direction.is_horizontal else cell.y
+
+    def _window(self, cell: Cell) -> Tuple[int, int]:
+        """
+        The lowest and highest offsets on the axis the start= and end=
+        params scan along that are valid relative to the cell in question.
 
         :param cell: The tidychef cell we're trying to resolve the column
         cell for.
-        :return: A list of cells that are feasible
         """
-
-        if self.direction_of_travel.is_right and self.direction.is_upwards:
-            x_start = cell.x + self.start.x
-            x_end = cell.x + self.end.x
-            return [
-                c
-                for c in self.cells
-                if all([c.x >= x_start, c.x <= x_end, c.is_above(cell.y)])
-            ]
-
-        if self.direction_of_travel.is_left and self.direction.is_upwards:
-            x_start = cell.x + self.end.x
-            x_end = cell.x + self.start.x
-            return [
-                c
-                for c in self.cells
-                if all([c.x >= x_start, c.x <= x_end, c.is_above(cell.y)])
-            ]
-
-        if self.direction_of_travel.is_right and self.direction.is_downwards:
-            x_start = cell.x + self.start.x
-            x_end = cell.x + self.end.x
-            return [
-                c
-                for c in self.cells
-                if all([c.x >= x_start, c.x <= x_end, c.is_below(cell.y)])
-            ]
-
-        if self.direction_of_travel.is_left and self.direction.is_downwards:
-            x_start = cell.x + self.end.x
-            x_end = cell.x + self.start.x
-            return [
-                c
-                for c in self.cells
-                if all([c.x >= x_start, c.x <= x_end, c.is_below(cell.y)])
-            ]
-
-        if self.direction_of_travel.is_upwards and self.direction.is_right:
-            y_start = cell.y + self.end.y
-            y_end = cell.y + self.start.y
-            return [
-                c
-                for c in self.cells
-                if all([c.y >= y_start, c.y <= y_end, c.is_right_of(cell.x)])
-            ]
-
-        if self.direction_of_travel.is_upwards and self.direction.is_left:
-            y_start = cell.y + self.end.y
-            y_end = cell.y + self.start.y
-            return [
-                c
-                for c in self.cells
-                if all([c.y >= y_start, c.y <= y_end, c.is_left_of(cell.x)])
-            ]
-
-        if self.direction_of_travel.is_downwards and self.direction.is_left:
-            y_start = cell.y + self.start.y
-            y_end = cell.y + self.end.y
-            return [
-                c
-                for c in self.cells
-                if all([c.y >= y_start, c.y <= y_end, c.is_left_of(cell.x)])
-            ]
-
-        if self.direction_of_travel.is_downwards and self.direction.is_right:
-            y_start = cell.y + self.start.y
-            y_end = cell.y + self.end.y
-            return [
-                c
-                for c in self.cells
-                if all([c.y >= y_start, c.y <= y_end, c.is_right_of(cell.x)])
-            ]
+        if self.direction_of_travel.is_right:
+            return cell.x + self.start.x, cell.x + self.end.x
+        if self.direction_of_travel.is_left:
+            return cell.x + self.end.x, cell.x + self.start.x
+        if self.direction_of_travel.is_upwards:
+            return cell.y + self.end.y, cell.y + self.start.y
+        return cell.y + self.start.y, cell.y + self.end.y
+
+    def broadcast_axis(self, x0: int, y0: int, x1: int, y1: int) -> Optional[str]:
+        """
+        Where none of the column cells lie within the block along the
+        direction of the lookup, only the window of an observation
+        matters, so every observation on a row (horizontal lookups) or
+        column (vertical lookups) of the block resolves to the same cell.
+
+        :param x0: Lowest horizontal index of the block
+        :param y0: Lowest vertical index of the block
+        :param x1: Highest horizontal index of the block
+        :param y1: Highest vertical index of the block
+        """
+        low, high = (x0, x1) if self.direction.is_horizontal else (y0, y1)
+        for lookup_offsets in self._lookup_offsets.values():
+            i = bisect_left(lookup_offsets, low)
+            if i < len(lookup_offsets) and lookup_offsets[i] <= high:
+                return None
+        return "y" if self.direction.is_horizontal else "x"
 
     def resolve(self, cell: Cell) -> Cell:
         """
@@ -227,17 +181,48 @@ class Within(BaseLookupEngine):
         appropriate cell as declared via this
         visual relationship.
 
+        That is the closest cell in the direction of the lookup from
+        any offset within the window, with ties going to the first
+        offset in the direction of travel.
+
         :param cell: The tidychef Cell we want to resolve a column Cell for.
         :return: The column Cell we're resolved.
         """
 
         assert isinstance(cell, Cell)
 
-        # Discard non feasible cells to avoid the overhead of ordering
-        # cells that cant be the lookup
-        feasible_cells = self._feasible_cells(cell)
-
-        if len(feasible_cells) == 0:
+        low, high = self._window(cell)
+        first = bisect_left(self._window_offsets, low)
+        last = bisect_right(self._window_offsets, high)
+        window_offsets = self._window_offsets[first:last]
+        if self.direction_of_travel.is_left or self.direction_of_travel.is_upwards:
+            window_offsets.reverse()
+
+        looking_back = self.direction.is_left or self.direction.is_upwards
+        cell_offset = self._lookup_offset(cell)
+
+        best_offset = None
+        best_cell = None
+        for window_offset in window_offsets:
+            lookup_offsets = self._lookup_offsets[window_offset]
+            if looking_back:
+                # The closest cell with a lower offset than the observation
+                i = bisect_left(lookup_offsets, cell_offset) - 1
+                if i < 0:
+                    continue
+                if best_offset is None or lookup_offsets[i] > best_offset:
+                    best_offset = lookup_offsets[i]
+                    best_cell = self._lookup_cells[window_offset][i]
+            else:
+                # The closest cell with a higher offset than the observation
+                i = bisect_right(lookup_offsets, cell_offset)
+                if i == len(lookup_offsets):
+                    continue
+                if best_offset is None or lookup_offsets[i] < best_offset:
+                    best_offset = lookup_offsets[i]
+                    best_cell = self._lookup_cells[window_offset][i]
+
+        if best_cell is None:
             raise ImpossibleLookupError(
                 f"""
                 An error was encountered when processing column
@@ -259,29 +244,5 @@ class Within(BaseLookupEngine):
                 {self.cells}                    
                 """
             )
-        ordered_feasible_cells = self._order(feasible_cells)
-        assert len(ordered_feasible_cells) == len(feasible_cells)
-
-        if self.direction.is_left:
-            max_x = max([x.x for x in ordered_feasible_cells])
-            for cell in ordered_feasible_cells:
-                if cell.x == max_x:
-                    return cell
-
-        if self.direction.is_upwards:
-            max_y = max([x.y for x in ordered_feasible_cells])
-            for cell in ordered_feasible_cells:
-                if cell.y == max_y:
-                    return cell
-
-        if self.direction.is_right:
-            min_x = min([x.x for x in ordered_feasible_cells])
-            for cell in ordered_feasible_cells:
-                if cell.x == min_x:
-                    return cell
-
-        if self.direction.is_downwards:
-            min_y = min([x.y for x in ordered_feasible_cells])
-            for cell in ordered_feasible_cells:
-                if cell.y == min_y:
-                    return cell
+
+        return best_cell
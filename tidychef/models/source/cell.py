@@ -3,9 +3,10 @@ Classes representing a sinlge cell of data.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from os import linesep
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from tidychef.exceptions import (
     InvalidCellObjectError,
@@ -16,8 +17,15 @@ from tidychef.utils import cellutils
 
 from .cellformat import CellFormatting
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .table import Table
 
-@dataclass
+# A source table can hold millions of cells so, where the python version
+# supports it, cells are slotted rather than each carrying a __dict__.
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**SLOTS)
 class BaseCell:
     """
     A primitive non value holding cell construct.
@@ -151,7 +159,7 @@ class BaseCell:
         return cellutils.x_to_letters(self.x)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class VirtualCell(BaseCell):
     """
     Where we are establishing relationships between a concrete cell
@@ -174,7 +182,7 @@ class VirtualCell(BaseCell):
         return f'({self._excel_ref()}, value:"{self.value}")'
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Cell(BaseCell):
     """
     Denotes a cell of data from a tabulated data source
@@ -190,11 +198,6 @@ class Cell(BaseCell):
     x: int
     y: int
 
-    _neighbour_up: Optional[Cell] = None
-    _neighbour_down: Optional[Cell] = None
-    _neighbour_left: Optional[Cell] = None
-    _neighbour_right: Optional[Cell] = None
-
     # Optional as some tabulated formats (eg csv) do not have
     # cell formatting.
     cellformat: Optional[CellFormatting] = None
@@ -203,11 +206,24 @@ class Cell(BaseCell):
     # time we need it.
     numeric: bool = False
 
+    # Set on load and when the table holding the cell is indexed
+    # respectively, declared here so they have a slot.
+    _original_value: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _id: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _table: Optional[Table] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """
         We'll store the original value of the cell
         for where a cell value has been changed.
+
+        String values are interned, so the many cells of a
+        table that share a value also share one string.
         """
+        if isinstance(self.value, str):
+            self.value = sys.intern(self.value)
         self._original_value = self.value
 
         # Derive if its numeric
@@ -217,6 +233,34 @@ class Cell(BaseCell):
         except (ValueError, TypeError):
             pass
 
+    # Neighbouring cells are derived from the coordinate index of
+    # the table the cell belongs to rather than being held by each cell.
+
+    def _neighbour(self, x_offset: int, y_offset: int) -> Optional[Cell]:
+        """
+        The cell at the given offset from this one, if the table
+        this cell belongs to has such a cell.
+        """
+        if self._table is None:
+            return None
+        return self._table.cell_at(self.x + x_offset, self.y + y_offset)
+
+    @property
+    def _neighbour_up(self) -> Optional[Cell]:
+        return self._neighbour(0, -1)
+
+    @property
+    def _neighbour_down(self) -> Optional[Cell]:
+        return self._neighbour(0, 1)
+
+    @property
+    def _neighbour_left(self) -> Optional[Cell]:
+        return self._neighbour(-1, 0)
+
+    @property
+    def _neighbour_right(self) -> Optional[Cell]:
+        return self._neighbour(1, 0)
+
     def is_blank(self, disregard_whitespace: bool = True):
         """
         Can the contents of the cell be regarded as blank
@@ -1,16 +1,47 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from tidychef.exceptions import CellFormattingError
 
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# One CellFormatting per distinct combination of formatting, see
+# CellFormatting.interned()
+_INTERNED: Dict[Tuple, "CellFormatting"] = {}
+
+
+@dataclass(**SLOTS)
 class CellFormatting:
     bold: Optional[bool] = None
     italic: Optional[bool] = None
     underline: Optional[bool] = None
     hyperlink: Optional[bool] = None
     indent_level: Optional[int] = None
+
+    @staticmethod
+    def interned(
+        bold: Optional[bool] = None,
+        italic: Optional[bool] = None,
+        underline: Optional[bool] = None,
+        hyperlink: Optional[bool] = None,
+        indent_level: Optional[int] = None,
+    ) -> "CellFormatting":
+        """
+        Get the single shared CellFormatting for a given combination of
+        formatting, creating it on first request.
+
+        A sheet typically uses only a handful of distinct formats across
+        all of its cells so readers use this rather than holding a
+        CellFormatting per cell. As such an interned CellFormatting
+        must be treated as read only.
+        """
+        key = (bold, italic, underline, hyperlink, indent_level)
+        cellformat = _INTERNED.get(key)
+        if cellformat is None:
+            cellformat = CellFormatting(*key)
+            _INTERNED[key] = cellformat
+        return cellformat
     
     def is_bold(self) -> bool:
         """
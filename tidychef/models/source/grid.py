@@ -0,0 +1,145 @@
+"""
+A coordinate index for the cells of a table.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional
+
+from tidychef.models.source.cell import Cell
+
+
+class CellGrid:
+    """
+    Maps the (x, y) position of every cell in a table to its cell id.
+
+    Where the cells fill at least DENSITY of their bounding box (which is
+    the norm, as readers create a cell for every blank) the ids are held
+    as a flat row major array over that box, so any coordinate resolves
+    with a single index operation and rows, columns and rectangles are
+    array slices.
+
+    Ragged or very sparse tables fall back to dictionaries of the ids
+    keyed by row then column.
+    """
+
+    DENSITY = 0.5
+
+    def __init__(self, cells: List[Cell]):
+        """
+        Maps the (x, y) position of every cell in a table to its cell id.
+
+        :param cells: The cells of the table, each with its _id already set.
+        """
+        self._dense: Optional[array] = None
+        self._rows: Optional[Dict[int, Dict[int, int]]] = None
+
+        if not cells:
+            self.min_x = self.max_x = self.min_y = self.max_y = 0
+            self.width = self.height = 0
+            self._rows = {}
+            return
+
+        self.min_x = min(c.x for c in cells)
+        self.max_x = max(c.x for c in cells)
+        self.min_y = min(c.y for c in cells)
+        self.max_y = max(c.y for c in cells)
+        self.width = self.max_x - self.min_x + 1
+        self.height = self.max_y - self.min_y + 1
+
+        if len(cells) >= self.width * self.height * self.DENSITY:
+            self._dense = array("i", [-1]) * (self.width * self.height)
+            for cell in cells:
+                self._dense[self._offset(cell.x, cell.y)] = cell._id
+        else:
+            self._rows = {}
+            for cell in cells:
+                self._rows.setdefault(cell.y, {})[cell.x] = cell._id
+            for y, row in self._rows.items():
+                self._rows[y] = dict(sorted(row.items()))
+
+    @property
+    def is_dense(self) -> bool:
+        return self._dense is not None
+
+    def _offset(self, x: int, y: int) -> int:
+        """
+        Position of a coordinate in the dense array.
+        """
+        return (y - self.min_y) * self.width + (x - self.min_x)
+
+    def _in_bounds(self, x: int, y: int) -> bool:
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
+
+    def get(self, x: int, y: int) -> Optional[int]:
+        """
+        The id of the cell at the given coordinate, if there is one.
+
+        :param x: Index on the horizontal axis
+        :param y: Index on the vertical axis
+        :return: A cell id or None
+        """
+        if self._dense is not None:
+            if not self._in_bounds(x, y):
+                return None
+            cell_id = self._dense[self._offset(x, y)]
+            return None if cell_id == -1 else cell_id
+        row = self._rows.get(y)
+        return None if row is None else row.get(x)
+
+    def rectangle(self, x0: int, y0: int, x1: int, y1: int) -> List[int]:
+        """
+        The ids of all cells within the inclusive rectangle bounded
+        by the two coordinates, in row major order.
+
+        :param x0: Lowest horizontal index
+        :param y0: Lowest vertical index
+        :param x1: Highest horizontal index
+        :param y1: Highest vertical index
+        :return: A list of cell ids
+        """
+        x0, x1 = max(x0, self.min_x), min(x1, self.max_x)
+        y0, y1 = max(y0, self.min_y), min(y1, self.max_y)
+        if x0 > x1 or y0 > y1:
+            return []
+
+        ids = []
+        if self._dense is not None:
+            for y in range(y0, y1 + 1):
+                start = self._offset(x0, y)
+                ids.extend(
+                    i for i in self._dense[start : start + x1 - x0 + 1] if i != -1
+                )
+        else:
+            for y in range(y0, y1 + 1):
+                row = self._rows.get(y)
+                if row:
+                    ids.extend(i for x, i in row.items() if x0 <= x <= x1)
+        return ids
+
+    def row(self, y: int) -> List[int]:
+        """
+        The ids of all cells on a given row, left to right.
+
+        :param y: Index on the vertical axis
+        :return: A list of cell ids
+        """
+        return self.rectangle(self.min_x, y, self.max_x, y)
+
+    def column(self, x: int) -> List[int]:
+        """
+        The ids of all cells in a given column, top to bottom.
+
+        :param x: Index on the horizontal axis
+        :return: A list of cell ids
+        """
+        if self._dense is not None:
+            if not self.min_x <= x <= self.max_x:
+                return []
+            return [
+                i
+                for i in self._dense[self._offset(x, self.min_y) :: self.width]
+                if i != -1
+            ]
+        return self.rectangle(x, self.min_y, x, self.max_y)
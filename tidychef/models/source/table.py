@@ -7,18 +7,66 @@ from __future__ import annotations
 import copy
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 import tidychef.datafuncs as dfc
 from tidychef.exceptions import UnalignedTableOperation
 from tidychef.models.source.cell import BaseCell, Cell
-from tidychef.utils import cellutils
+from tidychef.models.source.grid import CellGrid
+from tidychef.utils import bitset
 from tidychef.utils.decorators import dontmutate
 
 
+class CellList(list):
+    """
+    The list of cells held by a Table, counting every change made
+    to it in place, so a bitset derived from the list can be known
+    to be out of date.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+def _counts_changes(name: str):
+    method = getattr(list, name)
+
+    def changed(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    changed.__name__ = name
+    return changed
+
+
+for _name in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(CellList, _name, _counts_changes(_name))
+
+
 class Table:
     """
     Represents a table of data in the form of a list of cell objects.
+
+    The cells held can be expressed either as a list of cells or as
+    a bitset (see tidychef.utils.bitset) of cell ids, where a cell id
+    is the position of the cell in the table the ids were assigned by.
+    Whichever form is not held is derived on demand.
     """
 
     def __init__(self, cells: Optional[List[Cell]] = None):
@@ -28,31 +76,307 @@ class Table:
         :param cells: A list of Cell objects representing the contents
         of a tabulated data source.
         """
-        self.cells = None
+        self._cells: Optional[CellList] = None
+        self._mask: Optional[int] = None
+
+        # The list of cells the bitset was derived from or to,
+        # and its version at the time.
+        self._mask_cells: Optional[CellList] = None
+        self._mask_version: int = 0
+        self._by_id: Optional[List[Cell]] = None
         self._signature = str(uuid.uuid4())
-        self.has_neighbours = False
+        self.grid: Optional[CellGrid] = None
+        self.indexed = False
+
+        # Indexes built lazily, on first use. This dict is shared by every
+        # (shallow) copy of the table, so an index is built once and then
+        # reused by every selection derived from the table.
+        self._lazy_indexes: Dict[str, Any] = {}
+
+    def __copy__(self) -> Table:
+        """
+        A shallow copy of the table, sharing the cell objects but with
+        its own list of them, so the copy can be reselected without
+        changing the original.
+        """
+        new_table = self.__class__.__new__(self.__class__)
+        new_table.__dict__.update(self.__dict__)
+        if self._cells is not None:
+            new_table._cells = CellList(self._cells)
+            if self._mask_is_current():
+                new_table._mask_cells = new_table._cells
+                new_table._mask_version = 0
+            else:
+                new_table._mask = None
+        return new_table
+
+    def __len__(self) -> int:
+        if self._cells is None and self._mask is not None:
+            return bitset.count(self._mask)
+        return len(self.cells)
+
+    @property
+    def cells(self) -> Optional[List[Cell]]:
+        """
+        The cells held by this table, built from the bitset of
+        cell ids where that is all we currently have.
+        """
+        if self._cells is None and self._mask is not None:
+            self._cells = CellList(self.cells_from_mask(self._mask))
+            self._mask_cells, self._mask_version = self._cells, 0
+        return self._cells
+
+    @cells.setter
+    def cells(self, cells: Optional[List[Cell]]):
+        if cells is not None and not isinstance(cells, CellList):
+            cells = CellList(cells)
+        self._cells = cells
+        self._mask = None
+        self._mask_cells = None
+
+    def _mask_is_current(self) -> bool:
+        """
+        Is the bitset of cell ids (where there is one) derived from the
+        list of cells currently held, as it is now.
+        """
+        return self._mask is not None and (
+            self._cells is None
+            or (
+                self._cells is self._mask_cells
+                and self._cells.version == self._mask_version
+            )
+        )
+
+    @property
+    def mask(self) -> int:
+        """
+        The cells held by this table as a bitset of cell ids.
+        """
+        if not self._mask_is_current():
+            cells = self._cells if self._cells is not None else []
+            self._mask = bitset.from_ids(
+                (c._id for c in cells), len(self._by_id) if self._by_id else 0
+            )
+            self._mask_cells = self._cells
+            self._mask_version = self._cells.version if self._cells is not None else 0
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask: int):
+        self._mask = mask
+        self._cells = None
+        self._mask_cells = None
 
     def add_cell(self, cell: Cell):
         if not self.cells:
             self.cells = []
-        self.cells.append(cell)
+        # Called once per cell as a table is read, so count the
+        # change here rather than through CellList.append
+        self._cells.version += 1
+        list.append(self._cells, cell)
+
+    def build_index(self):
+        """
+        Index the table.
+
+        Each cell is given an _id, its position within the table, which is
+        what a bitset of this tables cells is keyed on, and a reference
+        back to this table.
+
+        A CellGrid is then built mapping each (x, y) coordinate to a cell
+        id, which is what the neighbours of a cell (Cell._neighbour_up
+        etc) are derived from.
+
+        The index is only built once per table, no matter how many
+        live tables are constructed over it.
+        """
+        if self.indexed or not self.cells:
+            return
+
+        self._by_id = self.cells
+        for i, cell in enumerate(self.cells):
+            cell._id = i
+            cell._table = self
+
+        # Every cell of the table is held, so its bitset is all ones
+        self._mask = (1 << len(self.cells)) - 1
+        self._mask_cells, self._mask_version = self._cells, self._cells.version
+
+        self.grid = CellGrid(self.cells)
+        self.indexed = True
 
     def build_neighbor_graph(self):
         """
-        Build the neighbor graph for the table.
-        This sets the _neighbour_up, _neighbour_down, _neighbour_left,
-        and _neighbour_right attributes for each cell.
+        Build the neighbor graph for the table, kept as an alias of
+        build_index(), from which the neighbours of a cell are now
+        derived.
         """
+        self.build_index()
 
-        cell_map = {(cell.x, cell.y): cell for cell in self.cells}
+    @property
+    def has_neighbours(self) -> bool:
+        """
+        Whether the neighbours of the cells of this table can be
+        derived, i.e. whether the table has been indexed.
+        """
+        return self.indexed
 
-        for cell in self.cells:
-            # Set neighbors based on position
-            cell._neighbour_up = cell_map.get((cell.x, cell.y - 1))
-            cell._neighbour_down = cell_map.get((cell.x, cell.y + 1))
-            cell._neighbour_left = cell_map.get((cell.x - 1, cell.y))
-            cell._neighbour_right = cell_map.get((cell.x + 1, cell.y))
-        self.has_neighbours = True
+    @property
+    def value_index(self) -> Dict[str, List[int]]:
+        """
+        An inverted index of cell value to the ids of the cells
+        holding that value, built on first use.
+
+        Note: as its built on first use, this index reflects cell
+        values as they were at that time.
+        """
+        index = self._lazy_indexes.get("value")
+        if index is None:
+            index = {}
+            for cell in self._by_id:
+                index.setdefault(cell.value, []).append(cell._id)
+            self._lazy_indexes["value"] = index
+        return index
+
+    def ids_with_value(self, value: str) -> List[int]:
+        """
+        The ids of all cells of the table whose value is exactly
+        the value provided, resolved via the value index.
+
+        :param value: The cell value wanted.
+        """
+        by_id = self._by_id
+        return [i for i in self.value_index.get(value, ()) if by_id[i].value == value]
+
+    @property
+    def trigram_index(self) -> Dict[str, Set[str]]:
+        """
+        An index of every three character substring to the distinct
+        cell values containing it, built on first use.
+
+        Note: as its built on first use, this index reflects cell
+        values as they were at that time.
+        """
+        index = self._lazy_indexes.get("trigram")
+        if index is None:
+            index = {}
+            for value in self.value_index:
+                for i in range(len(value) - 2):
+                    index.setdefault(value[i : i + 3], set()).add(value)
+            self._lazy_indexes["trigram"] = index
+        return index
+
+    def ids_containing(self, substr: str) -> List[int]:
+        """
+        The ids of all cells of the table whose value contains the
+        substring provided.
+
+        Candidate values are those holding every trigram of the
+        substring, so only those are checked in full. Substrings
+        shorter than a trigram are checked against each distinct
+        value instead.
+
+        :param substr: The substring wanted.
+        """
+        if len(substr) < 3:
+            candidates = self.value_index.keys()
+        else:
+            trigram_index = self.trigram_index
+            postings = []
+            for i in range(len(substr) - 2):
+                values = trigram_index.get(substr[i : i + 3])
+                if not values:
+                    return []
+                postings.append(values)
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+
+        by_id = self._by_id
+        value_index = self.value_index
+        return [
+            i
+            for value in candidates
+            if substr in value
+            for i in value_index[value]
+            if substr in by_id[i].value
+        ]
+
+    def _cells_from_ids(self, ids: List[int]) -> List[Cell]:
+        by_id = self._by_id
+        return [by_id[i] for i in ids]
+
+    def cells_from_mask(self, mask: int) -> List[Cell]:
+        """
+        The cells of the table whose ids are set in the provided
+        bitset, in cell id order.
+
+        :param mask: A bitset of cell ids.
+        """
+        return self._cells_from_ids(bitset.to_ids(mask))
+
+    def held_cells_from_mask(self, mask: int) -> List[Cell]:
+        """
+        The cells held by the table whose ids are set in the provided
+        bitset, in the order the table holds them.
+
+        :param mask: A bitset of cell ids.
+        """
+        if self._cells is None:
+            return self.cells_from_mask(mask & self.mask)
+        ids = set(bitset.to_ids(mask))
+        return [cell for cell in self._cells if cell._id in ids]
+
+    def reselect(self, mask: int):
+        """
+        Hold just the currently held cells whose ids are set in the
+        provided bitset, keeping the order they are held in.
+
+        :param mask: A bitset of cell ids.
+        """
+        if self._cells is None:
+            # Held as a bitset, so already in cell id order
+            self.mask = mask & self.mask
+        else:
+            self.cells = self.held_cells_from_mask(mask)
+
+    def cell_at(self, x: int, y: int) -> Optional[Cell]:
+        """
+        The cell at the given coordinate, or None where the
+        table has no such cell.
+
+        :param x: Index on the horizontal axis
+        :param y: Index on the vertical axis
+        """
+        cell_id = self.grid.get(x, y)
+        return None if cell_id is None else self._by_id[cell_id]
+
+    def cells_on_row(self, y: int) -> List[Cell]:
+        """
+        All cells of the table on a given row, left to right.
+
+        :param y: Index on the vertical axis
+        """
+        return self._cells_from_ids(self.grid.row(y))
+
+    def cells_on_column(self, x: int) -> List[Cell]:
+        """
+        All cells of the table in a given column, top to bottom.
+
+        :param x: Index on the horizontal axis
+        """
+        return self._cells_from_ids(self.grid.column(x))
+
+    def cells_in_rectangle(self, x0: int, y0: int, x1: int, y1: int) -> List[Cell]:
+        """
+        All cells of the table within the inclusive rectangle bounded
+        by the two coordinates, in row major order.
+
+        :param x0: Lowest horizontal index
+        :param y0: Lowest vertical index
+        :param x1: Highest horizontal index
+        :param y1: Highest vertical index
+        """
+        return self._cells_from_ids(self.grid.rectangle(x0, y0, x1, y1))
 
 
 class LiveTable:
@@ -74,15 +398,31 @@ class LiveTable:
     :param name: The name of the table where it has a name
     :param source: The filename, url or identifier of the source that has
     been ingested.
+    :param share_pristine: When True (the default) the filtered table is a
+    selection over the very same cell objects as the pristine table, so one
+    set of cells and one neighbour graph exist per sheet. When False the
+    filtered table is built from a deep copy of the pristine table, with
+    its own cells and index.
     """
 
-    def __init__(self, data_table: Table, name: str = None, source: str = None):
+    def __init__(
+        self,
+        data_table: Table,
+        name: str = None,
+        source: str = None,
+        share_pristine: bool = True,
+    ):
 
         self.pristine: Table = data_table
-        self.filtered: Table = copy.deepcopy(data_table)
-
-        self.filtered.build_neighbor_graph()  # <- Neighbors built AFTER deep copy
-        self.pristine.build_neighbor_graph()  # <- Neighbors built AFTER deep copy
+        if share_pristine:
+            # The filtered table is just a view over the pristine cells, selections
+            # derived from it only ever copy the list holding the cells.
+            self.pristine.build_index()
+            self.filtered: Table = copy.copy(data_table)
+        else:
+            self.filtered: Table = copy.deepcopy(data_table)
+            self.filtered.build_index()
+            self.pristine.build_index()
 
         self._name: Optional[str] = name
         self.source: Optional[Union[Path, str]] = source
@@ -96,38 +436,8 @@ class LiveTable:
         self._maximum_pristine_y: Optional[int] = None
         self._minimum_pristine_y: Optional[int] = None
 
-        # -------------------------
-        # Indexes for faster access
-        # -------------------------
-        # We don't really want to compare eveything to everything on making seletions
-        # as it can really slow down the process.
-        # So we create indexes for the cells in the table.
-        self._column_index: Dict[str, List[Cell]] = {}  # "A": [cell1, cell2, ...]
-        self._row_index: Dict[int, List[Cell]] = {}  # 1: [cell1, cell2, ...]
-        self._x_index: Dict[int, List[Cell]] = {}  # 0: [cell1, cell2, ...]
-        self._y_index: Dict[int, List[Cell]] = {}  # 0: [cell1, cell2, ...]
-
-        for cell in self.pcells:
-            # Column letter index
-            col_letter = cellutils.x_to_letters(cell.x)
-            if col_letter not in self._column_index:
-                self._column_index[col_letter] = []
-            self._column_index[col_letter].append(cell)
-
-            # Row number index
-            row_num = cellutils.y_to_number(cell.y)
-            if row_num not in self._row_index:
-                self._row_index[row_num] = []
-            self._row_index[row_num].append(cell)
-
-            # X/Y coordinate indices
-            if cell.x not in self._x_index:
-                self._x_index[cell.x] = []
-            self._x_index[cell.x].append(cell)
-
-            if cell.y not in self._y_index:
-                self._y_index[cell.y] = []
-            self._y_index[cell.y].append(cell)
+        # Lookups by coordinate, row, column or rectangle are made against
+        # the CellGrid index of the table, see Table.build_index().
 
     @property
     def maximum_pristine_x(self) -> int:
@@ -192,7 +502,7 @@ class LiveTable:
         return self
 
     def __len__(self):
-        return len(self.cells)
+        return len(self.filtered)
 
     @property
     def name(self):
@@ -234,7 +544,7 @@ class LiveTable:
         """
         Have any selections been made
         """
-        return len(self.pristine.cells) != len(self.filtered.cells)
+        return len(self.pristine) != len(self.filtered)
 
     @name.setter
     def name(self, name: str):
@@ -247,6 +557,40 @@ class LiveTable:
         """
         return self.filtered._signature
 
+    def _confirm_aligned(self, other_input: LiveTable):
+        """
+        Raise if the other selection was not taken from the exact same
+        table as this one.
+
+        :param other_input: Another instance of this class we want to
+        combine with this one.
+        """
+        if self.signature != other_input.signature:
+            raise UnalignedTableOperation(
+                "Selections can only be combined or previewed in combination "
+                "if they are taken from the exact same table as taken from a single "
+                "instance of a parsed input."
+            )
+
+    def _select_in_order(self, mask: int, other_input: LiveTable):
+        """
+        Select the cells whose ids are set in the provided bitset,
+        keeping the order of the cells of this selection, followed
+        by any cells only in the other selection, in its order.
+
+        :param mask: A bitset of the ids of the cells to select.
+        :param other_input: The other instance of this class the
+        bitset was combined with.
+        """
+        added = mask & ~self.filtered.mask
+        if self.filtered._cells is None and not added:
+            # Already held in cell id order, so no need to list the cells
+            self.filtered.mask = mask
+        else:
+            self.filtered.cells = self.filtered.held_cells_from_mask(
+                mask
+            ) + other_input.filtered.held_cells_from_mask(added)
+
     @dontmutate
     def __sub__(self, other_input: LiveTable):
         """
@@ -260,19 +604,12 @@ class LiveTable:
         whose selected cells we wish to subtract from the
         selected cells of this instance.
         """
-
-        if self.signature != other_input.signature:
-            raise UnalignedTableOperation(
-                "Selections can only be combined or previewed in combination "
-                "if they are taken from the exact same table as taken from a single "
-                "instance of a parsed input."
-            )
-
-        cells = self.cells if self.selections_made() else self.pcells
-        self.cells = dfc.cells_not_in(cells, other_input.cells)
+        self._confirm_aligned(other_input)
+        self._select_in_order(
+            self.filtered.mask & ~other_input.filtered.mask, other_input
+        )
         return self
 
-    # TODO - type hint this
     @dontmutate
     def __or__(self, other_input: LiveTable):
         """
@@ -286,15 +623,48 @@ class LiveTable:
         whose cells we want to Union | with the cells of
         this class.
         """
-        if self.signature != other_input.signature:
-            raise UnalignedTableOperation(
-                "Selections can only be combined or previewed in combination "
-                "if they are taken from the exact same table as taken from a single "
-                "instance of a parsed input."
-            )
+        self._confirm_aligned(other_input)
+        self._select_in_order(
+            self.filtered.mask | other_input.filtered.mask, other_input
+        )
+        return self
+
+    @dontmutate
+    def __and__(self, other_input: LiveTable):
+        """
+        Implements "&" operator, intersection.
+
+        Selects just the cells that are in both this selection and
+        another selection from the same distinct and currently selected
+        table. Provided they are derived from the same initial BaseInput.
 
-        new_cells = dfc.cells_not_in(other_input.cells, self.cells)
-        self.cells = self.cells + new_cells
+        :param other_input: Another instance of this class
+        whose cells we want to intersect & with the cells of
+        this class.
+        """
+        self._confirm_aligned(other_input)
+        self._select_in_order(
+            self.filtered.mask & other_input.filtered.mask, other_input
+        )
+        return self
+
+    @dontmutate
+    def __xor__(self, other_input: LiveTable):
+        """
+        Implements "^" operator, symmetric difference.
+
+        Selects just the cells that are in exactly one of this selection
+        and another selection from the same distinct and currently selected
+        table. Provided they are derived from the same initial BaseInput.
+
+        :param other_input: Another instance of this class
+        whose cells we want to symmetrically difference ^ with the cells of
+        this class.
+        """
+        self._confirm_aligned(other_input)
+        self._select_in_order(
+            self.filtered.mask ^ other_input.filtered.mask, other_input
+        )
         return self
 
     # TODO - type hint this
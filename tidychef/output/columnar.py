@@ -0,0 +1,209 @@
+"""
+A compact, column at a time, representation of tidy data.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Union
+
+from tidychef.models.source.cell import BaseCell, VirtualCell
+
+
+def _cell_key(cell: BaseCell) -> Hashable:
+    """
+    A key that is equal for two cells where the cells are
+    equal, i.e. have the same type, value and position.
+
+    :param cell: A tidychef Cell or VirtualCell.
+    """
+    return (cell.__class__, cell.value, cell.x, cell.y)
+
+
+class ColumnarData:
+    """
+    Tidy data held a column at a time. Each column is an array of
+    codes into a dictionary of the distinct cells of that column, so a
+    dimension column holds each of its (few) cells once, with their
+    provenance, rather than once per row.
+
+    Behaves as the list of rows (header row first) that it represents.
+    """
+
+    def __init__(self, header_row: List[VirtualCell]):
+        """
+        Tidy data held a column at a time, initially without rows.
+
+        :param header_row: The header cell of each column.
+        """
+        self.header_row = header_row
+        self.codes: List[array] = [array("l") for _ in header_row]
+        self.cells: List[List[BaseCell]] = [[] for _ in header_row]
+        self._index: List[Dict[Hashable, int]] = [{} for _ in header_row]
+        self._row_count = 0
+
+    def __copy__(self) -> ColumnarData:
+        """
+        A copy that can be added to without changing the original,
+        sharing the (unchanging) cells.
+        """
+        new = ColumnarData.__new__(ColumnarData)
+        new.header_row = self.header_row
+        new.codes = [array("l", x) for x in self.codes]
+        new.cells = [list(x) for x in self.cells]
+        new._index = [dict(x) for x in self._index]
+        new._row_count = self._row_count
+        return new
+
+    def __len__(self) -> int:
+        return self._row_count + 1
+
+    def __iter__(self) -> Iterator[List[BaseCell]]:
+        yield self.header_row
+        for row_codes in zip(*self.codes):
+            yield [cells[code] for cells, code in zip(self.cells, row_codes)]
+        if not self.codes:
+            for _ in range(self._row_count):
+                yield []
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[List[BaseCell], List[List[BaseCell]]]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if index == 0:
+            return self.header_row
+        if not 0 < index < len(self):
+            raise IndexError("ColumnarData row index out of range")
+        return [cells[codes[index - 1]] for cells, codes in zip(self.cells, self.codes)]
+
+    def _encode(self, column: int, cells: List[BaseCell]) -> array:
+        """
+        The codes of the given cells in the dictionary of a column,
+        adding any cells the dictionary does not yet have.
+
+        :param column: The position of the column.
+        :param cells: The cells to encode.
+        :return: An array of codes, one per cell.
+        """
+        dictionary, index = self.cells[column], self._index[column]
+
+        # Most cells of a dimension column are the same few objects, so
+        # only work out the key once per object. The objects are all
+        # alive for the duration of this call so their ids are unique.
+        by_id: Dict[int, int] = {}
+        codes = array("l")
+        for cell in cells:
+            code = by_id.get(id(cell))
+            if code is None:
+                key = _cell_key(cell)
+                code = index.get(key)
+                if code is None:
+                    code = index[key] = len(dictionary)
+                    dictionary.append(cell)
+                by_id[id(cell)] = code
+            codes.append(code)
+        return codes
+
+    def append_columns(self, columns: List[List[BaseCell]], row_count: int):
+        """
+        Add rows, provided a column at a time.
+
+        :param columns: A list of cells per column, all of the same length.
+        :param row_count: The number of rows being added.
+        """
+        for i, cells in enumerate(columns):
+            self.codes[i].extend(self._encode(i, cells))
+        self._row_count += row_count
+
+    def extend(self, rows: Union[ColumnarData, List[List[BaseCell]]]):
+        """
+        Add all but the header row of another ColumnarData, or of
+        a list of rows.
+
+        :param rows: The ColumnarData or list of rows (header row first).
+        """
+        if isinstance(rows, ColumnarData):
+            for i in range(len(self.codes)):
+                remap = self._encode(i, rows.cells[i])
+                self.codes[i].extend(remap[code] for code in rows.codes[i])
+            self._row_count += rows._row_count
+        else:
+            rows = rows[1:]
+            self.append_columns(
+                [list(column) for column in zip(*rows)] or [[]] * len(self.codes),
+                len(rows),
+            )
+
+    def value_rows(self) -> Iterator[List[str]]:
+        """
+        The value of every cell, a row at a time, header row first.
+        """
+        yield [x.value for x in self.header_row]
+        values = [[x.value for x in cells] for cells in self.cells]
+        for row_codes in zip(*self.codes):
+            yield [column[code] for column, code in zip(values, row_codes)]
+        if not self.codes:
+            for _ in range(self._row_count):
+                yield []
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """
+        The values of every column, keyed by the column header.
+        """
+        output_dict: Dict[str, List[str]] = {}
+        for header_cell, cells, codes in zip(self.header_row, self.cells, self.codes):
+            values = [x.value for x in cells]
+            output_dict[header_cell.value] = [values[code] for code in codes]
+        return output_dict
+
+    def drop_duplicates(
+        self, positions: Optional[List[int]] = None
+    ) -> List[Tuple[int, ...]]:
+        """
+        Remove every row with the same values as an earlier row.
+
+        Cells with the same value can differ by position, so each code
+        is first mapped to a code for its value, then rows are compared
+        by the tuple of their value codes.
+
+        :param positions: The positions of the columns to compare,
+        where not provided all columns are compared.
+        :return: The codes of each row removed.
+        """
+        if positions is None:
+            positions = list(range(len(self.codes)))
+
+        value_codes: List[List[int]] = []
+        for i in positions:
+            by_value: Dict[str, int] = {}
+            value_codes.append(
+                [by_value.setdefault(x.value, len(by_value)) for x in self.cells[i]]
+            )
+
+        seen = set()
+        keep = []
+        duplicates = []
+        for i, row_codes in enumerate(zip(*[self.codes[i] for i in positions])):
+            key = tuple(column[code] for column, code in zip(value_codes, row_codes))
+            if key in seen:
+                duplicates.append(i)
+            else:
+                seen.add(key)
+                keep.append(i)
+
+        removed = [tuple(codes[i] for codes in self.codes) for i in duplicates]
+        if duplicates:
+            self.codes = [array("l", (codes[i] for i in keep)) for codes in self.codes]
+            self._row_count = len(keep)
+        return removed
+
+    def decode(self, row_codes: Tuple[int, ...]) -> List[BaseCell]:
+        """
+        The cells of a row, given its codes.
+
+        :param row_codes: A code per column.
+        """
+        return [cells[code] for cells, code in zip(self.cells, row_codes)]
@@ -1,21 +1,65 @@
 from __future__ import annotations
 
+import copy
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from hashlib import blake2b
+from os import linesep
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import tabulate
 from IPython.display import HTML, display
 
 from tidychef.column.base import BaseColumn
-from tidychef.exceptions import DroppingNonColumnError, MisalignedHeadersError
+from tidychef.exceptions import (
+    DroppingNonColumnError,
+    DuplicateKeyColumnError,
+    LookupCheckError,
+    MisalignedHeadersError,
+)
 from tidychef.lookup.engines.horizontal_condition import HorizontalCondition
-from tidychef.models.source.cell import VirtualCell
+from tidychef.models.source.cell import BaseCell, Cell, VirtualCell
 from tidychef.models.source.table import LiveTable
 from tidychef.notebook.ipython import in_notebook
 from tidychef.notebook.preview.html.tidy_data import tidy_data_as_html_table_string
 from tidychef.output.base import BaseOutput
-from tidychef.utils.decorators import dontmutate
+from tidychef.output.columnar import ColumnarData
+from tidychef.output.workers import resolve_in_processes
+
+# The number of observations resolved at once when the
+# tidy data is streamed rather than kept as rows.
+CHUNK_SIZE = 10000
+
+
+@dataclass
+class RowPlan:
+    """
+    How the rows of a TidyData are assembled: where each column is
+    output and the order the columns are resolved in.
+
+    Compiled once per transform, so the drop check and header happen
+    once, and the same plan is then used to resolve every band of the
+    observations, whether in turn, in threads or in worker processes
+    (see workers.py). Working it out per band costs little, as the
+    columns are resolved a whole band at a time, so this is about
+    the bands sharing one plan rather than speed.
+
+    :param header_row: The header cells of the columns being output.
+    :param observation_slot: The output position of the observations,
+    None where dropped.
+    :param standard_columns: The output position (None where dropped)
+    and column of each standard column, in resolution order.
+    :param condition_schedule: The output position (None where dropped)
+    and column of each horizontal condition, grouped by priority in
+    resolution order.
+    """
+
+    header_row: List[VirtualCell]
+    observation_slot: Optional[int]
+    standard_columns: List[Tuple[Optional[int], BaseColumn]]
+    condition_schedule: List[List[Tuple[Optional[int], BaseColumn]]]
 
 
 class TidyData(BaseOutput):
@@ -25,6 +69,11 @@ class TidyData(BaseOutput):
         *columns,
         obs_apply: Callable = None,
         drop: Optional[List[str]] = None,
+        threads: int = 1,
+        broadcast: bool = True,
+        columnar: bool = False,
+        workers: int = 1,
+        start_method: Optional[str] = None,
     ):
         """
         A class to generate a basic representation of the
@@ -34,6 +83,23 @@ class TidyData(BaseOutput):
         :param *columns: 1-n Columns to resolve against the observations.
         :param obs_apply: Callable to make changes to values in the observation column.
         :param drop: Columns by label to drop after cells have been resolved.
+        :param threads: The number of threads to resolve the columns with,
+        each resolving a band of the observations.
+        :param broadcast: Where the observations form a block (typically a dense
+        rectangle) with a column's lookups depending only on the column or only
+        on the row of an observation, resolve once per column or row of the
+        block and broadcast the result.
+        :param columnar: Hold the transformed data a column at a time, with
+        each column as codes into the distinct cells of that column, rather
+        than as a list of rows of cells.
+        :param workers: The number of processes to resolve the columns with,
+        each resolving bands of the observations. Starting the processes and
+        sending them the observations has a cost, so this only pays off with
+        a CPU per process and many observations.
+        :param start_method: How the worker processes are started, one of
+        "spawn", "fork" or "forkserver", where not provided the default for
+        the platform. Unless forked, the TidyData must be picklable, so apply
+        and resolver callables cannot be lambdas.
         """
 
         assert (
@@ -53,6 +119,11 @@ class TidyData(BaseOutput):
         self.columns: Tuple[BaseColumn] = columns
         self.drop = drop if drop else []
         self.obs_apply = obs_apply
+        self.threads = threads
+        self.broadcast = broadcast
+        self.columnar = columnar
+        self.workers = workers
+        self.start_method = start_method
 
         # Don't transform until told to, but once we have
         # only do it once.
@@ -131,12 +202,16 @@ class TidyData(BaseOutput):
          [ "Peter", "Winston" ]
         ]
         """
-        string_table = []
         self._transform()
-        for row in self._data:
-            string_row = [x.value for x in row]
-            string_table.append(string_row)
-        return string_table
+        return list(self._value_rows())
+
+    def _value_rows(self) -> Iterator[List[str]]:
+        """
+        The value of every cell, a row at a time, header row first.
+        """
+        if isinstance(self._data, ColumnarData):
+            return self._data.value_rows()
+        return ([x.value for x in row] for row in self.iter_rows())
 
     def to_dict(self) -> dict:
         """
@@ -148,18 +223,21 @@ class TidyData(BaseOutput):
             etc
         }
         """
-        self._transform()
+        if isinstance(self._data, ColumnarData):
+            return self._data.to_dict()
+
+        rows = self.iter_rows()
         output_dict: Dict[str, List[str]] = {}
 
         count = 0
         translater: Dict[i, str] = {}
 
-        for column_header_cell in self._data[0]:
+        for column_header_cell in next(rows):
             output_dict[column_header_cell.value] = []
             translater[count] = column_header_cell.value
             count += 1
 
-        for row in self._data[1:]:
+        for row in rows:
             for i, item in enumerate(row):
                 output_dict[translater[i]].append(item.value)
 
@@ -205,38 +283,111 @@ class TidyData(BaseOutput):
             into to join multiple TidyData sources into one.
         """
 
-        tidy_data = tidy_data_objects[0]
-        for remaining_tidy_data in tidy_data_objects[1:]:
-            tidy_data += remaining_tidy_data
-
-        return tidy_data
+        return TidyData._concatenate(tidy_data_objects)
 
-    @dontmutate
     def __add__(self, other_tidy_data: TidyData):
+        return TidyData._concatenate([self, other_tidy_data])
+
+    @staticmethod
+    def _concatenate(tidy_data_objects: List[TidyData]) -> TidyData:
+        """
+        Join many TidyData objects into a new TidyData, checking the
+        headers match once and copying every row once.
+
+        :param tidy_data_objects: The TidyData objects to join, in order.
+        :return: A new TidyData holding the rows of all of them.
+        """
         # Make sure all transforms have happened
-        self._transform()
-        other_tidy_data._transform()
+        for tidy_data_object in tidy_data_objects:
+            tidy_data_object._transform()
 
-        # Error if we're joining two TidyData objects
+        # Error if we're joining TidyData objects
         # with different headers
-        if self._data[0] != other_tidy_data._data[0]:
-            raise MisalignedHeadersError(
-                f"""
-                You are attempting to sum two tidy data
-                outputs but they do not have the same
-                column headers.
+        TidyData._check_headers_align([x._data[0] for x in tidy_data_objects])
+
+        first = tidy_data_objects[0]
+        tidy_data = copy.copy(first)
+        if isinstance(first._data, ColumnarData):
+            data = copy.copy(first._data)
+            for remaining_tidy_data in tidy_data_objects[1:]:
+                data.extend(remaining_tidy_data._data)
+        else:
+            # Since the headers match, join all but the header
+            # row from each of the remaining sources
+            data = list(first._data)
+            for remaining_tidy_data in tidy_data_objects[1:]:
+                data.extend(remaining_tidy_data._data[1:])
+        tidy_data._data = data
+        return tidy_data
 
-                TidyData1 headers:
-                {self._data[0]}
+    @staticmethod
+    def _check_headers_align(header_rows: List[List[BaseCell]]):
+        """
+        Raise where the header rows of TidyData objects being
+        joined together are not all the same.
 
-                TidyData2 headers:
-                {other_tidy_data._data[0]}
-            """
+        :param header_rows: The header row of each TidyData.
+        """
+        for header_row in header_rows[1:]:
+            if header_row != header_rows[0]:
+                raise MisalignedHeadersError(
+                    f"""
+                    You are attempting to sum two tidy data
+                    outputs but they do not have the same
+                    column headers.
+
+                    TidyData1 headers:
+                    {header_rows[0]}
+
+                    TidyData2 headers:
+                    {header_row}
+                """
+                )
+
+    def check(self, max_reported: int = 20):
+        """
+        A dry run of the lookups of every column against every
+        observation, raising a single exception reporting every
+        observation that a column cannot resolve a lookup for.
+
+        The output itself is not created. Horizontal condition
+        columns are not checked, as they depend on the values
+        resolved for the other columns.
+
+        :param max_reported: The most failing observations to
+        list per column in the exception message.
+        :return: The TidyData, where every lookup can be resolved.
+        """
+        observations = list(self.observations)
+
+        failures: Dict[str, List[Cell]] = {}
+        for column in self.columns:
+            failed = column.engine.unresolvable(observations)
+            if failed:
+                failures[column.label] = failed
+
+        if failures:
+            report = []
+            for label, failed in failures.items():
+                report.append(
+                    f'Column "{label}" cannot be resolved for {len(failed)} observation(s):'
+                )
+                report += [
+                    f'    {c._excel_ref()}, x position "{c.x}", y position "{c.y}", value: "{c.value}"'
+                    for c in failed[:max_reported]
+                ]
+                if len(failed) > max_reported:
+                    report.append(f"    ...and {len(failed) - max_reported} more.")
+
+            raise LookupCheckError(
+                f"""
+When checking the lookups for table: {self.observations.name} the
+following observations could not be resolved:
+{linesep.join(report)}
+                """,
+                failures=failures,
             )
 
-        # Since the headers match, join all but the header
-        # row from the new source
-        self._data += other_tidy_data._data[1:]
         return self
 
     def _transform(self):
@@ -271,129 +422,284 @@ class TidyData(BaseOutput):
         # acquired.
 
         if not self._data:
-            grid = []
-            drop_count = 0
-
             # Observations always has the table name so
             # spread it around to cover those columns that
             # are created via static methods.
             for column in self.columns:
                 column._table == self.observations._name
 
-            # We need to carefully construct our lists of lists
-            # such that the HorizontalCondition columns are created last
-            # Ordering will be restored at the end via this list.
-            ordered_column_header_cells = [
-                VirtualCell(value=self.observations.label)
-            ] + [VirtualCell(value=x.label) for x in self.columns]
-
-            # Obs label
-            if self.observations.label in self.drop:
-                unordered_header_row_cells = []
-                drop_count += 1
+            plan = self._compile_plan()
+            observations = list(self.observations)
+            if self.columnar:
+                # Encode a chunk at a time, so the rows of cells are
+                # never all held at once.
+                data = ColumnarData(plan.header_row)
+                for band, columns in self._resolve_chunks(
+                    observations, plan, CHUNK_SIZE
+                ):
+                    data.append_columns(columns, len(band))
+                self._data = data
             else:
-                unordered_header_row_cells = [
-                    VirtualCell(value=self.observations.label)
-                ]
+                grid = [plan.header_row]
+                for band, columns in self._resolve_chunks(
+                    observations, plan, max(len(observations), 1)
+                ):
+                    grid.extend(self._as_rows(band, columns))
+                self._data = grid
+
+    def iter_rows(
+        self,
+        chunk_size: int = CHUNK_SIZE,
+        unique: bool = False,
+        keys: Optional[List[str]] = None,
+    ) -> Iterator[List[BaseCell]]:
+        """
+        Iterate the rows of the tidy data, header row first.
+
+        Where the TidyData has not already been transformed the rows
+        are resolved chunk_size observations at a time and are not
+        kept, so only one chunk of rows is held in memory at once.
+
+        :param chunk_size: The number of observations to resolve at once.
+        :param unique: Skip rows with the same values as an earlier row.
+        Only a 16 byte digest of the values of each row is remembered,
+        so this works for tidy data too big to hold in memory.
+        :param keys: The labels of the columns to compare when skipping
+        duplicate rows, where not provided every column is compared.
+        :return: An iterator of rows of cells.
+        """
+        rows = self._iter_all_rows(chunk_size)
+        if not unique:
+            yield from rows
+            return
+
+        header_row = next(rows)
+        positions = self._key_positions(header_row, keys)
+        yield header_row
+
+        seen = set()
+        for row in rows:
+            digest = blake2b(
+                repr(tuple(row[i].value for i in positions)).encode(),
+                digest_size=16,
+            ).digest()
+            if digest not in seen:
+                seen.add(digest)
+                yield row
+
+    def _iter_all_rows(self, chunk_size: int) -> Iterator[List[BaseCell]]:
+        """
+        Iterate every row of the tidy data, header row first,
+        resolving them chunk_size observations at a time where
+        the TidyData has not already been transformed.
 
-            # Standard Column labels
-            for column in [
-                x for x in self.columns if not isinstance(x.engine, HorizontalCondition)
-            ]:
-                if column.label not in self.drop:
-                    unordered_header_row_cells.append(VirtualCell(value=column.label))
-                else:
-                    drop_count += 1
-
-            # Horizontal Condition
-            for column in [
-                x for x in self.columns if isinstance(x.engine, HorizontalCondition)
-            ]:
-                if column.label not in self.drop:
-                    unordered_header_row_cells.append(VirtualCell(value=column.label))
-                else:
-                    drop_count += 1
+        :param chunk_size: The number of observations to resolve at once.
+        :return: An iterator of rows of cells.
+        """
+        if self._data:
+            yield from self._data
+            return
 
-            # Conditional column labels
-            header_row = []
-            for column_header_cell in ordered_column_header_cells:
-                if column_header_cell in unordered_header_row_cells:
-                    header_row.append(column_header_cell)
+        plan = self._compile_plan()
+        yield plan.header_row
 
-            grid.append(header_row)
+        observations = list(self.observations)
+        for band, columns in self._resolve_chunks(observations, plan, chunk_size):
+            yield from self._as_rows(band, columns)
 
-            # If user has opted to drop a column that does
-            # not exist, we need to tell them.
-            if drop_count != len(self.drop):
-                raise DroppingNonColumnError(
-                    f"""
-                    You're attempting to drop one or more columns that
-                    do not exist in the data.
+    @staticmethod
+    def _as_rows(
+        observations: List[Cell], columns: List[List[BaseCell]]
+    ) -> List[List[BaseCell]]:
+        """
+        The rows of the output columns resolved for some observations.
+
+        :param observations: The observation cells the columns were resolved for.
+        :param columns: A list of cells per output column.
+        :return: A list of rows of cells.
+        """
+        if columns:
+            return list(map(list, zip(*columns)))
+        return [[] for _ in observations]
+
+    def _resolve_chunks(
+        self, observations: List[Cell], plan: RowPlan, chunk_size: int
+    ) -> Iterator[Tuple[List[Cell], List[List[BaseCell]]]]:
+        """
+        Resolve the output columns for the provided observations,
+        at most chunk_size observations at a time, with worker
+        processes where asked for.
+
+        :param observations: The observation cells to resolve columns for.
+        :param plan: How the rows are assembled.
+        :param chunk_size: The number of observations to resolve at once.
+        :return: An iterator of each band of observations, in order, with
+        the output columns resolved for it.
+        """
+        if self.workers > 1 and len(observations) > 1:
+            band_size = min(chunk_size, -(-len(observations) // self.workers))
+            yield from resolve_in_processes(
+                self, observations, plan, self.workers, band_size, self.start_method
+            )
+        else:
+            for i in range(0, len(observations), chunk_size):
+                yield from self._resolve_bands(observations[i : i + chunk_size], plan)
 
-                    You're dropping: {self.drop}
+    def _resolve_bands(
+        self, observations: List[Cell], plan: RowPlan
+    ) -> Iterator[Tuple[List[Cell], List[List[BaseCell]]]]:
+        """
+        Resolve the output columns for the provided observations, with
+        threads where asked for.
 
-                    Columns are: {[x.label for x in self.columns]} 
-                    """
+        :param observations: The observation cells to resolve columns for.
+        :param plan: How the rows are assembled.
+        :return: An iterator of each band of observations, in order, with
+        the output columns resolved for it.
+        """
+        # Lookups are resolved a whole column at a time, rather than
+        # an observation at a time, so each lookup engine can resolve
+        # every observation in a single pass. With threads, each thread
+        # does so for its own band of the observations.
+        if self.threads > 1 and len(observations) > 1:
+            band_size = -(-len(observations) // self.threads)
+            bands = [
+                observations[i : i + band_size]
+                for i in range(0, len(observations), band_size)
+            ]
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                yield from zip(
+                    bands,
+                    executor.map(lambda band: self._resolve_columns(band, plan), bands),
                 )
+        else:
+            yield observations, self._resolve_columns(observations, plan)
 
-            for observation in self.observations:
-                row_as_dict = {}
+    def _compile_plan(self) -> RowPlan:
+        """
+        Work out, once per transform, everything about how the rows
+        are assembled that does not depend on the observations.
 
-                # note we ALWAYS want values in the column_value_dict
-                # regardless of whether we're dropping the column
-                column_value_dict: Dict[str, str] = {}
-                column_value_dict[self.observations.label] = observation.value
+        :return: A RowPlan for the columns of this TidyData.
+        """
+        labels = [self.observations.label] + [x.label for x in self.columns]
 
-                if self.observations.label not in self.drop:
-                    if self.obs_apply is not None:
-                        observation.value = self.obs_apply(observation.value)
-                    row_as_dict[self.observations.label] = observation
+        # If user has opted to drop a column that does
+        # not exist, we need to tell them.
+        drop_count = sum(1 for label in labels if label in self.drop)
+        if drop_count != len(self.drop):
+            raise DroppingNonColumnError(
+                f"""
+                You're attempting to drop one or more columns that
+                do not exist in the data.
 
-                # Resolve the standard columns first
-                standard_columns = [
-                    x
-                    for x in self.columns
-                    if not isinstance(x.engine, HorizontalCondition)
-                ]
-                for column in standard_columns:
-                    column_cell = column.resolve_column_cell_from_obs_cell(observation)
-                    column_value_dict[column.label] = column_cell.value
-                    if column.label not in self.drop:
-                        row_as_dict[column.label] = column_cell
+                You're dropping: {self.drop}
 
-                # Now we know the standard column values, resolve the
-                # horizontal conditions
-                condition_columns = [
-                    x for x in self.columns if isinstance(x.engine, HorizontalCondition)
-                ]
-                priorities = set([x.engine.priority for x in condition_columns])
-                for i in priorities:
-                    for column in condition_columns:
-                        if column.engine.priority == i:
-                            column_cell = column.resolve_column_cell_from_obs_cell(
-                                observation, column_value_dict
-                            )
+                Columns are: {[x.label for x in self.columns]} 
+                """
+            )
 
-                            column_value_dict[column.label] = column_cell.value
-                            if column.label not in self.drop:
-                                row_as_dict[column.label] = column_cell
+        # The position of every column kept in the output,
+        # with None for those being dropped.
+        slots: List[Optional[int]] = [
+            None if label in self.drop else 0 for label in labels
+        ]
+        width = 0
+        for i, slot in enumerate(slots):
+            if slot is not None:
+                slots[i] = width
+                width += 1
+
+        # The HorizontalCondition columns need the values of the standard
+        # columns, so they're resolved last, in order of priority.
+        standard_columns = []
+        condition_columns: Dict[int, List[Tuple[Optional[int], BaseColumn]]] = {}
+        for slot, column in zip(slots[1:], self.columns):
+            if isinstance(column.engine, HorizontalCondition):
+                condition_columns.setdefault(column.engine.priority, []).append(
+                    (slot, column)
+                )
+            else:
+                standard_columns.append((slot, column))
+
+        return RowPlan(
+            header_row=[
+                VirtualCell(value=label)
+                for label, slot in zip(labels, slots)
+                if slot is not None
+            ],
+            observation_slot=slots[0],
+            standard_columns=standard_columns,
+            condition_schedule=[
+                condition_columns[priority] for priority in sorted(condition_columns)
+            ],
+        )
+
+    def _resolve_columns(
+        self, observations: List[Cell], plan: RowPlan
+    ) -> List[List[BaseCell]]:
+        """
+        Resolve every column against the provided observations,
+        returning the cells of each output column.
 
-                # Order for output
-                line = []
-                for column_cell in ordered_column_header_cells:
-                    cell_wanted = row_as_dict.get(column_cell.value, None)
-                    if cell_wanted is not None:
-                        line.append(cell_wanted)
+        :param observations: The observation cells to resolve columns for.
+        :param plan: How the rows are assembled.
+        :return: A list of cells per output column, one cell per observation.
+        """
+        # note we ALWAYS want values in the column_value_dicts
+        # regardless of whether we're dropping the column
+        # (these are only needed by the horizontal conditions)
+        if plan.condition_schedule:
+            column_value_dicts: List[Dict[str, str]] = [
+                {self.observations.label: observation.value}
+                for observation in observations
+            ]
+
+        output_columns: List[List[BaseCell]] = [None] * len(plan.header_row)
+
+        if plan.observation_slot is not None:
+            if self.obs_apply is not None:
+                # Observation cells are shared with every other selection
+                # taken from the same table, so never modify them in place.
+                observations = [copy.copy(x) for x in observations]
+                for observation in observations:
+                    observation.value = self.obs_apply(observation.value)
+            output_columns[plan.observation_slot] = observations
+
+        for slot, column in plan.standard_columns:
+            column_cells = column.resolve_column_cells_from_obs_cells(
+                observations, broadcast=self.broadcast
+            )
+            if plan.condition_schedule:
+                for column_value_dict, column_cell in zip(
+                    column_value_dicts, column_cells
+                ):
+                    column_value_dict[column.label] = column_cell.value
+            if slot is not None:
+                output_columns[slot] = column_cells
 
-                grid.append(line)
+        for condition_columns in plan.condition_schedule:
+            for slot, column in condition_columns:
+                column_cells = column.resolve_column_cells_from_obs_cells(
+                    observations, column_value_dicts
+                )
+                for column_value_dict, column_cell in zip(
+                    column_value_dicts, column_cells
+                ):
+                    column_value_dict[column.label] = column_cell.value
+                if slot is not None:
+                    output_columns[slot] = column_cells
 
-            self._data = grid
+        return output_columns
 
     def to_csv(
         self,
         path: Union[str, Path],
         write_headers=True,
         write_mode="w",
+        keep: bool = False,
+        drop_duplicates: bool = False,
+        keys: Optional[List[str]] = None,
         **kwargs,
     ):
         """
@@ -404,15 +710,93 @@ class TidyData(BaseOutput):
         through to the csv.csvwriter() constructor.
         https://docs.python.org/3/library/csv.html
 
+        Rows are written as they are resolved, so unless the
+        TidyData has already been transformed (or keep is used)
+        the tidy data is never held in memory as a whole.
+
         :param path: The location we want to output the
         csv to.
         :param write_headers: Whether or not to include the
         headers when writing to csv.
         :param write_mode: The mode with which to open
         the python file object. Defaults to "w".
+        :param keep: Keep the resolved tidy data, so later
+        outputs do not need to resolve it again.
+        :param drop_duplicates: Skip rows with the same values as an
+        earlier row as they are written, see iter_rows().
+        :param keys: The labels of the columns to compare when skipping
+        duplicate rows, where not provided every column is compared.
         """
-        self._transform()
+        path = TidyData._output_path(path)
+
+        if keep:
+            self._transform()
+
+        if drop_duplicates:
+            rows = (
+                [x.value for x in row] for row in self.iter_rows(unique=True, keys=keys)
+            )
+        else:
+            rows = self._value_rows()
+
+        with open(path, write_mode) as csvfile:
+            tidywriter = csv.writer(csvfile, **kwargs)
+            for i, row in enumerate(rows):
+                if i == 0 and not write_headers:
+                    continue
+                tidywriter.writerow(row)
+
+    @staticmethod
+    def write_many(
+        path: Union[str, Path],
+        tidy_data_objects: List[TidyData],
+        write_headers=True,
+        write_mode="w",
+        **kwargs,
+    ):
+        """
+        Output many TidyData objects, with the same headers, to
+        a single csv file.
+
+        Each TidyData is written as it is resolved, one after the
+        other, without being kept or joined together first.
 
+        :param path: The location we want to output the
+        csv to.
+        :param tidy_data_objects: The TidyData objects to write, in order.
+        :param write_headers: Whether or not to include the
+        headers when writing to csv.
+        :param write_mode: The mode with which to open
+        the python file object. Defaults to "w".
+        """
+        path = TidyData._output_path(path)
+
+        # The headers are known without resolving anything,
+        # so check them all before writing anything.
+        TidyData._check_headers_align(
+            [
+                x._data[0] if x._data else x._compile_plan().header_row
+                for x in tidy_data_objects
+            ]
+        )
+
+        with open(path, write_mode) as csvfile:
+            tidywriter = csv.writer(csvfile, **kwargs)
+            for i, tidy_data in enumerate(tidy_data_objects):
+                rows = tidy_data._value_rows()
+                header_row = next(rows)
+                if i == 0 and write_headers:
+                    tidywriter.writerow(header_row)
+                tidywriter.writerows(rows)
+
+    @staticmethod
+    def _output_path(path: Union[str, Path]) -> Path:
+        """
+        Confirm a location can be written to, as a Path.
+
+        :param path: The location we want to output to.
+        :return: The location as a pathlib.Path
+        """
         if not isinstance(path, (Path, str)):
             raise ValueError(
                 "To output to a file you must provide a pathlib.Path object or a str"
@@ -425,46 +809,55 @@ class TidyData(BaseOutput):
             raise FileNotFoundError(
                 f'The specified output directory "{path.parent.absolute()}" for the file "{path.name}" does not exist.'
             )
-
-        with open(path, write_mode) as csvfile:
-            tidywriter = csv.writer(csvfile, **kwargs)
-            for i, row in enumerate(self._data_as_table_of_strings()):
-                if i == 0 and not write_headers:
-                    continue
-                tidywriter.writerow(row)
+        return path
 
     def drop_duplicates(
         self,
         print_duplicates: bool = False,
         csv_duplicate_path: Union[str, Path] = None,
+        keys: Optional[List[str]] = None,
     ):
         """
         Drop duplicates from our tidydata.
 
+        Rows are duplicates where they have the same values, found by
+        hashing the tuple of the values of each row, so the first of
+        each set of duplicate rows is kept.
+
         :param print_duplicates: Do we want a human friendly report showing
         each duplicate row that has been dropped.
         :param csv_duplicate_path: Path to output a csv containing each duplicate
         row.
+        :param keys: The labels of the columns to compare, where not provided
+        every column is compared.
         """
         self._transform()
-        unique = []
-
-        non_unique = []
-        lines = [
-            "Removed duplicate instances of the following row(s):",
-            "-----------------------------------------------------",
-        ]
-
-        for row in self._data:
-            if row not in unique:
-                unique.append(row)
-            else:
-                if print_duplicates:  # pragma: no cover
-                    lines.append(",".join([x.value for x in row]))
-                if csv_duplicate_path:
-                    non_unique.append([x.value for x in row])
+        positions = self._key_positions(self._data[0], keys)
+
+        if isinstance(self._data, ColumnarData):
+            duplicates = [
+                self._data.decode(x) for x in self._data.drop_duplicates(positions)
+            ]
+            unique = self._data
+        else:
+            seen = set()
+            unique = [self._data[0]]
+            duplicates = []
+            for row in self._data[1:]:
+                key = tuple(row[i].value for i in positions)
+                if key in seen:
+                    duplicates.append(row)
+                else:
+                    seen.add(key)
+                    unique.append(row)
 
         if print_duplicates:  # pragma: no cover
+            lines = [
+                "Removed duplicate instances of the following row(s):",
+                "-----------------------------------------------------",
+            ]
+            for row in duplicates:
+                lines.append(",".join([x.value for x in row]))
             for line in lines:
                 print(line)
 
@@ -474,8 +867,38 @@ class TidyData(BaseOutput):
 
             with open(csv_duplicate_path, "w") as csvfile:
                 duplicates_writer = csv.writer(csvfile)
-                for row in non_unique:
-                    duplicates_writer.writerow(row)
+                for row in duplicates:
+                    duplicates_writer.writerow([x.value for x in row])
 
         self._data = unique
         return self
+
+    def _key_positions(
+        self, header_row: List[VirtualCell], keys: Optional[List[str]]
+    ) -> List[int]:
+        """
+        The positions of the columns to compare when looking for
+        duplicate rows.
+
+        :param header_row: The header row of the tidy data.
+        :param keys: The labels of the columns to compare, where None
+        every column is compared.
+        :return: A list of column positions.
+        """
+        labels = [x.value for x in header_row]
+        if keys is None:
+            return list(range(len(labels)))
+
+        missing = [x for x in keys if x not in labels]
+        if missing or not keys:
+            raise DuplicateKeyColumnError(
+                f"""
+                You're attempting to drop duplicates by one or more
+                key columns that do not exist in the data.
+
+                Your keys are: {keys}
+
+                Columns are: {labels}
+                """
+            )
+        return [labels.index(x) for x in keys]
@@ -0,0 +1,322 @@
+"""
+Resolving the rows of a TidyData in worker processes.
+
+Cells reference the table they belong to, so pickling a single cell
+pickles the whole table. So neither the observations sent to a worker
+nor the cells it resolves are pickled. Instead each worker is given
+the TidyData once, as it starts, then only the start and stop of each
+band of observations to resolve. The resolved cells are sent back as
+their position in the table where they are cells of the table of the
+observations, or as (position, value) where they are copies with a
+changed value (see Column apply).
+
+Forked workers inherit the TidyData. Otherwise the TidyData is pickled
+once, with every cell of the table of the observations pickled as just
+its position in the table, and without the table itself. Alongside it
+go the position, value and formatting of each of those cells, from which
+each worker rebuilds just the cells the TidyData refers to. Each band is
+then sent as the same data for its observations, so every observation
+is sent to, and rebuilt by, one worker only.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import multiprocessing
+import pickle
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple, Union
+
+from tidychef.models.source.cell import BaseCell, Cell
+from tidychef.models.source.table import Table
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .tidydata import RowPlan, TidyData
+
+# A resolved cell, as sent from a worker process.
+Portable = Union[int, Tuple[int, str], BaseCell]
+
+# A cell of the table of the observations, as sent to a worker process:
+# its position in the table, x, y, value, formatting, whether numeric
+# and original value.
+CellData = Tuple[int, int, int, str, Any, bool, str]
+
+# The persistent id a table is pickled as, see _Packer.
+TABLE_ID = "table"
+
+# The TidyData, plan, table and (where forked) observations of a
+# worker process.
+_tidy_data: TidyData = None
+_plan: RowPlan = None
+_table: Table = None
+_observations: List[Cell] = None
+
+
+def _initialise(tidy_data: TidyData, plan: RowPlan, observations: List[Cell]):
+    """
+    Hold what a forked worker process needs to resolve bands of
+    observations.
+
+    :param tidy_data: The TidyData being resolved.
+    :param plan: How the rows are assembled.
+    :param observations: Every observation cell, in order.
+    """
+    global _tidy_data, _plan, _table, _observations
+    _tidy_data = tidy_data
+    _plan = plan
+    _table = observations[0]._table
+    _observations = observations
+
+
+class _Packer(pickle.Pickler):
+    """
+    Pickles the cells of a table as their positions in the table,
+    and the table itself as TABLE_ID, recording the cells pickled.
+    """
+
+    def __init__(self, file: io.BytesIO, table: Table):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.table = table
+        self.ids = set()
+
+    def persistent_id(self, obj: Any) -> Optional[Union[int, str]]:
+        if isinstance(obj, Cell):
+            if obj._table is self.table and self.table._by_id[obj._id] is obj:
+                self.ids.add(obj._id)
+                return obj._id
+        elif isinstance(obj, Table) and obj._by_id is self.table._by_id:
+            return TABLE_ID
+        return None
+
+
+class _Unpacker(pickle.Unpickler):
+    """
+    Unpickles what was pickled by _Packer, given the table of
+    the cells it refers to.
+    """
+
+    def __init__(self, file: io.BytesIO, table: Table):
+        super().__init__(file)
+        self.table = table
+
+    def persistent_load(self, pid: Union[int, str]) -> Union[Cell, Table]:
+        if pid == TABLE_ID:
+            return self.table
+        return self.table._by_id[pid]
+
+
+def _cell_data(cells: List[Cell]) -> List[CellData]:
+    """
+    The cells of the table of the observations, as sent to a
+    worker process.
+
+    :param cells: Cells of the table of the observations.
+    """
+    return [
+        (c._id, c.x, c.y, c.value, c.cellformat, c.numeric, c._original_value)
+        for c in cells
+    ]
+
+
+def _rebuild(cell_data: List[CellData], table: Table) -> List[Cell]:
+    """
+    The cells sent to a worker process, as cells of the table of
+    the worker process, reusing any cells the table already has.
+
+    :param cell_data: The cells, as sent to a worker process.
+    :param table: The table of the worker process.
+    """
+    by_id = table._by_id
+    cells = []
+    for cell_id, x, y, value, cellformat, numeric, original in cell_data:
+        cell = by_id.get(cell_id)
+        if cell is None:
+            # Already derived, so skip __post_init__
+            cell = Cell.__new__(Cell)
+            cell.x, cell.y, cell.value, cell.cellformat = x, y, value, cellformat
+            cell.numeric = numeric
+            cell._original_value = original
+            cell._id = cell_id
+            cell._table = table
+            by_id[cell_id] = cell
+        cells.append(cell)
+    return cells
+
+
+def _pack(tidy_data: TidyData, plan: RowPlan, table: Table) -> Tuple[bytes, bytes]:
+    """
+    Pickle what a worker process needs to start, without the table
+    of the observations or the observations themselves.
+
+    :param tidy_data: The TidyData being resolved.
+    :param plan: How the rows are assembled.
+    :param table: The table the observations belong to.
+    :return: The pickled cells the TidyData refers to, then
+    the pickled TidyData and plan.
+    """
+    packed = io.BytesIO()
+    packer = _Packer(packed, table)
+    packer.dump((tidy_data, plan))
+
+    cells = [table._by_id[i] for i in sorted(packer.ids)]
+    cell_data = pickle.dumps(_cell_data(cells), pickle.HIGHEST_PROTOCOL)
+    return cell_data, packed.getvalue()
+
+
+def _initialise_packed(cell_data: bytes, packed: bytes):
+    """
+    Hold what a worker process needs to resolve bands of observations,
+    as pickled by _pack.
+
+    The cells referred to, and later the observations, are rebuilt
+    into a table of just those cells. The table has no coordinate
+    index, as resolving the columns never navigates from one cell
+    to another.
+
+    :param cell_data: The pickled cells the TidyData refers to.
+    :param packed: The pickled TidyData and plan.
+    """
+    global _tidy_data, _plan, _table
+    _table = Table()
+    _table._by_id = {}
+    _rebuild(pickle.loads(cell_data), _table)
+    _tidy_data, _plan = _Unpacker(io.BytesIO(packed), _table).load()
+
+
+def _resolve_band(start: int, stop: int) -> List[Tuple[List[Portable], array]]:
+    """
+    Resolve the output columns of a band of the observations,
+    in a forked worker process.
+
+    :param start: The position of the first observation of the band.
+    :param stop: The position after the last observation of the band.
+    :return: The encoded cells of each output column.
+    """
+    columns = _tidy_data._resolve_columns(_observations[start:stop], _plan)
+    return [_encode(cells, _table) for cells in columns]
+
+
+def _resolve_sent_band(
+    cell_data: List[CellData],
+) -> List[Tuple[List[Portable], array]]:
+    """
+    Resolve the output columns of a band of observations sent
+    to the worker process.
+
+    :param cell_data: The observations of the band, as sent.
+    :return: The encoded cells of each output column.
+    """
+    observations = _rebuild(cell_data, _table)
+    columns = _tidy_data._resolve_columns(observations, _plan)
+    return [_encode(cells, _table) for cells in columns]
+
+
+def _encode(cells: List[BaseCell], table: Table) -> Tuple[List[Portable], array]:
+    """
+    Encode a column of resolved cells as codes into a list
+    of its distinct cells, each in a form cheap to pickle.
+
+    :param cells: The resolved cells of a column.
+    :param table: The table the observations belong to.
+    :return: The distinct cells, encoded, and a code per cell.
+    """
+    by_id = {}
+    entries: List[Portable] = []
+    codes = array("l")
+    for cell in cells:
+        code = by_id.get(id(cell))
+        if code is None:
+            code = by_id[id(cell)] = len(entries)
+            if isinstance(cell, Cell) and cell._table is table:
+                if table._by_id[cell._id] is cell:
+                    entries.append(cell._id)
+                else:
+                    entries.append((cell._id, cell.value))
+            else:
+                entries.append(cell)
+        codes.append(code)
+    return entries, codes
+
+
+def _decode(encoded: Tuple[List[Portable], array], table: Table) -> List[BaseCell]:
+    """
+    Decode a column of cells sent from a worker process.
+
+    :param encoded: The distinct cells, encoded, and a code per cell.
+    :param table: The table the observations belong to.
+    :return: The resolved cells of the column.
+    """
+    entries, codes = encoded
+    cells = []
+    for entry in entries:
+        if isinstance(entry, int):
+            cells.append(table._by_id[entry])
+        elif isinstance(entry, tuple):
+            cell = copy.copy(table._by_id[entry[0]])
+            cell.value = entry[1]
+            cells.append(cell)
+        else:
+            cells.append(entry)
+    return [cells[code] for code in codes]
+
+
+def resolve_in_processes(
+    tidy_data: TidyData,
+    observations: List[Cell],
+    plan: RowPlan,
+    workers: int,
+    band_size: int,
+    start_method: Optional[str] = None,
+) -> Iterator[Tuple[List[Cell], List[List[BaseCell]]]]:
+    """
+    Resolve the output columns of the observations a band at a
+    time, across a pool of worker processes.
+
+    Forked workers inherit the TidyData and observations, each band
+    being sent as just its start and stop. Otherwise the workers are
+    sent the TidyData pickled (see _pack) and each band is sent as the
+    data of its observations, so the TidyData must be picklable, i.e.
+    apply and resolver callables must be functions defined at the top
+    level of a module rather than lambdas.
+
+    :param tidy_data: The TidyData being resolved.
+    :param observations: Every observation cell, in order.
+    :param plan: How the rows are assembled.
+    :param workers: The number of worker processes.
+    :param band_size: The number of observations per band.
+    :param start_method: How the worker processes are started, one
+    of "spawn", "fork" or "forkserver", where not provided the default
+    for the platform.
+    :return: An iterator of each band of observations, in order, with
+    the output columns resolved for it.
+    """
+    context = multiprocessing.get_context(start_method)
+    table = observations[0]._table
+    starts = range(0, len(observations), band_size)
+    stops = [min(start + band_size, len(observations)) for start in starts]
+
+    forked = context.get_start_method() == "fork"
+    if forked:
+        initializer, initargs = _initialise, (tidy_data, plan, observations)
+    else:
+        initializer, initargs = _initialise_packed, _pack(tidy_data, plan, table)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        if forked:
+            bands = executor.map(_resolve_band, starts, stops)
+        else:
+            bands = executor.map(
+                _resolve_sent_band,
+                [_cell_data(observations[a:b]) for a, b in zip(starts, stops)],
+            )
+        for start, stop, encoded_columns in zip(starts, stops, bands):
+            yield observations[start:stop], [
+                _decode(encoded, table) for encoded in encoded_columns
+            ]
@@ -15,6 +15,7 @@ class ContainsString:
     """
 
     substr: str
+    value_only = True
 
     def __call__(self, cell: Cell):
         return self.substr in cell.value
@@ -28,6 +29,7 @@ class NotContainsString:
     """
 
     substr: str
+    value_only = True
 
     def __call__(self, cell: Cell):
         return self.substr not in cell.value
@@ -38,6 +40,8 @@ class IsNumeric:
     The value of the cell is numerical
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell):
         return cell.numeric
 
@@ -50,6 +54,8 @@ class IsNotNumeric:
     The value of the cell is numerical
     """
 
+    value_only = True
+
     def __call__(self, cell: Cell):
         return not cell.numeric
 
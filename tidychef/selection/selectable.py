@@ -20,19 +20,20 @@ from tidychef.exceptions import (
     AmbiguousWaffleError,
     BadExcelReferenceError,
     BadShiftParameterError,
-    CellsDoNotExistError,
     CellValidationError,
     LoneValueOnMultipleCellsError,
     MissingLabelError,
     OutOfBoundsError,
     ReferenceOutsideSelectionError,
+    ReversedExcelRefError,
 )
 from tidychef.lookup.engines.closest import Closest
 from tidychef.lookup.engines.direct import Directly
 from tidychef.lookup.engines.within import Within
 from tidychef.models.source.cell import BaseCell, Cell
 from tidychef.models.source.table import LiveTable
-from tidychef.utils import cellutils
+from tidychef.selection.filters.common import ContainsString
+from tidychef.utils import bitset
 from tidychef.utils.decorators import dontmutate
 
 
@@ -152,38 +153,25 @@ class Selectable(LiveTable):
         current_cells_set = set(self.cells)  # Single conversion for O(1) lookups
         new_cells = []
 
-        # Use neighbor traversal for much faster expansion
+        # For each cell in current selection, step across the coordinate index
+        # of the table in the given direction until we hit a boundary
         if direction in [up, above]:
-            # For each cell in current selection, traverse up until we hit a boundary
-            for cell in self.cells:
-                current = cell._neighbour_up
-                while current is not None and current not in current_cells_set:
-                    new_cells.append(current)
-                    current = current._neighbour_up
-
+            x_step, y_step = 0, -1
         elif direction in [down, below]:
-            # For each cell in current selection, traverse down until we hit a boundary
-            for cell in self.cells:
-                current = cell._neighbour_down
-                while current is not None and current not in current_cells_set:
-                    new_cells.append(current)
-                    current = current._neighbour_down
-
+            x_step, y_step = 0, 1
         elif direction == left:
-            # For each cell in current selection, traverse left until we hit a boundary
-            for cell in self.cells:
-                current = cell._neighbour_left
-                while current is not None and current not in current_cells_set:
-                    new_cells.append(current)
-                    current = current._neighbour_left
-
-        elif direction == right:
-            # For each cell in current selection, traverse right until we hit a boundary
-            for cell in self.cells:
-                current = cell._neighbour_right
-                while current is not None and current not in current_cells_set:
-                    new_cells.append(current)
-                    current = current._neighbour_right
+            x_step, y_step = -1, 0
+        else:
+            x_step, y_step = 1, 0
+
+        cell_at = self.filtered.cell_at
+        for cell in self.cells:
+            x, y = cell.x + x_step, cell.y + y_step
+            current = cell_at(x, y)
+            while current is not None and current not in current_cells_set:
+                new_cells.append(current)
+                x, y = x + x_step, y + y_step
+                current = cell_at(x, y)
 
         # Remove duplicates and cells that are already in current selection
         current_cells_set = set(self.cells)  # We already have this from above
@@ -195,7 +183,7 @@ class Selectable(LiveTable):
                 unique_new_cells.append(cell)
 
         # Extend current selection with new cells
-        self.cells.extend(unique_new_cells)
+        self.cells = self.cells + unique_new_cells
         return self
 
     @dontmutate
@@ -260,35 +248,13 @@ class Selectable(LiveTable):
         else:
             raise BadShiftParameterError(msg)
 
-        # For multi-step moves, break them down into single-step recursive calls
-        if abs(x_offset) > 1 or abs(y_offset) > 1:
-            # Break down into single steps and apply recursively
-            if x_offset != 0:
-                x_step = 1 if x_offset > 0 else -1
-                self = self.shift(x_step, 0)
-                return self.shift(x_offset - x_step, y_offset)
-            else:  # y_offset != 0
-                y_step = 1 if y_offset > 0 else -1
-                self = self.shift(0, y_step)
-                return self.shift(x_offset, y_offset - y_step)
-        
-        # Handle single-step shifts using neighbor traversal (much faster than coordinate lookup)
+        # Translate the whole selection in one pass, whatever the distance,
+        # by resolving each offset coordinate against the table index.
+        cell_at = self.filtered.cell_at
         found_cells = []
-        
         for cell in self.cells:
-            shifted_cell = None
-            
-            # Handle single direction shifts efficiently
-            if x_offset == 1 and y_offset == 0:  # right
-                shifted_cell = cell._neighbour_right
-            elif x_offset == -1 and y_offset == 0:  # left
-                shifted_cell = cell._neighbour_left
-            elif x_offset == 0 and y_offset == 1:  # down
-                shifted_cell = cell._neighbour_down
-            elif x_offset == 0 and y_offset == -1:  # up
-                shifted_cell = cell._neighbour_up
-            
-            if shifted_cell:
+            shifted_cell = cell_at(cell.x + x_offset, cell.y + y_offset)
+            if shifted_cell is not None:
                 found_cells.append(shifted_cell)
 
         if len(found_cells) == 0 and len(self.cells) > 0:
@@ -323,6 +289,13 @@ class Selectable(LiveTable):
                 at any given time with <selection>.print_excel_refs()
                 """
 
+        # Every branch resolves the wanted cells from the coordinate index of
+        # the table, then checks them against the current selection as
+        # bitsets of cell ids, so cost is in proportion to the size of the
+        # reference rather than the size of the table.
+        table = self.filtered
+        selected_mask = table.mask
+
         # Multi excel reference:
         # eg: 'B2:F5'
         if re.match("^[A-Z]+[0-9]+:[A-Z]+[0-9]+$", excel_ref):
@@ -337,37 +310,41 @@ class Selectable(LiveTable):
                 assert cell2.x <= self.maximum_pristine_x
                 assert cell2.y >= self.minimum_pristine_y
                 assert cell2.y <= self.maximum_pristine_y
-                wanted: List[BaseCell] = dfc.multi_excel_ref_to_basecells(excel_ref)
-                selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
-            except CellsDoNotExistError:
-                raise ReferenceOutsideSelectionError(msg)
             except AssertionError:
                 raise ReferenceOutsideSelectionError(msg)
+            if cell1.x > cell2.x or cell1.y > cell2.y:
+                raise ReversedExcelRefError(
+                    """
+            Invalid excel reference format. Please provide your reference in the
+            standard upmost left to downmost right format, i.e A1:C5 not C5:A1
+                """
+                )
+            selected = table.cells_in_rectangle(cell1.x, cell1.y, cell2.x, cell2.y)
+            area = (cell2.x - cell1.x + 1) * (cell2.y - cell1.y + 1)
+            if len(selected) != area or not self._all_selected(selected, selected_mask):
+                raise ReferenceOutsideSelectionError(msg)
 
         # Single column and row reference
         # eg: 'F19'
         elif re.match("^[A-Z]+[0-9]+$", excel_ref):
             wanted: BaseCell = dfc.single_excel_ref_to_basecell(excel_ref)
-            wanted = [wanted]
-            try:
-                selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
-            except CellsDoNotExistError:
+            cell = table.cell_at(wanted.x, wanted.y)
+            if cell is None or not self._all_selected([cell], selected_mask):
                 raise ReferenceOutsideSelectionError(msg)
+            selected = [cell]
 
         # An excel reference that is a single row number
         # eg: '4'
         elif re.match("^[0-9]+$", excel_ref):
             wanted_y_index: int = dfc.single_excel_row_to_y_index(excel_ref)
-
-            wanted = [c for c in self.pcells if c.y == wanted_y_index]
             try:
                 assert wanted_y_index <= self.maximum_pristine_y
                 assert wanted_y_index >= self.minimum_pristine_y
-                selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
-            except CellsDoNotExistError:
-                raise ReferenceOutsideSelectionError(msg)
             except AssertionError:
                 raise ReferenceOutsideSelectionError(msg)
+            selected = table.cells_on_row(wanted_y_index)
+            if not self._all_selected(selected, selected_mask):
+                raise ReferenceOutsideSelectionError(msg)
 
         # An excel reference that is a multiple row numbers
         # eg: '4:6'
@@ -383,34 +360,26 @@ class Selectable(LiveTable):
             try:
                 assert end_y_index <= self.maximum_pristine_y
                 assert start_y_index >= self.minimum_pristine_y
-                wanted = [
-                    c
-                    for c in self.pcells
-                    if c.y >= start_y_index and c.y <= end_y_index
-                ]
-                selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
-            except CellsDoNotExistError:
-                raise ReferenceOutsideSelectionError(msg)
             except AssertionError:
                 raise ReferenceOutsideSelectionError(msg)
+            selected = table.cells_in_rectangle(
+                table.grid.min_x, start_y_index, table.grid.max_x, end_y_index
+            )
+            if not self._all_selected(selected, selected_mask):
+                raise ReferenceOutsideSelectionError(msg)
 
         # An excel reference that is one column letter
         # eg: 'H'
         elif re.match("^[A-Z]+$", excel_ref):
-            # We've indexed which cells make up a column as we can just return directly
             wanted_x_index: int = dfc.single_excel_column_to_x_index(excel_ref)
-            wanted_column_letters = cellutils.x_to_letters(wanted_x_index)
-
-            # They're asking for a column that doesn't exist
-            if wanted_column_letters not in self._column_index:
-                raise ReferenceOutsideSelectionError(msg)
+            wanted_mask = bitset.from_ids(table.grid.column(wanted_x_index))
 
-            # They're asking for a column that doesn't exist in the current selection
-            if wanted_x_index not in set(c.x for c in self.cells):
+            # They're asking for a column that doesn't exist, or that doesn't
+            # exist in the current selection
+            selected_in_column = wanted_mask & selected_mask
+            if not selected_in_column:
                 raise ReferenceOutsideSelectionError(msg)
-
-            wanted = set(self._column_index[wanted_column_letters])
-            selected = [c for c in self.cells if c in wanted]
+            selected = None
 
         # An excel reference that is a range of column letters
         # eg: 'H:J'
@@ -423,40 +392,74 @@ class Selectable(LiveTable):
                 raise BadExcelReferenceError(
                     f'Excel ref "{excel_ref}" is invalid. {right_letters} much be higher than {left_letters}'
                 )
-            wanted = []
+            selected_in_column = 0
             for x_offset in range(start_x_index, end_x_index + 1):
-                letter = cellutils.x_to_letters(x_offset)
-
-                # They're specifying a column that doesn't exist
-                if letter not in self._column_index:
-                    raise ReferenceOutsideSelectionError(msg)
+                column_mask = bitset.from_ids(table.grid.column(x_offset))
 
-                # They're specifying a column that doesn't exist in the current selection
-                if x_offset not in set(c.x for c in self.cells):
+                # They're specifying a column that doesn't exist, or that
+                # doesn't exist in the current selection
+                if not column_mask & selected_mask:
                     raise ReferenceOutsideSelectionError(msg)
 
-                wanted += self._column_index[letter]
-            selected = [c for c in self.cells if c in wanted]
+                selected_in_column |= column_mask & selected_mask
+            selected = None
 
         # Unknown excel reference
         else:
             raise BadExcelReferenceError(f"Unrecognised excel reference: {excel_ref}")
 
-        self.cells = selected
+        # Keep the order the cells are currently selected in
+        if selected is None:
+            table.reselect(selected_in_column)
+        elif len(selected) == 1:
+            self.cells = selected
+        else:
+            table.reselect(bitset.from_ids(c._id for c in selected))
         return self
 
-    def validate(self, validator: BaseValidator, raise_first_error: bool = False):
+    @staticmethod
+    def _all_selected(cells: List[Cell], selected_mask: int) -> bool:
+        """
+        Are all of the provided cells present in the bitset of
+        currently selected cell ids.
+
+        :param cells: The cells to check for.
+        :param selected_mask: A bitset of selected cell ids.
+        """
+        # Testing a bit copies the whole bitset, so only test bit by bit
+        # for a few cells, sparing a bitset as wide as the highest cell id.
+        if len(cells) <= 64:
+            return all(selected_mask >> c._id & 1 for c in cells)
+        wanted_mask = bitset.from_ids(c._id for c in cells)
+        return wanted_mask & ~selected_mask == 0
+
+    def validate(
+        self,
+        validator: BaseValidator,
+        raise_first_error: bool = False,
+        by_value: Optional[bool] = None,
+    ):
         """
         Validates current cell selection by passing each currently
         selected cell to the provided validator.
 
         Pass raise_first_error=True if you just want the first
         invalid value message.
+
+        :param validator: The validator to check each cell with.
+        :param raise_first_error: Raise on the first invalid cell.
+        :param by_value: Validate once per distinct cell value rather
+        than once per cell. Defaults to the value_only attribute of the
+        validator.
         """
 
+        if by_value is None:
+            by_value = getattr(validator, "value_only", False)
+        is_valid = self._once_per_value(validator) if by_value else validator
+
         validation_errors = []
         for cell in self.cells:
-            if not validator(cell):
+            if not is_valid(cell):
                 if raise_first_error:
                     raise CellValidationError(
                         f"""
@@ -480,14 +483,27 @@ following validation errors were encountered:
         return self
 
     @dontmutate
-    def filter(self, check: Callable):
+    def filter(self, check: Callable, by_value: Optional[bool] = None):
         """
         Selects just the cells that match the provided check
 
         : param check: a function, lambda or callable class that
         returns a bool when given a single cell as a parameter.
+        : param by_value: Call the check once per distinct cell value
+        rather than once per cell, so only for checks that read nothing
+        but the cell value. Defaults to the value_only attribute of the
+        check where it has one.
         """
 
+        if isinstance(check, ContainsString):
+            self.filtered.reselect(self._selected_containing(check.substr))
+            return self
+
+        if by_value is None:
+            by_value = getattr(check, "value_only", False)
+        if by_value:
+            check = self._once_per_value(check)
+
         self.cells = list(filter(check, self.cells))
         return self
 
@@ -500,9 +516,33 @@ following validation errors were encountered:
         """
 
         matcher = re.compile(pattern)
-        self.cells = [x for x in self.cells if matcher.match(str(x.value)) is not None]
+        matches = self._once_per_value(
+            lambda cell: matcher.match(str(cell.value)) is not None
+        )
+        self.cells = [x for x in self.cells if matches(x)]
         return self
 
+    @staticmethod
+    def _once_per_value(check: Callable) -> Callable:
+        """
+        Wraps a check that reads nothing but the value of a cell so
+        it is called once per distinct value, with the result for
+        that value reused for every other cell holding it.
+
+        :param check: a function, lambda or callable class that
+        returns a bool when given a single cell as a parameter.
+        """
+        results = {}
+
+        def checked(cell: Cell) -> bool:
+            try:
+                return results[cell.value]
+            except KeyError:
+                result = results[cell.value] = check(cell)
+                return result
+
+        return checked
+
     @dontmutate
     def waffle(self, direction: Direction, additional_selection: Selectable):
         """
@@ -549,13 +589,12 @@ following validation errors were encountered:
                         "left of your initial selections."
                     )
 
-        # Use neighbor traversal for much faster waffle intersection
+        # Resolve each intersection directly from the coordinate index of the table
         result_cells = []
         seen_coordinates = set()  # Track coordinates to avoid duplicates during collection
         
         if direction.is_vertical:
             # For vertical waffle: x from current selection, y from additional selection
-            # Use neighbor traversal to find cells at intersection coordinates
             additional_y_coords = {cell.y for cell in additional_selection.cells}
             
             for current_cell in self.cells:
@@ -563,14 +602,12 @@ following validation errors were encountered:
                 for target_y in additional_y_coords:
                     target_coord = (current_cell.x, target_y)
                     if target_coord not in seen_coordinates:
-                        # Navigate to the target y coordinate using neighbor traversal
-                        found_cell = self._navigate_to_coordinate(current_cell, current_cell.x, target_y)
+                        found_cell = self.filtered.cell_at(current_cell.x, target_y)
                         if found_cell:
                             result_cells.append(found_cell)
                             seen_coordinates.add(target_coord)
         else:
-            # For horizontal waffle: x from additional selection, y from current selection  
-            # Use neighbor traversal to find cells at intersection coordinates
+            # For horizontal waffle: x from additional selection, y from current selection
             additional_x_coords = {cell.x for cell in additional_selection.cells}
             
             for current_cell in self.cells:
@@ -578,8 +615,7 @@ following validation errors were encountered:
                 for target_x in additional_x_coords:
                     target_coord = (target_x, current_cell.y)
                     if target_coord not in seen_coordinates:
-                        # Navigate to the target x coordinate using neighbor traversal
-                        found_cell = self._navigate_to_coordinate(current_cell, target_x, current_cell.y)
+                        found_cell = self.filtered.cell_at(target_x, current_cell.y)
                         if found_cell:
                             result_cells.append(found_cell)
                             seen_coordinates.add(target_coord)
@@ -589,34 +625,11 @@ following validation errors were encountered:
 
     def _navigate_to_coordinate(self, start_cell, target_x, target_y):
         """
-        Helper method to navigate from start_cell to target coordinates using neighbor traversal.
+        Helper method to get the cell at the target coordinates, as resolved from
+        the coordinate index of the table start_cell belongs to.
         Returns the cell at (target_x, target_y) if it exists, None otherwise.
         """
-        current = start_cell
-        
-        # Navigate horizontally first
-        while current.x != target_x:
-            if current.x < target_x:
-                if current._neighbour_right is None:
-                    return None  # Can't reach target
-                current = current._neighbour_right
-            else:
-                if current._neighbour_left is None:
-                    return None  # Can't reach target
-                current = current._neighbour_left
-        
-        # Now navigate vertically  
-        while current.y != target_y:
-            if current.y < target_y:
-                if current._neighbour_down is None:
-                    return None  # Can't reach target
-                current = current._neighbour_down
-            else:
-                if current._neighbour_up is None:
-                    return None  # Can't reach target
-                current = current._neighbour_up
-                
-        return current
+        return start_cell._table.cell_at(target_x, target_y)
 
     @dontmutate
     def extrude(self, direction: Direction):
@@ -647,71 +660,62 @@ following validation errors were encountered:
         current_cells_set = set(self.cells)  # For fast duplicate checking
         seen_additional = set()  # Track additional cells to avoid duplicates during collection
 
-        # Use neighbor traversal for much faster extrusion
+        if direction.is_right:
+            steps, description = direction.x, "to the right"
+        elif direction.is_left:
+            # For left direction, direction.x is negative, so we take abs()
+            steps, description = abs(direction.x), "to the left"
+        elif direction.is_downwards:
+            steps, description = direction.y, "downwards"
+        else:
+            # For up direction, direction.y is negative, so we take abs()
+            steps, description = abs(direction.y), "upwards"
+
+        # Each cell extrudes into the line of cells running away from it, which
+        # we take as a single slice of the table index rather than stepping to
+        # each cell in turn.
+        table = self.filtered
         for cell in self.cells:
-            current = cell
-            
-            # Traverse in the specified direction, collecting ALL cells up to the specified distance
             if direction.is_right:
-                for step in range(direction.x):
-                    current = current._neighbour_right
-                    if current is None:
-                        # Hit table boundary before completing the full extrusion - this is out of bounds
-                        raise OutOfBoundsError(
-                            f"You are attempting to extrude your selection beyond the boundary of the table. "
-                            f"Cell {cell._excel_ref()} cannot be extruded {direction.x} steps to the right "
-                            f"(stopped at step {step + 1})."
-                        )
-                    if current not in current_cells_set and current not in seen_additional:
-                        additional_cells.append(current)
-                        seen_additional.add(current)
-                        
+                extruded = table.cells_in_rectangle(
+                    cell.x + 1, cell.y, cell.x + steps, cell.y
+                )
             elif direction.is_left:
-                # For left direction, direction.x is negative, so we take abs()
-                for step in range(abs(direction.x)):
-                    current = current._neighbour_left
-                    if current is None:
-                        # Hit table boundary before completing the full extrusion - this is out of bounds
-                        raise OutOfBoundsError(
-                            f"You are attempting to extrude your selection beyond the boundary of the table. "
-                            f"Cell {cell._excel_ref()} cannot be extruded {abs(direction.x)} steps to the left "
-                            f"(stopped at step {step + 1})."
-                        )
-                    if current not in current_cells_set and current not in seen_additional:
-                        additional_cells.append(current)
-                        seen_additional.add(current)
-                        
+                extruded = table.cells_in_rectangle(
+                    cell.x - steps, cell.y, cell.x - 1, cell.y
+                )[::-1]
             elif direction.is_downwards:
-                for step in range(direction.y):
-                    current = current._neighbour_down
-                    if current is None:
-                        # Hit table boundary before completing the full extrusion - this is out of bounds
-                        raise OutOfBoundsError(
-                            f"You are attempting to extrude your selection beyond the boundary of the table. "
-                            f"Cell {cell._excel_ref()} cannot be extruded {direction.y} steps downwards "
-                            f"(stopped at step {step + 1})."
-                        )
-                    if current not in current_cells_set and current not in seen_additional:
-                        additional_cells.append(current)
-                        seen_additional.add(current)
-                        
-            elif direction.is_upwards:
-                # For up direction, direction.y is negative, so we take abs()
-                for step in range(abs(direction.y)):
-                    current = current._neighbour_up
-                    if current is None:
-                        # Hit table boundary before completing the full extrusion - this is out of bounds
-                        raise OutOfBoundsError(
-                            f"You are attempting to extrude your selection beyond the boundary of the table. "
-                            f"Cell {cell._excel_ref()} cannot be extruded {abs(direction.y)} steps upwards "
-                            f"(stopped at step {step + 1})."
-                        )
-                    if current not in current_cells_set and current not in seen_additional:
-                        additional_cells.append(current)
-                        seen_additional.add(current)
+                extruded = table.cells_in_rectangle(
+                    cell.x, cell.y + 1, cell.x, cell.y + steps
+                )
+            else:
+                extruded = table.cells_in_rectangle(
+                    cell.x, cell.y - steps, cell.x, cell.y - 1
+                )[::-1]
+
+            if len(extruded) != steps:
+                # Hit table boundary before completing the full extrusion - this is out of bounds
+                stopped_at = next(
+                    (
+                        i + 1
+                        for i, c in enumerate(extruded)
+                        if abs(c.x - cell.x) + abs(c.y - cell.y) != i + 1
+                    ),
+                    len(extruded) + 1,
+                )
+                raise OutOfBoundsError(
+                    f"You are attempting to extrude your selection beyond the boundary of the table. "
+                    f"Cell {cell._excel_ref()} cannot be extruded {steps} steps {description} "
+                    f"(stopped at step {stopped_at})."
+                )
+
+            for current in extruded:
+                if current not in current_cells_set and current not in seen_additional:
+                    additional_cells.append(current)
+                    seen_additional.add(current)
 
         # Add new cells to current selection (no dedup needed since we prevented duplicates above)
-        self.cells.extend(additional_cells)
+        self.cells = self.cells + additional_cells
         return self
 
     def attach_directly(self, direction: Direction) -> Directly:
@@ -804,7 +808,7 @@ following validation errors were encountered:
         Specifies a selection of cells from the current selection that are
         all on the specfied row.
         """
-        return self.excel_ref(row_number)
+        return self.excel_ref(str(row_number))
 
     @dontmutate
     def row_containing_strings(self, row_strings: List[str], strict=True):
@@ -817,27 +821,25 @@ following validation errors were encountered:
             row_strings, list
         ), "You must provide a list of strings to row_containing_strings"
 
-        found_cells = []
-        for y_index in dfc.all_used_y_indicies(self.cells):
-            row_cells = dfc.cells_on_y_index(self.cells, y_index)
-            found_count = 0
-            for wanted in row_strings:
-                if strict:
-                    # If strict, wanted must be exactly equal to the cell value
-                    row_values = {cell.value for cell in row_cells}  # Use set for O(1) lookup
-                    if wanted in row_values:
-                        found_count += 1
-                else:
-                    # If not strict a substring match is fine
-                    for cell in row_cells:
-                        if wanted in cell.value:
-                            found_count += 1
-                            break
-            if found_count == len(row_strings):
-                # If we found at least one instance of everying on this row, add it to the selection
-                found_cells += row_cells
+        if not row_strings:
+            self.assert_single_row()
+            return self
 
-        self.cells = found_cells
+        # If strict, wanted must be exactly equal to the cell value,
+        # if not strict a substring match is fine
+        selected_matching = (
+            self._selected_with_value if strict else self._selected_containing
+        )
+
+        # Go straight to the rows holding each wanted string
+        table = self.filtered
+        rows = None
+        for wanted in row_strings:
+            wanted_rows = {c.y for c in table.cells_from_mask(selected_matching(wanted))}
+            rows = wanted_rows if rows is None else rows & wanted_rows
+
+        found_mask = bitset.from_ids(i for y in rows for i in table.grid.row(y))
+        table.reselect(found_mask)
         self.assert_single_row()
 
         return self
@@ -857,19 +859,21 @@ following validation errors were encountered:
         all in the same column - but - only where there's at least one cell
         in that column containing each of the strings in the provided list.
         """
-        found_cells = []
-        for x_index in dfc.all_used_x_indicies(self.cells):
-            column_cells = dfc.cells_on_x_index(self.cells, x_index)
-            column_values = {cell.value for cell in column_cells}  # Use set for O(1) lookup
-            found_count = 0
-            for wanted in column_strings:
-                if wanted in column_values:
-                    found_count += 1
-            if found_count == len(column_strings):
-                # If we found all the strings in this column, add it to the selection
-                found_cells += column_cells
-
-        self.cells = found_cells
+        if not column_strings:
+            self.assert_single_column()
+            return self
+
+        # Go straight to the columns holding each wanted value
+        table = self.filtered
+        columns = None
+        for wanted in column_strings:
+            wanted_columns = {
+                c.x for c in table.cells_from_mask(self._selected_with_value(wanted))
+            }
+            columns = wanted_columns if columns is None else columns & wanted_columns
+
+        found_mask = bitset.from_ids(i for x in columns for i in table.grid.column(x))
+        table.reselect(found_mask)
         self.assert_single_column()
 
         return self
@@ -916,10 +920,9 @@ following validation errors were encountered:
         Filters the selection to precisely one cell containing or equal to the provided string.
         """
         if strict:
-            found_cells = [x for x in self.cells if string == x.value]
+            self.filtered.reselect(self._selected_with_value(string))
         else:
-            found_cells = [x for x in self.cells if string in x.value]
-        self.cells = found_cells
+            self.filtered.reselect(self._selected_containing(string))
         self.assert_one()
         return self
 
@@ -929,8 +932,32 @@ following validation errors were encountered:
         Filters the selection to those cells that contain or are equal to the provided strings.
         """
         if strict:
-            found_cells = [x for x in self.cells if x.value == string]
+            self.filtered.reselect(self._selected_with_value(string))
         else:
-            found_cells = [x for x in self.cells if string in x.value]
-        self.cells = found_cells
+            self.filtered.reselect(self._selected_containing(string))
         return self
+
+    def _selected_with_value(self, value: str) -> int:
+        """
+        A bitset of the currently selected cells whose value is exactly
+        the value provided.
+
+        This is resolved via the value index of the table, which is built
+        once then shared by every selection taken from the table, rather
+        than by checking the value of every selected cell.
+
+        :param value: The cell value wanted.
+        """
+        table = self.filtered
+        return bitset.from_ids(table.ids_with_value(value)) & table.mask
+
+    def _selected_containing(self, substr: str) -> int:
+        """
+        A bitset of the currently selected cells whose value contains
+        the substring provided, resolved via the trigram index of the
+        table.
+
+        :param substr: The substring wanted.
+        """
+        table = self.filtered
+        return bitset.from_ids(table.ids_containing(substr)) & table.mask
@@ -1,3 +1,3 @@
-from . import cellutils, fileutils, http
+from . import bitset, cellutils, fileutils, http
 
-__all__ = ["cellutils", "fileutils", "http"]
+__all__ = ["bitset", "cellutils", "fileutils", "http"]
@@ -0,0 +1,7 @@
+from .bitset import count, from_ids, to_ids
+
+__all__ = [
+    "count",
+    "from_ids",
+    "to_ids",
+]
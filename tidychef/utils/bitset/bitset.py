@@ -0,0 +1,59 @@
+"""
+Helpers for working with a bitset, a python int where bit n
+being set means the item with id n is present in the set.
+
+Python ints are arbitrary precision and their bitwise operators
+run in C over whole machine words, so union (|), intersection (&),
+difference (& ~) and symmetric difference (^) of two bitsets all
+cost O(n/64) regardless of how many items are present.
+"""
+
+from typing import Iterable, Iterator
+
+# For every possible byte value, the positions of the bits set within it
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+
+
+def from_ids(ids: Iterable[int], size: int = 0) -> int:
+    """
+    Create a bitset from an iterable of integer ids.
+
+    :param ids: The ids to set.
+    :param size: Optional hint as to the largest id plus one, used to
+    preallocate the underlying buffer.
+    :return: A bitset with a bit set for each id.
+    """
+    buffer = bytearray((size + 7) >> 3)
+    for i in ids:
+        byte_index = i >> 3
+        if byte_index >= len(buffer):
+            buffer.extend(bytes(byte_index - len(buffer) + 1))
+        buffer[byte_index] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def to_ids(bitset: int) -> Iterator[int]:
+    """
+    Yield the id of every bit set in a bitset, lowest id first.
+
+    :param bitset: The bitset to expand.
+    :return: An iterator of integer ids.
+    """
+    data = bitset.to_bytes((bitset.bit_length() + 7) >> 3, "little")
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index << 3
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def count(bitset: int) -> int:
+    """
+    The number of bits set in a bitset.
+
+    :param bitset: The bitset to count.
+    :return: The population count.
+    """
+    return bin(bitset).count("1")
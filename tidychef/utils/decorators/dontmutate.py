@@ -18,8 +18,9 @@ def dontmutate(method):
     as their lefthand assignations.
 
     This optimized version uses shallow copy for most attributes
-    and only deep copies the cells list and filtered table data,
-    while preserving references to expensive indices.
+    and only copies the filtered table (which in turn copies just
+    the list holding its cells, see Table.__copy__), while preserving
+    references to expensive indices.
     """
 
     @wraps(method)
@@ -27,20 +28,11 @@ def dontmutate(method):
         # Since self is always a Selectable, we can optimize specifically for it
         new_self = copy.copy(self)
 
-        # Only copy the cells list (shallow copy - just the list, not the cell objects)
-        # Everything else can be shared since indices are read-only
-        if hasattr(self, "cells") and self.cells is not None:
-            new_self.cells = self.cells.copy()
-
-        # If there's a filtered table, copy its cells list too
-        if (
-            hasattr(self, "filtered")
-            and self.filtered is not None
-            and hasattr(self.filtered, "cells")
-        ):
-            if self.filtered.cells is not None:
-                new_self.filtered = copy.copy(self.filtered)
-                new_self.filtered.cells = self.filtered.cells.copy()
+        # Only copy the filtered table. Everything else can be shared since
+        # indices are read-only, as are the cell objects and any bitset of
+        # the selected cells.
+        if getattr(self, "filtered", None) is not None:
+            new_self.filtered = copy.copy(self.filtered)
 
         return method(new_self, *args, **kwargs)
 